@@ -0,0 +1,74 @@
+"""Fixtures for the planets benchmark suite.
+
+Run with ``make bench`` (compare against the stored baseline) or ``make bench-save``
+(store a new baseline in benchmarks/baselines).
+"""
+
+import pytest
+
+from planets import pck_parser, synthetic
+
+# Size of pck00011.tpc, the reference the synthetic kernels are scaled against
+REFERENCE_KERNEL_SIZE = 130_000
+
+# Layout of the synthetic kernels, close to the generic NAIF PCK
+KERNEL_OPTIONS = {"array_length": 12, "continuation_fraction": 0.1, "comment_lines": 20}
+
+
+def write_scaled_kernel(path, scale, **options):
+    """Write a synthetic kernel roughly `scale` times the size of pck00011.tpc."""
+    options = dict(KERNEL_OPTIONS, **options)
+    n_keys = synthetic.n_keys_for_size(scale * REFERENCE_KERNEL_SIZE, **options)
+    synthetic.write_kernel(path, n_keys=n_keys, **options)
+    return path
+
+
+@pytest.fixture(scope="session", params=[1, 10, 100], ids=lambda scale: f"{scale}x")
+def synthetic_kernel(request, tmp_path_factory):
+    """Synthetic kernels at 1x, 10x and 100x the size of pck00011.tpc."""
+    path = tmp_path_factory.mktemp("kernels") / f"synthetic_{request.param}x.tpc"
+    return write_scaled_kernel(path, request.param)
+
+
+@pytest.fixture(scope="session", params=[1, 10, 100], ids=lambda scale: f"{scale}x")
+def kernel_pair(request, tmp_path_factory):
+    """Two synthetic kernels of the same size and layout with different values."""
+    directory = tmp_path_factory.mktemp("kernels")
+    return tuple(
+        write_scaled_kernel(directory / f"{name}_{request.param}x.tpc", request.param, seed=seed)
+        for name, seed in (("old", 0), ("new", 1))
+    )
+
+
+@pytest.fixture(scope="session")
+def base_kernel(tmp_path_factory):
+    """Synthetic kernel of the size of pck00011.tpc containing the common bodies."""
+    return write_scaled_kernel(tmp_path_factory.mktemp("kernels") / "base.tpc", 1)
+
+
+@pytest.fixture(scope="session", params=[3, 100, 1000], ids=lambda n: f"{n}-values")
+def long_array_kernel(request, tmp_path_factory):
+    """Synthetic kernels of 10x the reference size with arrays of increasing length."""
+    path = tmp_path_factory.mktemp("kernels") / f"arrays_{request.param}.tpc"
+    return write_scaled_kernel(path, 10, array_length=request.param, continuation_fraction=0)
+
+
+@pytest.fixture(scope="session")
+def real_kernel():
+    """Path to pck00011.tpc, skipping when it cannot be retrieved."""
+    try:
+        return pck_parser.get_pck_path()
+    except Exception as exc:  # network errors come in many flavours
+        pytest.skip(f"PCK kernel not available: {exc}")
+
+
+@pytest.fixture
+def use_kernel(monkeypatch):
+    """Point the package at a given kernel file with an empty parse cache."""
+
+    def use(path):
+        monkeypatch.setattr(pck_parser, "_pck_path", str(path))
+        pck_parser.clear_cache()
+
+    yield use
+    pck_parser.clear_cache()
@@ -0,0 +1,16 @@
+"""Benchmarks for cached model outputs."""
+
+import numpy as np
+
+from planets import cache, thermal
+
+
+def test_cached_teq_map(benchmark, use_kernel, base_kernel):
+    from planets import Moon
+
+    use_kernel(base_kernel)
+    incidence = np.random.default_rng(0).uniform(0, np.pi / 2, 1_000_000)
+    teq = cache.ResultCache().cached(thermal.equilibrium_temperature)
+    teq(Moon, incidence)
+    result = benchmark(teq, Moon, incidence)
+    assert result.shape == incidence.shape
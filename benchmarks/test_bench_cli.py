@@ -0,0 +1,15 @@
+"""Benchmarks for the start-up time of the planets command line interface."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize("args", [["--version"], ["--list"]], ids=["version", "list"])
+def test_cli_startup(benchmark, args):
+    command = [sys.executable, "-m", "planets.cli"] + args
+    result = benchmark.pedantic(
+        subprocess.run, args=(command,), kwargs={"capture_output": True}, rounds=10
+    )
+    assert result.returncode == 0
@@ -0,0 +1,14 @@
+"""Benchmarks for moon eclipses."""
+
+import numpy as np
+
+from planets import eclipse
+
+# One Jovian year of hourly samples
+HOURS = np.arange(0, 11.86 * 365.25 * 24) * 3600.0
+
+
+def test_eclipses_galilean_year_hourly(benchmark, base_kernel, use_kernel):
+    use_kernel(base_kernel)
+    shadow = benchmark(eclipse.eclipses, ["Europa", "Ganymede"], HOURS)
+    assert shadow.blocked.shape == (2, HOURS.size)
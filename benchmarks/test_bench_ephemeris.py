@@ -0,0 +1,13 @@
+"""Benchmarks for the mean-element ephemeris."""
+
+import numpy as np
+
+from planets import ephemeris
+
+BODIES = ["Mercury", "Venus", "Earth", "Moon", "Mars", "Jupiter", "Saturn", "Uranus", "Neptune"]
+
+
+def test_positions_bodies_by_epochs(benchmark):
+    jd = np.linspace(2378496.5, 2469807.5, 100_000)
+    positions = benchmark(ephemeris.heliocentric_position, BODIES, jd)
+    assert positions.shape == (len(BODIES), jd.size, 3)
@@ -0,0 +1,14 @@
+"""Benchmarks for illumination maps."""
+
+import numpy as np
+
+import planets
+from planets import illumination
+
+
+def test_illumination_day_global_half_degree(benchmark):
+    latitude = np.arange(-90, 90.5, 0.5)
+    longitude = np.arange(0, 360, 0.5)
+    t = np.arange(24) * 3600.0
+    out = np.empty((t.size, latitude.size, longitude.size), dtype=np.float32)
+    benchmark(illumination.illumination_cube, planets.Earth, latitude, longitude, t, out=out)
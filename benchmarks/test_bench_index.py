@@ -0,0 +1,33 @@
+"""Benchmarks for range and nearest-neighbour queries over a large body table."""
+
+import numpy as np
+import pytest
+
+from planets.table import BodyTable
+
+N_BODIES = 10_000
+
+
+@pytest.fixture(scope="module")
+def table():
+    rng = np.random.default_rng(0)
+    table = BodyTable(fields=["rAU", "eccentricity"])
+    table.names = [f"body{i}" for i in range(N_BODIES)]
+    table.columns = {
+        "rAU": rng.uniform(0.5, 6, N_BODIES),
+        "eccentricity": rng.uniform(0, 0.4, N_BODIES),
+    }
+    # Build the indexes once, the benchmarks measure the queries
+    table.select("rAU")
+    table.nearest("body0", ["rAU", "eccentricity"], scale=[1, 0.1])
+    return table
+
+
+def test_range_query(benchmark, table):
+    rows = benchmark(table.select, "rAU", 2, 3.3)
+    assert rows.size > 0
+
+
+def test_nearest_query(benchmark, table):
+    rows, _ = benchmark(table.nearest, "body7", ["rAU", "eccentricity"], 10, [1, 0.1])
+    assert rows.size == 10
@@ -0,0 +1,15 @@
+"""Benchmarks for kernel diffs."""
+
+from planets import kernel_diff, pck_parser
+
+
+def test_diff_indexes(benchmark, kernel_pair):
+    old, new = (pck_parser.load_kernel_index(path) for path in kernel_pair)
+    diff = benchmark(kernel_diff.diff_indexes, old, new)
+    assert "BODY399_RADII" in diff.changed
+
+
+def test_diff_kernels_cached(benchmark, kernel_pair):
+    kernel_diff.diff_kernels(*kernel_pair)
+    diff = benchmark(kernel_diff.diff_kernels, *kernel_pair)
+    assert diff
@@ -0,0 +1,36 @@
+"""Benchmarks for radius and name lookups."""
+
+import pytest
+
+from planets import pck_parser
+
+
+@pytest.fixture(params=["real", "synthetic"])
+def kernel(request, use_kernel, base_kernel):
+    path = request.getfixturevalue("real_kernel") if request.param == "real" else base_kernel
+    use_kernel(path)
+    return path
+
+
+def test_radius_cold(benchmark, kernel):
+    radius = benchmark.pedantic(
+        pck_parser.get_body_radius_km,
+        args=("Earth",),
+        setup=pck_parser.clear_cache,
+        rounds=20,
+    )
+    assert radius is not None
+
+
+def test_radius_warm(benchmark, kernel):
+    pck_parser.get_body_radius_km("Earth")
+    radius = benchmark(pck_parser.get_body_radius_km, "Earth")
+    assert radius is not None
+
+
+@pytest.mark.parametrize(
+    "name, path", [("Earth", "exact"), ("luna", "alias"), ("Mars Barycenter", "fuzzy")]
+)
+def test_lookup_by_name(benchmark, base_kernel, name, path):
+    radii_data = pck_parser.extract_body_radii(pck_parser.parse_pck_file(base_kernel))
+    assert benchmark(pck_parser.get_body_radii_by_name, name, radii_data) is not None
@@ -0,0 +1,36 @@
+"""Benchmarks for parsing PCK kernels."""
+
+from planets import pck_parser
+
+
+def test_parse_real_kernel(benchmark, real_kernel):
+    constants = benchmark(pck_parser.parse_pck_file, real_kernel)
+    assert "BODY399_RADII" in constants
+
+
+def test_parse_synthetic_kernel(benchmark, synthetic_kernel):
+    constants = benchmark.pedantic(
+        pck_parser.parse_pck_file, args=(synthetic_kernel,), rounds=5, warmup_rounds=1
+    )
+    assert "BODY399_RADII" in constants
+
+
+def test_parse_long_arrays(benchmark, long_array_kernel):
+    constants = benchmark.pedantic(
+        pck_parser.parse_pck_file, args=(long_array_kernel,), rounds=3, warmup_rounds=1
+    )
+    assert "BODY399_RADII" in constants
+
+
+def test_extract_body_radii(benchmark, synthetic_kernel):
+    constants = pck_parser.parse_pck_file(synthetic_kernel)
+    radii = benchmark(pck_parser.extract_body_radii, constants)
+    assert 399 in radii
+
+
+def test_indexed_body_radii(benchmark, synthetic_kernel):
+    from planets.kernel_index import KernelIndex
+
+    index = KernelIndex(pck_parser.parse_pck_file(synthetic_kernel))
+    radii = benchmark(index.values_by_body, "RADII")
+    assert 399 in radii
@@ -0,0 +1,11 @@
+"""Benchmarks for loading catalogue snapshots."""
+
+from planets import snapshot
+
+
+def test_read_snapshot(benchmark, tmp_path, use_kernel, base_kernel):
+    use_kernel(base_kernel)
+    path = tmp_path / "bodies.snap"
+    snapshot.export_snapshot(path)
+    loaded = benchmark(snapshot.read_snapshot, path)
+    assert loaded.bodies["Earth"].R is not None
@@ -0,0 +1,28 @@
+"""Benchmarks for streaming Teq evaluation of CSV rows."""
+
+import io
+
+import numpy as np
+import pytest
+
+from planets import stream
+
+N_ROWS = 200_000
+
+
+@pytest.fixture(scope="module", params=[False, True], ids=["averaged", "with-time"])
+def csv_rows(request):
+    rng = np.random.default_rng(0)
+    names = np.where(rng.random(N_ROWS) < 0.5, "Earth", "Mars")
+    latitude = rng.uniform(-90, 90, N_ROWS)
+    if request.param:
+        time = rng.uniform(0, 3e7, N_ROWS)
+        return "".join(f"{b},{lat:.3f},{t:.1f}\n" for b, lat, t in zip(names, latitude, time))
+    return "".join(f"{b},{lat:.3f}\n" for b, lat in zip(names, latitude))
+
+
+def test_stream_csv(benchmark, csv_rows):
+    n_rows = benchmark.pedantic(
+        lambda: stream.run(io.StringIO(csv_rows), io.StringIO()), rounds=3, warmup_rounds=1
+    )
+    assert n_rows == N_ROWS
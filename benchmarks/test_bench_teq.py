@@ -0,0 +1,24 @@
+"""Benchmarks for vectorized equilibrium temperatures."""
+
+import numpy as np
+import pytest
+
+import planets
+
+
+@pytest.mark.parametrize("resolution", [1.0, 0.1], ids=["1deg", "0.1deg"])
+def test_teq_global_grid(benchmark, resolution):
+    latitude = np.arange(-90, 90 + resolution, resolution)
+    longitude = np.arange(0, 360, resolution)
+    grid = np.broadcast_to(latitude[:, None], (latitude.size, longitude.size))
+    temperature = benchmark(planets.Mars.Teq, grid)
+    assert temperature.shape == grid.shape
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32], ids=["float64", "float32"])
+def test_equilibrium_temperature_map(benchmark, dtype):
+    from planets import thermal
+
+    incidence = np.random.default_rng(0).uniform(0, np.pi, (1801, 3600))
+    out = np.empty(incidence.shape, dtype=dtype)
+    benchmark(thermal.equilibrium_temperature, planets.Moon, incidence, out=out)
@@ -0,0 +1,10 @@
+"""Benchmarks for the catalogue consistency checks."""
+
+from planets import pck_parser, validation
+
+
+def test_validate_catalogue(benchmark, base_kernel, use_kernel):
+    use_kernel(base_kernel)
+    pck_parser.load_kernel_index()
+    report = benchmark(validation.validate)
+    assert set(report["summary"]) == set(validation.CHECKS)
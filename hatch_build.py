@@ -0,0 +1,26 @@
+"""Build hook generating the data module of planets.lite from the pinned PCK kernel.
+
+The kernel is retrieved through the kernel registry (planets/kernels.txt), which checks
+its SHA-256, so every build ships radii from the same kernel. A wheel built from an
+sdist reuses the data module the sdist carries instead of downloading the kernel again.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+DATA_MODULE = "planets/_lite_data.py"
+
+
+class LiteDataBuildHook(BuildHookInterface):
+    PLUGIN_NAME = "custom"
+
+    def initialize(self, version, build_data):
+        root = Path(self.root)
+        from_sdist = (root / "PKG-INFO").exists()
+        if not (from_sdist and (root / DATA_MODULE).exists()):
+            subprocess.run([sys.executable, "-m", "planets.lite"], cwd=root, check=True)
+        # The data module is ignored by git, which would leave it out of the build
+        build_data["artifacts"].append(DATA_MODULE)
@@ -6,13 +6,35 @@ __author__ = """K.-Michael Aye"""
 __email__ = "kmichael.aye@gmail.com"
 __version__ = "0.9.1"
 
-from ._planets import *
+from . import _planets
+from ._planets import AU as AU
+from ._planets import G as G
+from ._planets import Planet as Planet
 from ._planets import __all__ as _planets_all
+from ._planets import sigma as sigma
+from .instrumentation import stats
 
-__all__ = _planets_all + ["get_all_bodies"]
+__all__ = _planets_all + ["get_all_bodies", "load_kernels", "stats"]
 
 
 def get_all_bodies():
     """Get all planetary bodies defined in the module."""
-    # Filter out non-Planet objects and the Planet class from __all__
-    return [obj for obj in _planets_all if obj not in ["AU", "sigma", "G", "Planet"]]
+    return list(_planets._BODY_NAMES)
+
+
+def __getattr__(name):
+    # Bodies are built lazily on first access, see _planets.__getattr__
+    if name in _planets._BODY_NAMES:
+        value = getattr(_planets, name)
+        globals()[name] = value
+        return value
+    if name == "load_kernels":
+        # asyncio is only imported when the async API is used
+        from .aio import load_kernels
+
+        return load_kernels
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
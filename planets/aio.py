@@ -0,0 +1,118 @@
+"""Asyncio-friendly kernel acquisition and loading.
+
+Downloading a kernel with pooch and parsing it are blocking operations, so the
+coroutines here run both in an executor and leave the event loop free. Concurrent requests for the
+same kernel are de-duplicated: the first one starts the load and all others await the
+same result. Afterwards the parsed kernel is in the cache of `pck_parser` and the
+synchronous API uses it without further I/O::
+
+    await planets.load_kernels(mirror="http://mirror.local/naif/pck")
+    radius = await planets.Earth.aradius()
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from . import instrumentation, pck_parser
+
+__all__ = ["load_kernels", "load_kernel"]
+
+Source = Optional[Union[str, Path]]
+
+# Loads in progress, by event loop and kernel
+_inflight: Dict[Tuple[asyncio.AbstractEventLoop, Source, Optional[str]], asyncio.Future] = {}
+
+
+def _is_url(source) -> bool:
+    return isinstance(source, str) and source.startswith(("http://", "https://", "ftp://"))
+
+
+def _acquire(source: Source, mirror: Optional[str], known_hash: Optional[str]) -> str:
+    """Get a local path for a kernel, downloading it if needed. Blocking."""
+    if source is None:
+        if mirror is None:
+            return pck_parser.get_pck_path()
+        # The mirror must serve the same file, the registry checks its hash
+        from .kernels import PCK_NAME, KernelRegistry
+
+        path = KernelRegistry(mirror=mirror).fetch(PCK_NAME)
+        if pck_parser._pck_path is None:
+            pck_parser._pck_path = path
+        return path
+    if not _is_url(source):
+        return str(source)
+    import pooch
+
+    if mirror is not None:
+        source = f"{mirror.rstrip('/')}/{source.rsplit('/', 1)[1]}"
+    return pooch.retrieve(source, known_hash=known_hash)
+
+
+def _load(source: Source, mirror: Optional[str], known_hash: Optional[str]) -> str:
+    """Acquire and parse a kernel, filling the parse cache. Blocking."""
+    path = _acquire(source, mirror, known_hash)
+    pck_parser.load_body_radii(path)
+    return path
+
+
+async def load_kernel(
+    source: Source = None,
+    mirror: Optional[str] = None,
+    known_hash: Optional[str] = None,
+    executor: Optional[Executor] = None,
+) -> str:
+    """Acquire and parse a kernel in an executor, sharing concurrent loads.
+
+    Parameters
+    ----------
+    source : str or Path, optional
+        URL or local path of the kernel, by default the package's PCK kernel
+    mirror : str, optional
+        Base URL of a mirror to download the kernel from instead of its URL. The
+        package's kernel is fetched through planets.kernels.KernelRegistry, with the
+        mirror's layout and hash check.
+    known_hash : str, optional
+        Hash of a kernel given by URL, in pooch's "algorithm:hash" format
+    executor : concurrent.futures.Executor, optional
+        Executor for the blocking work, by default the event loop's default executor
+
+    Returns
+    -------
+    str
+        The local path of the kernel
+    """
+    if isinstance(source, Path):
+        source = str(source)
+    loop = asyncio.get_running_loop()
+    key = (loop, source, mirror)
+    future = _inflight.get(key)
+    if future is None:
+        future = loop.run_in_executor(executor, _load, source, mirror, known_hash)
+        _inflight[key] = future
+        future.add_done_callback(lambda _: _inflight.pop(key, None))
+    elif instrumentation.enabled:
+        instrumentation.count("load.shared", source=str(source))
+    # A cancelled caller must not cancel the load the other callers are waiting for
+    return await asyncio.shield(future)
+
+
+async def load_kernels(*sources: Source, **options) -> List[str]:
+    """Load several kernels concurrently, see load_kernel().
+
+    Parameters
+    ----------
+    *sources : str or Path
+        URLs or local paths of the kernels, by default the package's PCK kernel
+    **options
+        `mirror`, `known_hash` and `executor`, passed to load_kernel()
+
+    Returns
+    -------
+    List[str]
+        The local paths of the kernels
+    """
+    if not sources:
+        sources = (None,)
+    return list(await asyncio.gather(*(load_kernel(source, **options) for source in sources)))
@@ -0,0 +1,377 @@
+"""Content-addressed cache for the results of expensive per-body computations.
+
+A result is stored under a hash of the function, the field values of the body it was
+computed for, the kernel the radii come from and the call arguments (arrays by dtype,
+shape and contents). The same computation for an equal body therefore hits the cache
+even across jobs, while any change of the inputs gives a new key::
+
+    from planets import Moon, cache, thermal
+
+    teq = cache.cached(thermal.equilibrium_temperature)
+    T = teq(Moon, incidence)  # computed
+    T = teq(Moon, incidence)  # from the cache
+    Moon.albedo = 0.15        # drops Moon's entries from memory
+    T = teq(Moon, incidence)  # computed again
+
+Results are kept in an in-memory LRU layer bounded in bytes. With a `directory`
+(by default the ``PLANETS_RESULT_CACHE`` environment variable) array results are also
+written there as ``.npy`` files and read back memory-mapped, so they survive the
+process and are shared between processes on one machine.
+
+Cached arrays are returned read-only. Setting a field of a `Planet` drops the
+in-memory results computed for it, or with ``cached(func, fields=[...])`` only the
+results of functions depending on that field. In-place changes of list fields such as
+``albedoCoef[0] = ...`` are not noticed and need an explicit invalidate().
+"""
+
+import functools
+import hashlib
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from . import _planets, instrumentation, pck_parser
+
+__all__ = ["ResultCache", "cached", "default_cache"]
+
+DIRECTORY_ENV = "PLANETS_RESULT_CACHE"
+
+# Default size limit of the in-memory layer [bytes]
+MAX_BYTES = 256 * 2**20
+
+_kernel_hashes: Dict[Tuple[str, int, int], str] = {}
+_caches: "weakref.WeakSet[ResultCache]" = weakref.WeakSet()
+_default_cache: Optional["ResultCache"] = None
+
+
+def kernel_hash() -> str:
+    """Get the hash of the kernel radii are taken from, without fetching it.
+
+    Until a kernel has been retrieved the radii would come from the package's kernel,
+    identified by its registry hash. A kernel path that no longer exists gives no radii,
+    and is identified by the path alone.
+    """
+    path = pck_parser._pck_path
+    if path is None:
+        return pck_parser.PCK_HASH
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return f"missing:{path}"
+    signature = (str(path), stat.st_mtime_ns, stat.st_size)
+    digest = _kernel_hashes.get(signature)
+    if digest is None:
+        from .snapshot import kernel_provenance
+
+        digest = _kernel_hashes[signature] = "sha256:" + kernel_provenance(path)["sha256"]
+    return digest
+
+
+def _update(digest, value, fingerprint: Callable[[Any], str]):
+    """Feed a call argument into a hash, raising TypeError for unsupported types."""
+    if isinstance(value, _planets.Planet):
+        digest.update(b"P" + fingerprint(value).encode())
+    elif isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            raise TypeError("Cannot hash object arrays")
+        digest.update(f"A{value.dtype.str}{value.shape}".encode())
+        digest.update(np.ascontiguousarray(value).data)
+    elif value is None or isinstance(value, (bool, int, float, complex, str, bytes, np.generic)):
+        digest.update(f"S{type(value).__name__}:{value!r}".encode())
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"L{len(value)}".encode())
+        for item in value:
+            _update(digest, item, fingerprint)
+    elif isinstance(value, dict):
+        digest.update(f"D{len(value)}".encode())
+        for key in sorted(value):
+            _update(digest, key, fingerprint)
+            _update(digest, value[key], fingerprint)
+    elif (
+        isinstance(value, np.dtype)
+        or (isinstance(value, type) and value in (float, int, complex, bool))
+        or (isinstance(value, type) and issubclass(value, np.generic))
+    ):
+        digest.update(f"T{np.dtype(value).str}".encode())
+    else:
+        raise TypeError(f"Cannot hash argument of type {type(value).__name__}")
+
+
+def _nbytes(value) -> int:
+    return value.nbytes if isinstance(value, np.ndarray) else 64
+
+
+def _read_only(value):
+    if isinstance(value, np.ndarray) and value.flags.writeable:
+        value = value.view()
+        value.flags.writeable = False
+    return value
+
+
+class ResultCache:
+    """LRU cache of computation results with an optional on-disk layer.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Size limit of the in-memory layer, by default 256 MiB. The least recently used
+        results are evicted beyond it.
+    directory : str or Path, optional
+        Directory of the on-disk layer, by default ``PLANETS_RESULT_CACHE``. Without
+        one, results are only kept in memory.
+    """
+
+    def __init__(self, max_bytes: int = MAX_BYTES, directory: Optional[Union[str, Path]] = None):
+        if directory is None:
+            directory = os.environ.get(DIRECTORY_ENV)
+        self.max_bytes = max_bytes
+        self.directory = None if directory is None else Path(directory)
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        # Per body: fingerprints by hashed fields with the body version, and the keys of
+        # the results computed for it with the fields they depend on
+        self._fingerprints: "weakref.WeakKeyDictionary[Any, dict]" = weakref.WeakKeyDictionary()
+        self._keys_of: "weakref.WeakKeyDictionary[Any, dict]" = weakref.WeakKeyDictionary()
+        self._lock = threading.RLock()
+        _caches.add(self)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key: str):
+        path = self._path(key)
+        return key in self._entries or (path is not None and path.exists())
+
+    def fingerprint(self, body, fields: Optional[Tuple[str, ...]] = None) -> str:
+        """Get the hash of a body's field values, reused until one of them is set.
+
+        Parameters
+        ----------
+        body : Planet
+            The body
+        fields : tuple of str, optional
+            Fields to hash, by default all of them
+
+        Returns
+        -------
+        str
+        """
+        with self._lock:
+            memo = self._fingerprints.setdefault(body, {})
+            entry = memo.get(fields)
+            if entry is not None and not body.changed_since(entry[0], *(fields or ())):
+                return entry[1]
+            digest = hashlib.sha256()
+            if fields is None:
+                items = [
+                    (name, value)
+                    for name, value in sorted(vars(body).items())
+                    if name not in _planets.TRACKING_FIELDS
+                ]
+            else:
+                items = [(name, getattr(body, name)) for name in sorted(fields)]
+            for name, value in items:
+                digest.update(name.encode())
+                _update(digest, value, self.fingerprint)
+            memo[fields] = (body.version, digest.hexdigest())
+            return memo[fields][1]
+
+    def key(
+        self,
+        func: Callable,
+        args: tuple,
+        kwargs: Dict[str, Any],
+        fields: Optional[Tuple[str, ...]] = None,
+    ) -> str:
+        """Get the cache key of a call.
+
+        Parameters
+        ----------
+        func : callable
+            The function
+        args, kwargs
+            The call arguments
+        fields : tuple of str, optional
+            The fields of `Planet` arguments the result depends on, by default all
+
+        Raises
+        ------
+        TypeError
+            If an argument cannot be hashed by value
+        """
+        digest = hashlib.sha256(f"{func.__module__}.{func.__qualname__}".encode())
+        digest.update(kernel_hash().encode())
+        digest.update(repr(fields).encode())
+        fingerprint = functools.partial(self.fingerprint, fields=fields)
+        _update(digest, list(args), fingerprint)
+        _update(digest, kwargs, fingerprint)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Optional[Path]:
+        return None if self.directory is None else self.directory / f"{key}.npy"
+
+    def get(self, key: str, default=None):
+        """Get a result from memory or disk, `default` if it is not cached."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        path = self._path(key)
+        if path is None or not path.exists():
+            return default
+        value = np.load(path, mmap_mode="r")
+        self._remember(key, value)
+        return value
+
+    def put(self, key: str, value, bodies=(), fields: Optional[Tuple[str, ...]] = None):
+        """Store a result, evicting least recently used ones beyond the size limit.
+
+        Parameters
+        ----------
+        key : str
+            Key from key()
+        value : Any
+            The result. Arrays are written to the on-disk layer if there is one.
+        bodies : iterable of Planet, optional
+            Bodies whose field changes invalidate the result
+        fields : tuple of str, optional
+            The fields of `bodies` the result depends on, by default all
+        """
+        value = _read_only(value)
+        path = self._path(key)
+        if path is not None and isinstance(value, np.ndarray) and not value.dtype.hasobject:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "wb") as f:
+                np.save(f, value)
+            os.replace(tmp_path, path)
+        self._remember(key, value, bodies, fields)
+        return value
+
+    def _remember(self, key: str, value, bodies=(), fields=None):
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= _nbytes(self._entries.pop(key))
+            self._entries[key] = value
+            self.nbytes += _nbytes(value)
+            for body in bodies:
+                self._keys_of.setdefault(body, {})[key] = fields
+            while self.nbytes > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= _nbytes(evicted)
+
+    def invalidate(self, body, field: Optional[str] = None):
+        """Drop the in-memory results computed for a body.
+
+        Entries on disk stay: they are addressed by the old field values and are only
+        used again if the body returns to them.
+
+        Parameters
+        ----------
+        body : Planet
+            The body
+        field : str, optional
+            Only drop the results depending on this field, by default all
+        """
+        with self._lock:
+            keys = self._keys_of.get(body, {})
+            for key, fields in list(keys.items()):
+                if field is None or fields is None or field in fields:
+                    del keys[key]
+                    value = self._entries.pop(key, None)
+                    if value is not None:
+                        self.nbytes -= _nbytes(value)
+            if field is None:
+                self._fingerprints.pop(body, None)
+
+    def clear(self, disk: bool = False):
+        """Drop all in-memory results, and with `disk` also the on-disk layer."""
+        with self._lock:
+            self._entries.clear()
+            self._keys_of.clear()
+            self._fingerprints.clear()
+            self.nbytes = 0
+        if disk and self.directory is not None:
+            for path in self.directory.glob("*.npy"):
+                path.unlink()
+
+    def call(self, func: Callable, *args, **kwargs):
+        """Call `func`, or return its cached result for equal arguments."""
+        return self._call(func, args, kwargs)
+
+    def _call(self, func: Callable, args, kwargs, fields=None):
+        try:
+            key = self.key(func, args, kwargs, fields)
+        except TypeError:
+            # Arguments without a stable hash are computed every time
+            return func(*args, **kwargs)
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            self.hits += 1
+            if instrumentation.enabled:
+                instrumentation.count("results.hit", function=func.__qualname__)
+            return value
+        self.misses += 1
+        if instrumentation.enabled:
+            instrumentation.count("results.miss", function=func.__qualname__)
+        bodies = [arg for arg in args if isinstance(arg, _planets.Planet)]
+        return self.put(key, func(*args, **kwargs), bodies, fields)
+
+    def cached(self, func: Callable, fields: Optional[Sequence[str]] = None) -> Callable:
+        """Wrap a function so that its results are cached here.
+
+        Calls passing `out` are not cached, as they ask for the result in a given array.
+
+        Parameters
+        ----------
+        func : callable
+            The function
+        fields : sequence of str, optional
+            The fields of `Planet` arguments the function uses, by default all. With
+            them, setting any other field neither changes the key nor drops results.
+        """
+        fields = None if fields is None else tuple(fields)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if kwargs.get("out") is not None:
+                return func(*args, **kwargs)
+            return self._call(func, args, kwargs, fields)
+
+        wrapper.cache = self
+        return wrapper
+
+
+_MISSING = object()
+
+
+def _field_changed(body, name):
+    for cache in list(_caches):
+        if body in cache._keys_of:
+            cache.invalidate(body, name)
+
+
+_planets._change_callbacks.append(_field_changed)
+
+
+def default_cache() -> ResultCache:
+    """Get the cache used by cached(), created on first use."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ResultCache()
+    return _default_cache
+
+
+def cached(func: Callable, fields: Optional[Sequence[str]] = None) -> Callable:
+    """Wrap a function so that its results are cached in default_cache().
+
+    See ResultCache.cached() for `fields`.
+    """
+    return default_cache().cached(func, fields)
@@ -3,10 +3,10 @@
 """Console script for planets."""
 
 import argparse
-import inspect
+import contextlib
 import sys
 import textwrap
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 # Cache the parser to avoid creating it multiple times
 _parser = None
@@ -29,48 +29,22 @@ def get_body_attributes(body_name: str) -> Dict[str, Any]:
     if body is None or not isinstance(body, _planets.Planet):
         return None
 
-    # Get all non-function attributes
-    attributes = {}
-    for name, value in inspect.getmembers(body):
-        # Skip special methods, private methods, functions, and _R since we show R
-        if (
-            not name.startswith("__")
-            and not name.startswith("_Planet__")
-            and not inspect.ismethod(value)
-            and not inspect.isfunction(value)
-            and name != "_R"  # Skip _R since we show R
-        ):
-            attributes[name] = value
+    # The public fields, without evaluating properties such as the Quantity view
+    attributes = {name: value for name, value in vars(body).items() if not name.startswith("_")}
+    # The radius may still have to be looked up in the kernel
+    attributes["R"] = body.R
 
     return attributes
 
 
-def format_attribute_value(name: str, value: Any) -> str:
+def format_attribute_value(name: str, value: Any, body_name: Optional[str] = None) -> str:
     """Format attribute value with units and explanation when available."""
-    # Certain attributes have known units we can add
-    units_map = {
-        "R": "meters",
-        "g": "m/s²",
-        "S": "W/m²",
-        "psurf": "Pa",
-        "albedo": "fraction",
-        "emissivity": "fraction",
-        "Qb": "W/m²",
-        "gamma": "J·m⁻²·K⁻¹·s⁻¹/²",
-        "rsm": "meters",
-        "rAU": "AU",
-        "year": "seconds",
-        "day": "seconds",
-        "obliquity": "radians",
-        "Lequinox": "radians",
-        "Lp": "radians",
-        "Tsavg": "K",
-        "Tsmax": "K",
-    }
-
-    # Format the value with units if applicable
-    if name in units_map and value is not None:
-        return f"{value} {units_map[name]}"
+    from planets.units import label_of
+
+    # Units come from the schema in planets.units, some depend on the body
+    label = label_of(body_name, name)
+    if label and value is not None:
+        return f"{value} {label}"
 
     return str(value)
 
@@ -89,6 +63,10 @@ def create_parser():
           planets --list                  # List all available bodies
           planets --body Mercury          # Show attributes for Mercury
           planets --version               # Show version information
+          planets teq rows.csv > out.csv  # Teq and flux for body,latitude[,time] rows
+          planets profile                 # Timings and cache state of this environment
+          planets validate                # Check the catalogue against the kernel
+          planets diff old.tpc new.tpc    # Changed, added and removed kernel keys
         """),
     )
 
@@ -97,17 +75,206 @@ def create_parser():
     group.add_argument("--list", action="store_true", help="List all available bodies")
     group.add_argument("--body", metavar="NAME", help="Show attributes for a specific body")
 
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+    teq = commands.add_parser(
+        "teq",
+        help="Evaluate Teq and solar flux for a stream of rows",
+        description="Evaluate the equilibrium temperature and solar flux for rows of "
+        "body,latitude[,time] read in chunks from CSV or .npy, see planets.stream.",
+    )
+    teq.add_argument("input", nargs="?", default="-", help="Input file, by default standard input")
+    teq.add_argument("-o", "--output", default="-", help="Output file, by default standard output")
+    teq.add_argument(
+        "--input-format",
+        choices=["csv", "npy"],
+        help="By default from the file extension, csv for standard input",
+    )
+    teq.add_argument(
+        "--output-format",
+        choices=["csv", "npy"],
+        help="By default from the file extension, csv for standard output",
+    )
+    teq.add_argument("--body", dest="teq_body", metavar="NAME", help="Body of float .npy input")
+    teq.add_argument(
+        "--chunk-size", type=int, default=65536, help="Rows evaluated at once (default 65536)"
+    )
+
+    profile = commands.add_parser(
+        "profile",
+        help="Report import, kernel and lookup timings and cache state",
+        description="Profile the current environment: import time of the dependencies, "
+        "kernel retrieval and parse time, lookup timings and cache state.",
+    )
+    profile.add_argument("--json", action="store_true", help="Print the report as JSON")
+    profile.add_argument(
+        "--offline", action="store_true", help="Do not download the kernel if it is not cached"
+    )
+    profile.add_argument("--no-imports", action="store_true", help="Skip measuring import times")
+    profile.add_argument("--pstats", metavar="FILE", help="Write a cProfile stats file")
+
+    validate = commands.add_parser(
+        "validate",
+        help="Check the body catalogue for consistency",
+        description="Check every body's fields against the PCK kernel and the relations "
+        "between fields, see planets.validation. Exits with 1 if a check fails.",
+    )
+    validate.add_argument("--json", action="store_true", help="Print the report as JSON")
+    validate.add_argument(
+        "--no-kernel", action="store_true", help="Skip the checks needing the kernel"
+    )
+    validate.add_argument(
+        "--missing", action="store_true", help="Also list rows without a value to compare"
+    )
+
+    diff = commands.add_parser(
+        "diff",
+        help="Compare two text kernels",
+        description="List the changed, added and removed keys of a new kernel with the "
+        "numeric deltas of changed values, see planets.kernel_diff. Exits with 0 if the "
+        "kernels agree, 1 if they differ and 2 on errors.",
+    )
+    diff.add_argument("old", help="Path to the old kernel")
+    diff.add_argument("new", help="Path to the new kernel")
+    diff.add_argument("--prefix", help="Only compare keys starting with it, e.g. BODY399_")
+    diff.add_argument(
+        "--bodies",
+        metavar="ID[:ID]",
+        help="Only compare keys of a body ID or an inclusive range, e.g. 600:699",
+    )
+    diff.add_argument("--quantity", help="Only compare BODY<ID>_<quantity> keys, e.g. RADII")
+    diff.add_argument(
+        "--atol", type=float, default=0.0, help="Ignore numeric changes up to this size"
+    )
+    diff.add_argument("--json", action="store_true", help="Print the differences as JSON")
+
     _parser = parser
     return parser
 
 
+def _stream_format(path: str, given: Optional[str]) -> str:
+    if given is not None:
+        return given
+    return "npy" if path.endswith(".npy") else "csv"
+
+
+def _open_stream(path: str, format: str, mode: str):
+    """Open a file or standard input/output, in binary mode for npy."""
+    if path == "-":
+        stream = sys.stdin if mode == "r" else sys.stdout
+        return contextlib.nullcontext(stream.buffer if format == "npy" else stream)
+    if format == "npy":
+        return open(path, mode + "b")
+    return open(path, mode, newline="")
+
+
+def run_teq(args) -> int:
+    """Run the teq command."""
+    from planets import stream
+
+    input_format = _stream_format(args.input, args.input_format)
+    output_format = _stream_format(args.output, args.output_format)
+    try:
+        with _open_stream(args.input, input_format, "r") as source:
+            with _open_stream(args.output, output_format, "w") as out:
+                stream.run(
+                    source,
+                    out,
+                    input_format,
+                    output_format,
+                    chunk_rows=args.chunk_size,
+                    body=args.teq_body,
+                )
+    except (OSError, ValueError) as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def run_profile(args) -> int:
+    """Run the profile command."""
+    import json
+
+    from planets import profiling
+
+    profiler = None
+    if args.pstats:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        report = profiling.collect(offline=args.offline, imports=not args.no_imports)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(args.pstats)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(profiling.format_report(report), end="")
+        if args.pstats:
+            print(f"\ncProfile stats written to {args.pstats}")
+    return 0 if report["kernel"]["error"] is None else 1
+
+
+def run_validate(args) -> int:
+    """Run the validate command."""
+    import json
+
+    from planets import validation
+
+    report = validation.validate(kernel=not args.no_kernel)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(validation.format_report(report, missing=args.missing), end="")
+    return 0 if report["valid"] else 1
+
+
+def run_diff(args) -> int:
+    """Run the diff command."""
+    import json
+
+    from planets import kernel_diff
+
+    body = None
+    try:
+        if args.bodies:
+            low, _, high = args.bodies.partition(":")
+            body = (int(low), int(high or low))
+        diff = kernel_diff.diff_kernels(
+            args.old, args.new, args.prefix, body, args.quantity, args.atol
+        )
+    except (OSError, ValueError) as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 2
+    if args.json:
+        print(json.dumps(diff.to_dict(), indent=2))
+    else:
+        print(kernel_diff.format_diff(diff), end="")
+    return 1 if diff else 0
+
+
 def main(args=None):
     """Command-line interface for the planets package."""
     parser = create_parser()
     args = parser.parse_args(args)
 
     # Process arguments
-    if args.version:
+    if args.command == "teq":
+        return run_teq(args)
+
+    elif args.command == "profile":
+        return run_profile(args)
+
+    elif args.command == "validate":
+        return run_validate(args)
+
+    elif args.command == "diff":
+        return run_diff(args)
+
+    elif args.version:
         from planets import __version__
 
         print(f"planets version {__version__}")
@@ -134,7 +301,7 @@ def main(args=None):
         for name in sorted(attributes.keys()):
             value = attributes[name]
             if value is not None:  # Only show attributes that have values
-                formatted_value = format_attribute_value(name, value)
+                formatted_value = format_attribute_value(name, value, body_name)
                 print(f"{name:15} = {formatted_value}")
 
         return 0
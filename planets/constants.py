@@ -0,0 +1,12 @@
+"""Physical constants used throughout planets.
+
+The values are frozen copies of the CODATA 2018 / IAU 2012 values shipped with
+`astropy.constants`, so that ``import planets`` does not have to import astropy.
+The test suite cross-checks them against astropy when it is installed.
+"""
+
+AU = 149597870700.0  # Astronomical Unit [m] (IAU 2012, exact)
+sigma = 5.6703744191844314e-08  # Stefan-Boltzmann constant [W.m-2.K-4] (CODATA 2018)
+G = 6.6743e-11  # Gravitational constant [m3.kg-1.s-2] (CODATA 2018)
+
+__all__ = ["AU", "sigma", "G"]
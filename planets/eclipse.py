@@ -0,0 +1,231 @@
+"""Eclipses of moons by their parent planet.
+
+Each moon follows a circular orbit around its parent, in a plane given by its mean
+inclination to a reference plane (the parent's equator or orbital plane) with a
+uniformly precessing node, see `SATELLITES`. The heliocentric motion is that of the
+moon's `Planet`, as in planets.illumination: time `t` is counted in seconds from
+perihelion passage, and at ``t = 0`` the moon is at local midnight of its orbit around
+the parent, i.e. as close to the parent's shadow as its orbit allows. A synchronous
+moon's sub-parent longitude 0 is then at local noon in planets.illumination, so both
+series line up.
+
+The parent's shadow is cast by its triaxial shape from the PCK kernel: the silhouette
+seen from the Sun is the ellipse of the equatorial and polar radii at the solar
+declination. The fraction of the solar disk hidden by the silhouette, as seen from the
+moon's center, is evaluated for all moons and times in one vectorized pass::
+
+    shadow = eclipses(["Europa", "Ganymede"], t)  # arrays of shape (2, len(t))
+    flux = illumination_flux * (1 - shadow.blocked[0])
+"""
+
+from typing import Dict, NamedTuple, Sequence, Union
+
+import numpy as np
+
+from .illumination import eccentric_anomaly, orbit_parameters
+from .units import si_value
+
+__all__ = ["SatelliteOrbit", "SATELLITES", "Eclipse", "satellite_position", "eclipses"]
+
+DAY = 86400.0
+JULIAN_YEAR = 365.25 * DAY
+
+
+class SatelliteOrbit(NamedTuple):
+    """Mean circular orbit of a moon around its parent."""
+
+    parent: str  # Name of the parent body
+    a: float  # Orbit radius [m]
+    reference: str  # "equator" or "orbit" of the parent
+    inclination: float  # Inclination to the reference plane [deg]
+    node: float  # Longitude of the ascending node on the reference plane at t = 0 [deg]
+    node_period: float  # Period of the node precession [s], negative for regression, 0 fixed
+
+
+# Mean orbital elements (JPL satellite mean elements); nodes at t = 0 are arbitrary
+SATELLITES: Dict[str, SatelliteOrbit] = {
+    "Moon": SatelliteOrbit("Earth", 384400e3, "orbit", 5.145, 0.0, -18.6 * JULIAN_YEAR),
+    "Europa": SatelliteOrbit("Jupiter", 671100e3, "equator", 0.47, 0.0, 0.0),
+    "Ganymede": SatelliteOrbit("Jupiter", 1070400e3, "equator", 0.20, 0.0, 0.0),
+    "Titan": SatelliteOrbit("Saturn", 1221870e3, "equator", 0.35, 0.0, 0.0),
+    "Triton": SatelliteOrbit("Neptune", 354759e3, "equator", 156.865, 0.0, -688 * JULIAN_YEAR),
+}
+
+
+class Eclipse(NamedTuple):
+    """Shadow state of moons over time."""
+
+    blocked: np.ndarray  # Fraction of the solar disk hidden by the parent
+    umbra: np.ndarray  # Whether the Sun is hidden completely
+    penumbra: np.ndarray  # Whether the Sun is hidden partially
+
+
+def _body(body):
+    if isinstance(body, str):
+        from . import _planets
+
+        return getattr(_planets, body)
+    return body
+
+
+def _frame(moon, t: np.ndarray):
+    """Solar longitude, parent pole and orbit normal of a moon at times `t`.
+
+    Vectors are in the frame of the parent's orbit with x towards its vernal equinox.
+    """
+    p = orbit_parameters(moon)
+    orbit = SATELLITES[moon.name]
+    M = np.mod(2 * np.pi * t / p.year, 2 * np.pi)
+    E = eccentric_anomaly(M, p.eccentricity)
+    e = p.eccentricity
+    nu = 2 * np.arctan2(np.sqrt(1 + e) * np.sin(E / 2), np.sqrt(1 - e) * np.cos(E / 2))
+    r = p.rsm * (1 - e * np.cos(E))
+    Ls = nu + p.Lp
+
+    # The parent's equator meets its orbit at the equinox
+    epsilon = float(si_value(_body(orbit.parent), "obliquity") or 0.0)
+    pole = np.array([0.0, np.sin(epsilon), np.cos(epsilon)])
+    # Basis of the reference plane
+    if orbit.reference == "equator":
+        x_ref, z_ref = np.array([1.0, 0.0, 0.0]), pole
+        y_ref = np.array([0.0, np.cos(epsilon), -np.sin(epsilon)])
+    else:
+        x_ref, y_ref, z_ref = np.eye(3)
+
+    node = np.deg2rad(orbit.node)
+    if orbit.node_period:
+        node = node + 2 * np.pi * t / orbit.node_period
+    inclination = np.deg2rad(orbit.inclination)
+    # Ascending node and normal of the moon's orbit, shape (times, 3)
+    cos_node, sin_node = np.cos(node)[..., None], np.sin(node)[..., None]
+    node_vector = cos_node * x_ref + sin_node * y_ref
+    normal = np.cos(inclination) * z_ref + np.sin(inclination) * (
+        sin_node * x_ref - cos_node * y_ref
+    )
+    sun = np.stack([np.cos(Ls), np.sin(Ls), np.zeros_like(Ls)], axis=-1)
+    return r, sun, pole, node_vector, normal
+
+
+def _broadcast_node(node_vector, normal, shape):
+    return np.broadcast_to(node_vector, shape + (3,)), np.broadcast_to(normal, shape + (3,))
+
+
+def satellite_position(moon, t) -> np.ndarray:
+    """Get the position of a moon relative to its parent.
+
+    Parameters
+    ----------
+    moon : str or Planet
+        One of the moons in SATELLITES
+    t : array_like
+        Time since perihelion passage [s]
+
+    Returns
+    -------
+    np.ndarray
+        Position [m] of shape t.shape + (3,), in the frame of the parent's orbit with x
+        towards its vernal equinox
+    """
+    moon = _body(moon)
+    t = np.asarray(t, dtype=float)
+    return _position(moon, t, *_frame(moon, t))[0]
+
+
+def _position(moon, t, r, sun, pole, node_vector, normal):
+    node_vector, normal = _broadcast_node(node_vector, normal, t.shape)
+    in_plane = np.cross(normal, node_vector)
+    # Argument of latitude of the anti-solar direction, the moon's midnight at t = 0
+    u_night = np.arctan2(-(sun * in_plane).sum(-1), -(sun * node_vector).sum(-1))
+    u = u_night + 2 * np.pi * t / moon.day
+    a = SATELLITES[moon.name].a
+    position = a * (np.cos(u)[..., None] * node_vector + np.sin(u)[..., None] * in_plane)
+    return position, r, sun, pole
+
+
+def _overlap(d, r1, r2):
+    """Area of the intersection of circles of radii r1 and r2 at center distance d."""
+    d = np.maximum(d, 1e-300)
+    with np.errstate(invalid="ignore"):
+        c1 = np.clip((d**2 + r1**2 - r2**2) / (2 * d * r1), -1, 1)
+        c2 = np.clip((d**2 + r2**2 - r1**2) / (2 * d * r2), -1, 1)
+        kite = np.sqrt(
+            np.maximum((-d + r1 + r2) * (d + r1 - r2) * (d - r1 + r2) * (d + r1 + r2), 0)
+        )
+    lens = r1**2 * np.arccos(c1) + r2**2 * np.arccos(c2) - 0.5 * kite
+    area = np.where(d >= r1 + r2, 0.0, lens)
+    return np.where(d <= np.abs(r1 - r2), np.pi * np.minimum(r1, r2) ** 2, area)
+
+
+def _radii_m(name: str) -> np.ndarray:
+    from . import pck_parser
+
+    radii = pck_parser.get_body_radii_by_name(name, pck_parser.load_body_radii())
+    if radii is None:
+        raise ValueError(f"No radii for {name} in the PCK kernel")
+    return np.asarray(radii, dtype=float) * 1000
+
+
+def eclipses(moons: Union[str, object, Sequence], t) -> Eclipse:
+    """Get the shadow state of moons at times `t`.
+
+    Parameters
+    ----------
+    moons : str, Planet or sequence or array of them
+        Moons listed in SATELLITES
+    t : array_like
+        Time since perihelion passage of the moon's heliocentric orbit [s]
+
+    Returns
+    -------
+    Eclipse
+        Arrays of shape (n_moons,) + t.shape, without the moon axis for a single moon.
+        ``blocked.mean(axis=-1)`` is the fraction of sunlight lost over a uniform time
+        series, ``umbra.mean(axis=-1)`` the fraction of time in total eclipse.
+    """
+    if isinstance(moons, np.ndarray):
+        moons = moons.tolist()  # names as str, a single one for a 0-d array
+    single = isinstance(moons, str) or not isinstance(moons, Sequence)
+    bodies = [_body(moon) for moon in ([moons] if single else moons)]
+    for body in bodies:
+        if body.name not in SATELLITES:
+            raise ValueError(f"No satellite orbit for {body.name}")
+    t = np.asarray(t, dtype=float)
+
+    # Geometry per moon, vectorized over time
+    positions, distances, suns, poles, silhouettes = [], [], [], [], []
+    sun_radius = _radii_m("Sun").mean()
+    for body in bodies:
+        position, r, sun, pole = _position(body, t, *_frame(body, t))
+        a, b, c = _radii_m(SATELLITES[body.name].parent)
+        positions.append(position)
+        distances.append(r)
+        suns.append(sun)
+        poles.append(np.broadcast_to(pole, sun.shape))
+        silhouettes.append((np.sqrt(a * b), c))
+
+    # All moons at once, arrays of shape (moons,) + t.shape (+ (3,))
+    position, r, sun, pole = (np.stack(x) for x in (positions, distances, suns, poles))
+    equatorial, polar = (np.array(x).reshape((-1,) + (1,) * t.ndim) for x in zip(*silhouettes))
+    behind = -(position * sun).sum(-1)  # distance behind the parent along the shadow axis
+    offset = position + behind[..., None] * sun  # displacement from the shadow axis
+    # Silhouette: ellipse with the polar semi-axis shortened by the solar declination
+    sin_declination = (sun * pole).sum(-1)
+    pole_direction = pole - sin_declination[..., None] * sun
+    cos_declination = np.sqrt(np.maximum(1 - sin_declination**2, 1e-300))
+    along_pole = (offset * pole_direction).sum(-1) / cos_declination
+    semi_minor = np.sqrt((polar * cos_declination) ** 2 + (equatorial * sin_declination) ** 2)
+    across = np.sqrt(np.maximum((offset**2).sum(-1) - along_pole**2, 0))
+    # Map the ellipse onto a circle of the equatorial radius
+    separation = np.hypot(across, along_pole * equatorial / semi_minor)
+
+    distance = np.sqrt((position**2).sum(-1))
+    parent_size = np.arcsin(np.minimum(equatorial / distance, 1))
+    sun_size = sun_radius / r
+    angle = np.arctan2(separation, behind)
+    blocked = np.where(
+        behind > 0, _overlap(angle, sun_size, parent_size) / (np.pi * sun_size**2), 0
+    )
+    umbra = blocked >= 1 - 1e-12
+    penumbra = (blocked > 0) & ~umbra
+    shadow = Eclipse(np.minimum(blocked, 1.0), umbra, penumbra)
+    return Eclipse(*(x[0] for x in shadow)) if single else shadow
@@ -0,0 +1,231 @@
+"""Analytic mean-element ephemeris of the built-in bodies.
+
+Heliocentric positions of the planets and Pluto follow the approximate Keplerian
+elements and their linear rates of Standish, "Keplerian Elements for Approximate
+Positions of the Major Planets" (JPL, Table 1), fitted to DE405 over 1800-2050 AD.
+Within that span the heliocentric direction is good to the errors in `TOLERANCE`;
+outside it the errors grow slowly.
+
+Earth is the Earth-Moon barycenter minus the Earth's share of the geocentric Moon,
+which follows the mean elements of the lunar orbit (no periodic perturbations, so its
+geocentric direction is only good to about 5 degrees, which moves the Earth by less
+than 500 km). The satellites of the giant planets take the position of their planet:
+their orbital radius is below the error of the planet's elements.
+
+All positions are evaluated as (bodies x epochs) arrays in one vectorized pass::
+
+    positions = heliocentric_position(["Mars", "Jupiter"], jd)  # shape (2, len(jd), 3)
+"""
+
+from typing import Dict, NamedTuple, Sequence, Tuple, Union
+
+import numpy as np
+
+from .constants import AU
+from .illumination import eccentric_anomaly
+
+__all__ = ["MeanElements", "MEAN_ELEMENTS", "TOLERANCE", "mean_elements", "heliocentric_position"]
+
+J2000 = 2451545.0  # Julian date of the J2000 epoch (TDB)
+DAYS_PER_CENTURY = 36525.0
+OBLIQUITY_J2000 = np.deg2rad(23.43928)  # Obliquity of the ecliptic at J2000 [radian]
+EARTH_MOON_MASS_RATIO = 81.30057
+
+
+class MeanElements(NamedTuple):
+    """Keplerian elements at J2000 or their rates per Julian century (au and degrees)."""
+
+    a: float  # Semi-major axis [au]
+    e: float  # Eccentricity
+    I: float  # Inclination [deg]  # noqa: E741
+    L: float  # Mean longitude [deg]
+    varpi: float  # Longitude of perihelion [deg]
+    Omega: float  # Longitude of the ascending node [deg]
+
+
+# Standish, Table 1: elements at J2000 and rates per century, ecliptic and equinox J2000
+MEAN_ELEMENTS: Dict[str, Tuple[MeanElements, MeanElements]] = {
+    "Mercury": (
+        MeanElements(0.38709927, 0.20563593, 7.00497902, 252.25032350, 77.45779628, 48.33076593),
+        MeanElements(0.00000037, 0.00001906, -0.00594749, 149472.67411175, 0.16047689, -0.12534081),
+    ),
+    "Venus": (
+        MeanElements(0.72333566, 0.00677672, 3.39467605, 181.97909950, 131.60246718, 76.67984255),
+        MeanElements(0.00000390, -0.00004107, -0.00078890, 58517.81538729, 0.00268329, -0.27769418),
+    ),
+    "EM Bary": (
+        MeanElements(1.00000261, 0.01671123, -0.00001531, 100.46457166, 102.93768193, 0.0),
+        MeanElements(0.00000562, -0.00004392, -0.01294668, 35999.37244981, 0.32327364, 0.0),
+    ),
+    "Mars": (
+        MeanElements(1.52371034, 0.09339410, 1.84969142, -4.55343205, -23.94362959, 49.55953891),
+        MeanElements(0.00001847, 0.00007882, -0.00813131, 19140.30268499, 0.44441088, -0.29257343),
+    ),
+    "Jupiter": (
+        MeanElements(5.20288700, 0.04838624, 1.30439695, 34.39644051, 14.72847983, 100.47390909),
+        MeanElements(-0.00011607, -0.00013253, -0.00183714, 3034.74612775, 0.21252668, 0.20469106),
+    ),
+    "Saturn": (
+        MeanElements(9.53667594, 0.05386179, 2.48599187, 49.95424423, 92.59887831, 113.66242448),
+        MeanElements(-0.00125060, -0.00050991, 0.00193609, 1222.49362201, -0.41897216, -0.28867794),
+    ),
+    "Uranus": (
+        MeanElements(19.18916464, 0.04725744, 0.77263783, 313.23810451, 170.95427630, 74.01692503),
+        MeanElements(-0.00196176, -0.00004397, -0.00242939, 428.48202785, 0.40805281, 0.04240589),
+    ),
+    "Neptune": (
+        MeanElements(30.06992276, 0.00859048, 1.77004347, -55.12002969, 44.96476227, 131.78422574),
+        MeanElements(0.00026291, 0.00005105, 0.00035372, 218.45945325, -0.32241464, -0.00508664),
+    ),
+    "Pluto": (
+        MeanElements(
+            39.48211675, 0.24882730, 17.14001206, 238.92903833, 224.06891629, 110.30393684
+        ),
+        MeanElements(-0.00031596, 0.00005170, 0.00004818, 145.20780515, -0.04062942, -0.01183482),
+    ),
+}
+
+# Mean elements of the geocentric lunar orbit, referred to the ecliptic (a in au)
+MOON_ELEMENTS = (
+    MeanElements(384400e3 / AU, 0.0549, 5.1453964, 218.3164477, 83.3532465, 125.0445479),
+    MeanElements(0.0, 0.0, 0.0, 481267.88123421, 4069.0137287, -1934.1362891),
+)
+
+# Satellites placed at the position of their planet
+SATELLITE_OF = {"Europa": "Jupiter", "Ganymede": "Jupiter", "Titan": "Saturn", "Triton": "Neptune"}
+
+# Largest error of the heliocentric direction over 1800-2050 [arcsec], as validated
+# against the planetary theory of Simon et al. (1994). The Moon's entry is its
+# geocentric direction, validated against the lunar theory of Meeus (1998). Pluto is
+# not covered by either theory and has no validated tolerance.
+TOLERANCE: Dict[str, float] = {
+    "Mercury": 30.0,
+    "Venus": 30.0,
+    "Earth": 30.0,
+    "Mars": 120.0,
+    "Jupiter": 600.0,
+    "Saturn": 750.0,
+    "Uranus": 180.0,
+    "Neptune": 80.0,
+    "Moon": 5 * 3600.0,
+}
+
+
+def _name(body) -> str:
+    return body if isinstance(body, str) else body.name
+
+
+def mean_elements(name: str, jd) -> MeanElements:
+    """Get the mean elements of a body at Julian dates `jd` (TDB).
+
+    Parameters
+    ----------
+    name : str
+        One of the bodies in MEAN_ELEMENTS, or "Moon" for the geocentric lunar orbit
+    jd : array_like
+        Julian dates
+
+    Returns
+    -------
+    MeanElements
+        The elements, each of the shape of `jd`
+    """
+    elements, rates = MOON_ELEMENTS if name == "Moon" else MEAN_ELEMENTS[name]
+    T = (np.asarray(jd, dtype=float) - J2000) / DAYS_PER_CENTURY
+    return MeanElements(*(value + rate * T for value, rate in zip(elements, rates)))
+
+
+def _orbit_positions(elements: Sequence[Tuple[MeanElements, MeanElements]], jd) -> np.ndarray:
+    """Ecliptic J2000 positions [au] of shape (len(elements), len(jd), 3)."""
+    T = (np.atleast_1d(np.asarray(jd, dtype=float)) - J2000) / DAYS_PER_CENTURY
+    # Element arrays of shape (6, bodies, epochs)
+    at_epoch = np.array([values for values, _ in elements]).T[:, :, None]
+    rates = np.array([values for _, values in elements]).T[:, :, None]
+    a, e, inclination, L, varpi, Omega = at_epoch + rates * T
+    inclination, L, varpi, Omega = np.deg2rad([inclination, L, varpi, Omega])
+
+    omega = varpi - Omega
+    M = np.mod(L - varpi, 2 * np.pi)
+    E = eccentric_anomaly(M, e)
+    x = a * (np.cos(E) - e)
+    y = a * np.sqrt(1 - e**2) * np.sin(E)
+
+    cos_w, sin_w = np.cos(omega), np.sin(omega)
+    cos_O, sin_O = np.cos(Omega), np.sin(Omega)
+    cos_i, sin_i = np.cos(inclination), np.sin(inclination)
+    out = np.empty(a.shape + (3,))
+    out[..., 0] = (cos_w * cos_O - sin_w * sin_O * cos_i) * x
+    out[..., 0] -= (sin_w * cos_O + cos_w * sin_O * cos_i) * y
+    out[..., 1] = (cos_w * sin_O + sin_w * cos_O * cos_i) * x
+    out[..., 1] += (cos_w * cos_O * cos_i - sin_w * sin_O) * y
+    out[..., 2] = sin_w * sin_i * x + cos_w * sin_i * y
+    return out
+
+
+def _to_equatorial(positions: np.ndarray) -> np.ndarray:
+    """Rotate ecliptic J2000 coordinates to equatorial J2000 in place."""
+    cos_e, sin_e = np.cos(OBLIQUITY_J2000), np.sin(OBLIQUITY_J2000)
+    y, z = positions[..., 1].copy(), positions[..., 2].copy()
+    positions[..., 1] = cos_e * y - sin_e * z
+    positions[..., 2] = sin_e * y + cos_e * z
+    return positions
+
+
+def heliocentric_position(
+    bodies: Union[str, object, Sequence], jd, frame: str = "ecliptic", unit: str = "m"
+) -> np.ndarray:
+    """Get heliocentric positions of bodies at Julian dates.
+
+    Parameters
+    ----------
+    bodies : str, Planet or sequence or array of them
+        The bodies, by name or as `Planet` objects. Supported are the planets, Pluto,
+        the Moon and the satellites listed in SATELLITE_OF.
+    jd : array_like
+        Julian dates (TDB)
+    frame : str, optional
+        "ecliptic" or "equatorial", both of the J2000 equinox, by default "ecliptic"
+    unit : str, optional
+        "m" or "au", by default "m"
+
+    Returns
+    -------
+    np.ndarray
+        Positions of shape (n_bodies, n_epochs, 3), without the body axis for a single
+        body and without the epoch axis for a scalar `jd`
+    """
+    if frame not in ("ecliptic", "equatorial"):
+        raise ValueError(f"Unknown frame: {frame}. Use 'ecliptic' or 'equatorial'")
+    if unit not in ("m", "au"):
+        raise ValueError(f"Unknown unit: {unit}. Use 'm' or 'au'")
+    if isinstance(bodies, np.ndarray):
+        bodies = bodies.tolist()  # names as str, a single one for a 0-d array
+    single = isinstance(bodies, str) or not isinstance(bodies, Sequence)
+    names = [_name(body) for body in ([bodies] if single else bodies)]
+    for name in names:
+        if name not in MEAN_ELEMENTS and name not in ("Earth", "Moon") + tuple(SATELLITE_OF):
+            raise ValueError(f"No mean elements for {name}")
+
+    # Each distinct orbit is evaluated once, all of them in one vectorized pass
+    orbit_of = {name: SATELLITE_OF.get(name, name) for name in names}
+    orbits = sorted(set(orbit_of.values()) - {"Earth", "Moon"})
+    needs_moon = any(orbit in ("Earth", "Moon") for orbit in orbit_of.values())
+    if needs_moon:
+        orbits.append("EM Bary")
+    elements = [MEAN_ELEMENTS[orbit] for orbit in orbits]
+    if needs_moon:
+        elements.append(MOON_ELEMENTS)
+    positions = dict(zip(orbits + ["Moon"] * needs_moon, _orbit_positions(elements, jd)))
+    if needs_moon:
+        barycenter, moon = positions["EM Bary"], positions["Moon"]
+        positions["Earth"] = barycenter - moon / (1 + EARTH_MOON_MASS_RATIO)
+        positions["Moon"] = positions["Earth"] + moon
+
+    out = np.stack([positions[orbit_of[name]] for name in names])
+    if frame == "equatorial":
+        _to_equatorial(out)
+    if unit == "m":
+        out *= AU
+    if np.ndim(jd) == 0:
+        out = out[:, 0]
+    return out[0] if single else out
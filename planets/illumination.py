@@ -0,0 +1,301 @@
+"""Subsolar point, incidence angle and insolation maps for whole bodies.
+
+Orbital geometry follows the mean Keplerian orbit described by a `Planet`: time `t` is
+counted in seconds from perihelion passage, the solar longitude is the true anomaly
+plus the longitude of perihelion `Lp`, and local time advances with the mean solar day
+`day`. At ``t = 0`` longitude 0 is at local noon. The solar flux incident on the
+surface is ``S * (rsm / r)**2 * cos(i)``, treating the annual mean solar constant `S`
+as the flux at the semi-major axis.
+
+Maps over (time x latitude x longitude) are produced in chunks along the time axis,
+either as a generator (:func:`iter_illumination`) or into a preallocated array such as
+a `numpy.memmap` (:func:`illumination_cube`), optionally spread across a process
+pool. Memory use is bounded by the chunk size, not by the size of the map.
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from .units import si_value
+
+__all__ = [
+    "OrbitParameters",
+    "orbit_parameters",
+    "eccentric_anomaly",
+    "orbital_state",
+    "subsolar_point",
+    "iter_illumination",
+    "illumination_cube",
+]
+
+# Default upper limit for the size of one chunk of a map [bytes]
+CHUNK_BYTES = 64 * 2**20
+
+
+class OrbitParameters(NamedTuple):
+    """The orbital and rotational elements of a body needed for illumination."""
+
+    S: float  # Annual mean solar constant [W.m-2]
+    rsm: float  # Semi-major axis [m]
+    eccentricity: float  # Orbital eccentricity
+    obliquity: float  # Obliquity to orbit [radian]
+    Lp: float  # Longitude of perihelion [radian]
+    day: float  # Mean length of solar day [s]
+    year: float  # Sidereal length of year [s]
+
+
+def orbit_parameters(body) -> OrbitParameters:
+    """Collect the elements of a `Planet` needed for illumination, in radians.
+
+    Parameters
+    ----------
+    body : Planet
+        The body, with at least `S`, `rsm`, `day`, `year` and `obliquity` set
+
+    Returns
+    -------
+    OrbitParameters
+        The elements, with missing eccentricity and Lp taken as 0
+    """
+    if isinstance(body, OrbitParameters):
+        return body
+    for name in ("S", "rsm", "day", "year", "obliquity"):
+        if getattr(body, name) is None:
+            raise ValueError(f"{body.name} has no value for {name!r}")
+    return OrbitParameters(
+        S=float(body.S),
+        rsm=float(body.rsm),
+        eccentricity=float(body.eccentricity or 0.0),
+        obliquity=float(si_value(body, "obliquity")),
+        Lp=float(si_value(body, "Lp") or 0.0),
+        day=float(body.day),
+        year=float(body.year),
+    )
+
+
+def eccentric_anomaly(M, e) -> np.ndarray:
+    """Solve Kepler's equation E - e sin(E) = M with Newton iterations.
+
+    Parameters
+    ----------
+    M : array_like
+        Mean anomaly [radian]
+    e : float or array_like
+        Eccentricity, below 1, broadcast against `M`
+
+    Returns
+    -------
+    np.ndarray
+        Eccentric anomaly [radian]
+    """
+    M = np.asarray(M, dtype=float)
+    E = M + e * np.sin(M)
+    for _ in range(50):
+        delta = (E - e * np.sin(E) - M) / (1 - e * np.cos(E))
+        E -= delta
+        if np.all(np.abs(delta) < 1e-12):
+            break
+    return E
+
+
+def orbital_state(body, t) -> Tuple[np.ndarray, np.ndarray]:
+    """Get the heliocentric distance and solar declination at times `t`.
+
+    Parameters
+    ----------
+    body : Planet or OrbitParameters
+        The body
+    t : array_like
+        Time since perihelion passage [s]
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Heliocentric distance [m] and solar declination (subsolar latitude) [radian]
+    """
+    p = orbit_parameters(body)
+    M = np.mod(2 * np.pi * np.asarray(t, dtype=float) / p.year, 2 * np.pi)
+    E = eccentric_anomaly(M, p.eccentricity)
+    e = p.eccentricity
+    nu = 2 * np.arctan2(np.sqrt(1 + e) * np.sin(E / 2), np.sqrt(1 - e) * np.cos(E / 2))
+    r = p.rsm * (1 - e * np.cos(E))
+    declination = np.arcsin(np.sin(p.obliquity) * np.sin(nu + p.Lp))
+    return r, declination
+
+
+def subsolar_point(body, t) -> Tuple[np.ndarray, np.ndarray]:
+    """Get the subsolar latitude and longitude at times `t`.
+
+    Parameters
+    ----------
+    body : Planet or OrbitParameters
+        The body
+    t : array_like
+        Time since perihelion passage [s]
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Subsolar latitude and longitude [deg], longitude in [-180, 180)
+    """
+    p = orbit_parameters(body)
+    _, declination = orbital_state(p, t)
+    longitude = -360.0 * np.asarray(t, dtype=float) / p.day
+    longitude = np.mod(longitude + 180.0, 360.0) - 180.0
+    return np.rad2deg(declination), longitude
+
+
+def _illumination_chunk(p, latitude, longitude, t, quantity, dtype, out=None):
+    """Compute the flux or incidence cosine for one chunk of times."""
+    r, declination = orbital_state(p, t)
+    hour_angle = 2 * np.pi * t[:, None] / p.day + np.deg2rad(longitude)[None, :]
+
+    phi = np.deg2rad(latitude)
+    if out is None:
+        out = np.empty((t.size, phi.size, hour_angle.shape[1]), dtype=dtype)
+    # cos(i) = sin(phi) sin(dec) + cos(phi) cos(dec) cos(h), built in place in `out`
+    cos_h = np.cos(hour_angle) * np.cos(declination)[:, None]
+    np.multiply(np.cos(phi)[None, :, None], cos_h[:, None, :], out=out)
+    out += np.sin(phi)[None, :, None] * np.sin(declination)[:, None, None]
+    np.maximum(out, 0, out=out)
+    if quantity == "flux":
+        out *= (p.S * (p.rsm / r) ** 2)[:, None, None]
+    return out
+
+
+def _chunk_steps(n_lat: int, n_lon: int, dtype, chunk_bytes: int) -> int:
+    return max(1, chunk_bytes // (n_lat * n_lon * np.dtype(dtype).itemsize))
+
+
+def iter_illumination(
+    body,
+    latitude,
+    longitude,
+    t,
+    quantity: str = "flux",
+    dtype=np.float64,
+    chunk_size: Optional[int] = None,
+    processes: Optional[int] = None,
+) -> Iterator[Tuple[slice, np.ndarray]]:
+    """Generate an illumination map over (time x latitude x longitude) chunk by chunk.
+
+    Parameters
+    ----------
+    body : Planet or OrbitParameters
+        The body
+    latitude, longitude : array_like
+        1-D grids of latitude and east longitude [deg]
+    t : array_like
+        1-D array of times since perihelion passage [s]
+    quantity : str, optional
+        "flux" for the incident solar flux [W.m-2] or "cos_incidence" for the cosine
+        of the solar incidence angle, both 0 at night, by default "flux"
+    dtype : numpy dtype, optional
+        Data type of the chunks, by default float64
+    chunk_size : int, optional
+        Number of time steps per chunk, by default as many as fit in 64 MiB
+    processes : int, optional
+        Number of worker processes, by default the chunks are computed in this process
+
+    Yields
+    ------
+    Tuple[slice, np.ndarray]
+        The time slice covered and the map chunk of shape (len(slice), nlat, nlon)
+    """
+    if quantity not in ("flux", "cos_incidence"):
+        raise ValueError(f"Unknown quantity: {quantity}. Use 'flux' or 'cos_incidence'")
+    p = orbit_parameters(body)
+    latitude = np.atleast_1d(np.asarray(latitude, dtype=float))
+    longitude = np.atleast_1d(np.asarray(longitude, dtype=float))
+    t = np.atleast_1d(np.asarray(t, dtype=float))
+    if chunk_size is None:
+        chunk_size = _chunk_steps(latitude.size, longitude.size, dtype, CHUNK_BYTES)
+    slices = [slice(i, min(i + chunk_size, t.size)) for i in range(0, t.size, chunk_size)]
+
+    if not processes:
+        for chunk in slices:
+            yield chunk, _illumination_chunk(p, latitude, longitude, t[chunk], quantity, dtype)
+        return
+
+    # Keep a bounded number of chunks in flight so memory stays bounded too
+    with ProcessPoolExecutor(processes) as executor:
+        pending = deque()
+        for chunk in slices:
+            args = (p, latitude, longitude, t[chunk], quantity, dtype)
+            pending.append((chunk, executor.submit(_illumination_chunk, *args)))
+            if len(pending) >= 2 * processes:
+                done, future = pending.popleft()
+                yield done, future.result()
+        while pending:
+            done, future = pending.popleft()
+            yield done, future.result()
+
+
+def illumination_cube(
+    body,
+    latitude,
+    longitude,
+    t,
+    quantity: str = "flux",
+    out: Optional[np.ndarray] = None,
+    dtype=np.float64,
+    chunk_size: Optional[int] = None,
+    processes: Optional[int] = None,
+) -> np.ndarray:
+    """Compute an illumination map over (time x latitude x longitude) into an array.
+
+    Parameters
+    ----------
+    body : Planet or OrbitParameters
+        The body
+    latitude, longitude : array_like
+        1-D grids of latitude and east longitude [deg]
+    t : array_like
+        1-D array of times since perihelion passage [s]
+    quantity : str, optional
+        "flux" or "cos_incidence", see iter_illumination(), by default "flux"
+    out : np.ndarray, optional
+        Preallocated array of shape (nt, nlat, nlon), for example a `numpy.memmap` for
+        maps larger than memory. Its dtype takes precedence over `dtype`.
+    dtype : numpy dtype, optional
+        Data type of the result when `out` is not given, by default float64
+    chunk_size : int, optional
+        Number of time steps per chunk, by default as many as fit in 64 MiB
+    processes : int, optional
+        Number of worker processes, by default the map is computed in this process
+
+    Returns
+    -------
+    np.ndarray
+        The map, `out` if it was given
+    """
+    if quantity not in ("flux", "cos_incidence"):
+        raise ValueError(f"Unknown quantity: {quantity}. Use 'flux' or 'cos_incidence'")
+    shape = (np.size(t), np.size(latitude), np.size(longitude))
+    if out is None:
+        out = np.empty(shape, dtype=dtype)
+    elif out.shape != shape:
+        raise ValueError(f"out has shape {out.shape}, expected {shape}")
+
+    if not processes:
+        # Compute straight into the output, without temporary chunk arrays
+        p = orbit_parameters(body)
+        latitude = np.atleast_1d(np.asarray(latitude, dtype=float))
+        longitude = np.atleast_1d(np.asarray(longitude, dtype=float))
+        t = np.atleast_1d(np.asarray(t, dtype=float))
+        if chunk_size is None:
+            chunk_size = _chunk_steps(shape[1], shape[2], out.dtype, CHUNK_BYTES)
+        for i in range(0, shape[0], chunk_size):
+            chunk = slice(i, min(i + chunk_size, shape[0]))
+            _illumination_chunk(p, latitude, longitude, t[chunk], quantity, out.dtype, out[chunk])
+        return out
+
+    chunks = iter_illumination(
+        body, latitude, longitude, t, quantity, out.dtype, chunk_size, processes
+    )
+    for chunk, values in chunks:
+        out[chunk] = values
+    return out
@@ -0,0 +1,189 @@
+"""Indexes over `BodyTable` columns for range and nearest-neighbour queries.
+
+:class:`SortedIndex` keeps the rows of one column in sorted order, so that range
+queries are two binary searches. :class:`KDTree` partitions the rows by several
+columns for k-nearest-neighbour queries. Both grow incrementally: new rows are merged
+into a sorted index without re-sorting, and collected in a small buffer next to a
+KD-tree that is only rebuilt once the buffer reaches a fraction of the tree size.
+
+The indexes are created lazily by `BodyTable.select()` and `BodyTable.nearest()` and
+kept up to date by `BodyTable.append()`. Rows with NaN in an indexed column are left
+out of the index.
+"""
+
+import heapq
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+__all__ = ["SortedIndex", "KDTree"]
+
+
+class SortedIndex:
+    """Rows of one column sorted by value.
+
+    Parameters
+    ----------
+    values : array_like
+        The column
+    rows : array_like, optional
+        Row number of each value, by default 0, 1, 2, ...
+    """
+
+    def __init__(self, values, rows=None):
+        self.values = np.empty(0)
+        self.rows = np.empty(0, dtype=np.intp)
+        self.extend(values, rows)
+
+    def __len__(self):
+        return self.values.size
+
+    def extend(self, values, rows=None):
+        """Merge further rows into the index."""
+        values = np.asarray(values, dtype=float)
+        if rows is None:
+            rows = np.arange(values.size)
+        keep = ~np.isnan(values)
+        values, rows = values[keep], np.asarray(rows, dtype=np.intp)[keep]
+        order = np.argsort(values, kind="stable")
+        values, rows = values[order], rows[order]
+        # New values go after existing equal ones, so the merge keeps insertion order
+        positions = np.searchsorted(self.values, values, side="right")
+        self.values = np.insert(self.values, positions, values)
+        self.rows = np.insert(self.rows, positions, rows)
+
+    def range(self, low: Optional[float] = None, high: Optional[float] = None) -> np.ndarray:
+        """Get the rows with values in [low, high], in increasing order of value.
+
+        Parameters
+        ----------
+        low, high : float, optional
+            Inclusive bounds, by default unbounded
+
+        Returns
+        -------
+        np.ndarray
+            Row numbers
+        """
+        start = 0 if low is None else np.searchsorted(self.values, low, side="left")
+        stop = self.values.size if high is None else np.searchsorted(self.values, high, "right")
+        return self.rows[start:stop]
+
+
+class KDTree:
+    """KD-tree over points for k-nearest-neighbour queries, with incremental inserts.
+
+    Parameters
+    ----------
+    points : array_like
+        Coordinates of shape (n, d)
+    rows : array_like, optional
+        Row number of each point, by default 0, 1, 2, ...
+    leaf_size : int, optional
+        Maximum number of points per leaf, by default 32
+    """
+
+    def __init__(self, points, rows=None, leaf_size: int = 32):
+        points = np.atleast_2d(np.asarray(points, dtype=float))
+        self.leaf_size = leaf_size
+        self.dimensions = points.shape[1]
+        self._pending_points = np.empty((0, self.dimensions))
+        self._pending_rows = np.empty(0, dtype=np.intp)
+        self._build(*self._finite(points, rows))
+
+    def __len__(self):
+        return self.points.shape[0] + self._pending_points.shape[0]
+
+    @staticmethod
+    def _finite(points, rows):
+        if rows is None:
+            rows = np.arange(points.shape[0])
+        keep = ~np.isnan(points).any(axis=1)
+        return points[keep], np.asarray(rows, dtype=np.intp)[keep]
+
+    def _build(self, points: np.ndarray, rows: np.ndarray):
+        order = np.arange(points.shape[0])
+        # Nodes as [start, stop, box_low, box_high, left, right], leaves have left == -1
+        nodes: List[list] = []
+
+        def build(start, stop):
+            index = order[start:stop]
+            low, high = points[index].min(axis=0), points[index].max(axis=0)
+            node = len(nodes)
+            nodes.append([start, stop, low, high, -1, -1])
+            if stop - start > self.leaf_size:
+                dimension = np.argmax(high - low)
+                middle = (start + stop) // 2
+                split = np.argpartition(points[index, dimension], middle - start)
+                order[start:stop] = index[split]
+                nodes[node][4] = build(start, middle)
+                nodes[node][5] = build(middle, stop)
+            return node
+
+        if points.shape[0]:
+            build(0, points.shape[0])
+        self._nodes = nodes
+        self.points = points[order]
+        self.rows = rows[order]
+
+    def extend(self, points, rows):
+        """Add points, rebuilding the tree once a quarter of the points are new."""
+        points, rows = self._finite(np.atleast_2d(np.asarray(points, dtype=float)), rows)
+        self._pending_points = np.concatenate([self._pending_points, points])
+        self._pending_rows = np.concatenate([self._pending_rows, rows])
+        if self._pending_rows.size > max(self.leaf_size, self.rows.size // 4):
+            self._build(
+                np.concatenate([self.points, self._pending_points]),
+                np.concatenate([self.rows, self._pending_rows]),
+            )
+            self._pending_points = np.empty((0, self.dimensions))
+            self._pending_rows = np.empty(0, dtype=np.intp)
+
+    @staticmethod
+    def _merge(best, distances, rows, k):
+        distances = np.concatenate([best[0], distances])
+        rows = np.concatenate([best[1], rows])
+        if distances.size > k:
+            keep = np.argpartition(distances, k - 1)[:k]
+            distances, rows = distances[keep], rows[keep]
+        return distances, rows
+
+    def query(self, point: Sequence[float], k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the k points nearest to `point`.
+
+        Parameters
+        ----------
+        point : sequence of float
+            Coordinates of the query point
+        k : int, optional
+            Number of neighbours, by default 1
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Euclidean distances and row numbers of the neighbours, nearest first
+        """
+        x = np.asarray(point, dtype=float)
+        # Squared distances and rows of the best candidates, starting with the buffer
+        pending = ((self._pending_points - x) ** 2).sum(axis=1)
+        best = self._merge(
+            (np.empty(0), np.empty(0, dtype=np.intp)), pending, self._pending_rows, k
+        )
+
+        heap = [(0.0, 0)] if self._nodes else []
+        while heap:
+            box_distance, node = heapq.heappop(heap)
+            if best[0].size == k and box_distance > best[0].max():
+                break
+            start, stop, _, _, left, right = self._nodes[node]
+            if left < 0:
+                distances = ((self.points[start:stop] - x) ** 2).sum(axis=1)
+                best = self._merge(best, distances, self.rows[start:stop], k)
+                continue
+            for child in (left, right):
+                low, high = self._nodes[child][2], self._nodes[child][3]
+                gap = np.maximum(low - x, 0) + np.maximum(x - high, 0)
+                heapq.heappush(heap, (float(gap @ gap), child))
+
+        order = np.argsort(best[0], kind="stable")
+        return np.sqrt(best[0][order]), best[1][order]
@@ -0,0 +1,159 @@
+"""Opt-in instrumentation of kernel loading and body lookups.
+
+Instrumentation is disabled by default and costs a single flag check per
+instrumented call in that state. Enable it with :func:`enable` (or by setting the
+``PLANETS_STATS`` environment variable) and read the collected counters and timing
+histograms with :func:`stats`, which is also available as ``planets.stats()``.
+
+Events recorded by the package:
+
+- ``parse``: time spent in ``pck_parser.parse_pck_file``
+- ``extract_radii``: time spent in ``pck_parser.extract_body_radii``
+- ``lookup``: time spent in ``pck_parser.get_body_radii_by_name``
+- ``lookup.exact``, ``lookup.alias``, ``lookup.fuzzy``, ``lookup.miss``: lookup path taken
+- ``cache.hit``, ``cache.miss``: parsed kernel cache accesses
+- ``kernel.bytes_read``: number of bytes of kernel data sections parsed
+- ``load.shared``: async kernel loads joining a load already in progress
+- ``results.hit``, ``results.miss``: lookups in a ``planets.cache.ResultCache``
+"""
+
+import bisect
+import functools
+import os
+import threading
+from time import perf_counter
+from typing import Any, Callable, Dict, Optional
+
+__all__ = ["enable", "disable", "is_enabled", "reset", "stats", "set_trace_hook", "timed"]
+
+enabled = bool(os.environ.get("PLANETS_STATS"))
+
+# Upper bounds of the histogram buckets in seconds, one per decade from 1 µs to 10 s
+BUCKET_BOUNDS = [10.0**exponent for exponent in range(-6, 2)]
+
+_lock = threading.Lock()
+_counters: Dict[str, int] = {}
+_histograms: Dict[str, "Histogram"] = {}
+_trace_hook: Optional[Callable[[str, Optional[float], Dict[str, Any]], None]] = None
+
+
+class Histogram:
+    """Timing histogram with one bucket per decade of seconds."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self.buckets = [0] * (len(BUCKET_BOUNDS) + 1)
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS, seconds)] += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        labels = [f"<={bound:g}s" for bound in BUCKET_BOUNDS] + [f">{BUCKET_BOUNDS[-1]:g}s"]
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "buckets": dict(zip(labels, self.buckets)),
+        }
+
+
+def enable():
+    """Start collecting counters and timings."""
+    global enabled
+    enabled = True
+
+
+def disable():
+    """Stop collecting counters and timings. Collected values are kept."""
+    global enabled
+    enabled = False
+
+
+def is_enabled() -> bool:
+    """Whether instrumentation is currently collecting."""
+    return enabled
+
+
+def reset():
+    """Discard all collected counters and timings."""
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+
+
+def set_trace_hook(hook: Optional[Callable[[str, Optional[float], Dict[str, Any]], None]]):
+    """Install a hook called for every recorded event while instrumentation is enabled.
+
+    Parameters
+    ----------
+    hook : callable or None
+        Called as ``hook(event, duration, info)``. ``duration`` is the elapsed time in
+        seconds for timed events and None for counter events, ``info`` holds the counter
+        increment or extra details. Pass None to remove the hook.
+    """
+    global _trace_hook
+    _trace_hook = hook
+
+
+def count(event: str, n: int = 1, **info):
+    """Increment the counter `event` by `n`. Callers check `enabled` first."""
+    with _lock:
+        _counters[event] = _counters.get(event, 0) + n
+    if _trace_hook is not None:
+        _trace_hook(event, None, dict(info, n=n))
+
+
+def observe(event: str, seconds: float, **info):
+    """Record a duration for `event`. Callers check `enabled` first."""
+    with _lock:
+        histogram = _histograms.get(event)
+        if histogram is None:
+            histogram = _histograms[event] = Histogram()
+        histogram.add(seconds)
+    if _trace_hook is not None:
+        _trace_hook(event, seconds, info)
+
+
+def timed(event: str):
+    """Decorator recording the run time of the wrapped function as `event`."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return func(*args, **kwargs)
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                observe(event, perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+def stats() -> Dict[str, Any]:
+    """Get a snapshot of the collected instrumentation data.
+
+    Returns
+    -------
+    Dict[str, Any]
+        ``{"enabled": bool, "counters": {event: int}, "timings": {event: histogram}}``
+        where each histogram is a dict with count, total, mean, min, max and buckets
+    """
+    with _lock:
+        return {
+            "enabled": enabled,
+            "counters": dict(_counters),
+            "timings": {event: h.as_dict() for event, h in _histograms.items()},
+        }
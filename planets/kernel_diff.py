@@ -0,0 +1,237 @@
+"""Differences between two versions of a text kernel.
+
+Both kernels are read through their `KernelIndex` (see planets.kernel_index), whose
+keys are sorted, so the keys of both are compared in one merging pass over the two
+lists. Parsed kernels and their indexes are cached by pck_parser while the files are
+unchanged, and the differences of the last pairs of kernels are kept as well, so a
+repeated diff costs a dictionary lookup::
+
+    diff = kernel_diff.diff_kernels("pck00010.tpc", "pck00011.tpc", quantity="RADII")
+    for key, change in diff.changed.items():
+        print(key, change.max_delta)
+    diff.bodies()  # body IDs with any difference
+
+Numeric values (scalars or arrays of equal length) get element-wise deltas
+``new - old``; other changes, e.g. of strings or array lengths, have a delta of None.
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from .kernel_index import NO_ID, KernelIndex
+
+__all__ = ["Change", "KernelDiff", "diff_indexes", "diff_kernels", "format_diff"]
+
+# Number of kernel pairs whose differences are kept
+CACHE_SIZE = 16
+
+_diffs: "OrderedDict[tuple, Tuple[KernelIndex, KernelIndex, KernelDiff]]" = OrderedDict()
+
+
+class Change(NamedTuple):
+    """A key whose value differs between the kernels."""
+
+    old: Any
+    new: Any
+    delta: Optional[List[float]]  # new - old per element, None if not numeric
+    max_delta: Optional[float]  # Largest absolute element of delta
+    max_relative: Optional[float]  # Largest absolute delta relative to the old value
+
+
+class KernelDiff(NamedTuple):
+    """Differences from an old to a new kernel, by key in lexicographic order."""
+
+    changed: Dict[str, Change]
+    added: Dict[str, Any]  # Keys only in the new kernel with their values
+    removed: Dict[str, Any]  # Keys only in the old kernel with their values
+    body_ids: Dict[str, int]  # Body ID of every key above that has one
+
+    def __bool__(self):
+        return bool(self.changed or self.added or self.removed)
+
+    def bodies(self) -> List[int]:
+        """Get the body IDs with a changed, added or removed key, in increasing order."""
+        return sorted(set(self.body_ids.values()))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the differences as plain data ready for JSON."""
+        return {
+            "changed": {key: change._asdict() for key, change in self.changed.items()},
+            "added": self.added,
+            "removed": self.removed,
+            "bodies": self.bodies(),
+        }
+
+
+_NUMERIC = {int, float}
+
+
+def _changes(pairs: List[Tuple[str, Any, Any]], atol: float) -> Dict[str, Change]:
+    """Get the changes of keys with unequal values, deltas computed per array length."""
+    changes: Dict[str, Change] = {}
+    by_length: Dict[int, List[Tuple[str, Any, Any]]] = {}
+    for key, old, new in pairs:
+        a = old if isinstance(old, list) else [old]
+        b = new if isinstance(new, list) else [new]
+        if len(a) == len(b) and _NUMERIC.issuperset(map(type, a + b)):
+            by_length.setdefault(len(a), []).append((key, old, new))
+        else:
+            changes[key] = Change(old, new, None, None, None)
+
+    for group in by_length.values():
+        a = np.array([pair[1] for pair in group], dtype=float).reshape(len(group), -1)
+        b = np.array([pair[2] for pair in group], dtype=float).reshape(len(group), -1)
+        delta = b - a
+        size = np.abs(delta)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            relative = np.where(delta == 0, 0.0, size / np.abs(a)).max(axis=1)
+        rows = zip(group, delta.tolist(), size.max(axis=1).tolist(), relative.tolist())
+        for (key, old, new), key_delta, max_delta, max_relative in rows:
+            if max_delta > atol:
+                changes[key] = Change(old, new, key_delta, max_delta, max_relative)
+    return {key: changes[key] for key, _, _ in pairs if key in changes}
+
+
+def _rows(
+    index: KernelIndex, prefix: Optional[str], body: Optional[Tuple[int, int]], quantity
+) -> Union[slice, np.ndarray]:
+    """Rows of the keys to compare, in key order."""
+    rows: Union[slice, np.ndarray] = slice(None) if prefix is None else index.prefix(prefix)
+    if body is None and quantity is None:
+        return rows
+    selected = np.arange(len(index))[rows]
+    if body is not None:
+        selected = np.intersect1d(selected, index.bodies(*body))
+    if quantity is not None:
+        selected = np.intersect1d(selected, index.quantity(quantity))
+    return selected
+
+
+def diff_indexes(
+    old: KernelIndex,
+    new: KernelIndex,
+    prefix: Optional[str] = None,
+    body: Optional[Union[int, Tuple[int, int]]] = None,
+    quantity: Optional[str] = None,
+    atol: float = 0.0,
+) -> KernelDiff:
+    """Compare two kernel indexes in one pass over their sorted keys.
+
+    See diff_kernels() for the parameters.
+    """
+    if isinstance(body, int):
+        body = (body, body)
+    old_rows, new_rows = (_rows(index, prefix, body, quantity) for index in (old, new))
+    old_keys, new_keys = old.keys_of(old_rows), new.keys_of(new_rows)
+    old_positions = np.arange(len(old))[old_rows].tolist()
+    new_positions = np.arange(len(new))[new_rows].tolist()
+    old_ids, new_ids = old.body_ids.tolist(), new.body_ids.tolist()
+
+    added: Dict[str, Any] = {}
+    removed: Dict[str, Any] = {}
+    unequal: List[Tuple[str, Any, Any]] = []
+    body_ids: Dict[str, int] = {}
+    i = j = 0
+    while i < len(old_keys) or j < len(new_keys):
+        if j == len(new_keys) or (i < len(old_keys) and old_keys[i] < new_keys[j]):
+            key, row, ids = old_keys[i], old_positions[i], old_ids
+            removed[key] = old.values[row]
+            i += 1
+        elif i == len(old_keys) or new_keys[j] < old_keys[i]:
+            key, row, ids = new_keys[j], new_positions[j], new_ids
+            added[key] = new.values[row]
+            j += 1
+        else:
+            key, row, ids = new_keys[j], new_positions[j], new_ids
+            old_value, new_value = old.values[old_positions[i]], new.values[row]
+            i += 1
+            j += 1
+            if old_value == new_value:
+                continue
+            unequal.append((key, old_value, new_value))
+        if ids[row] != NO_ID:
+            body_ids[key] = ids[row]
+
+    changed = _changes(unequal, atol)
+    if len(changed) < len(unequal):
+        # Keys whose changes are within atol
+        body_ids = {
+            key: body_id
+            for key, body_id in body_ids.items()
+            if key in changed or key in added or key in removed
+        }
+    return KernelDiff(changed, added, removed, body_ids)
+
+
+def diff_kernels(
+    old: Union[str, Path],
+    new: Union[str, Path],
+    prefix: Optional[str] = None,
+    body: Optional[Union[int, Tuple[int, int]]] = None,
+    quantity: Optional[str] = None,
+    atol: float = 0.0,
+) -> KernelDiff:
+    """Compare two text kernels.
+
+    Parameters
+    ----------
+    old, new : str or Path
+        Paths to the kernels
+    prefix : str, optional
+        Only compare keys starting with it, e.g. "BODY399_"
+    body : int or (int, int), optional
+        Only compare keys of a body ID or of an inclusive range of them, e.g.
+        (600, 699) for Saturn's system
+    quantity : str, optional
+        Only compare ``BODY<ID>_<quantity>`` keys, e.g. "RADII" or "POLE_RA"
+    atol : float, optional
+        Numeric changes no element of which exceeds it in absolute value are ignored,
+        by default 0
+
+    Returns
+    -------
+    KernelDiff
+        The differences, shared with later calls for the same unchanged kernels; it
+        must not be modified
+    """
+    from . import pck_parser
+
+    old_index, new_index = pck_parser.load_kernel_index(old), pck_parser.load_kernel_index(new)
+    key = (id(old_index), id(new_index), prefix, body, quantity, atol)
+    cached = _diffs.get(key)
+    if cached is not None and cached[0] is old_index and cached[1] is new_index:
+        _diffs.move_to_end(key)
+        return cached[2]
+    diff = diff_indexes(old_index, new_index, prefix, body, quantity, atol)
+    _diffs[key] = (old_index, new_index, diff)
+    while len(_diffs) > CACHE_SIZE:
+        _diffs.popitem(last=False)
+    return diff
+
+
+def _short(value, width: int = 60) -> str:
+    text = " ".join(map(str, value)) if isinstance(value, list) else str(value)
+    return text if len(text) <= width else text[: width - 3] + "..."
+
+
+def format_diff(diff: KernelDiff) -> str:
+    """Format differences as text, one key per line."""
+    lines = []
+    for key, change in diff.changed.items():
+        if change.max_delta is None:
+            lines.append(f"~ {key}: {_short(change.old)} -> {_short(change.new)}")
+        else:
+            lines.append(
+                f"~ {key}: max |delta| {change.max_delta:.6g}"
+                f" ({change.max_relative:.3g} relative), {_short(change.new)}"
+            )
+    lines += [f"+ {key}: {_short(value)}" for key, value in diff.added.items()]
+    lines += [f"- {key}: {_short(value)}" for key, value in diff.removed.items()]
+    lines.append(
+        f"{len(diff.changed)} changed, {len(diff.added)} added, {len(diff.removed)} removed"
+        f" keys of {len(diff.bodies())} bodies"
+    )
+    return "\n".join(lines) + "\n"
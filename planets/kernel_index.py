@@ -0,0 +1,122 @@
+"""Structured index of the keys of a text kernel.
+
+Kernel variable names such as ``BODY399_RADII``, ``BODY5_NUT_PREC_ANGLES`` or
+``FRAME_-82000_NAME`` follow the pattern ``<prefix><ID>_<quantity>``. `KernelIndex`
+splits every key once into prefix, body ID, quantity and suffix (the last
+underscore-separated word of the quantity) and keeps row numbers grouped and sorted
+by each of them. Queries then return slices of those arrays and cost time in the size
+of the result, not of the kernel::
+
+    index = pck_parser.load_kernel_index()
+    index.values_by_body("GM")            # {399: [398600.4...], ...}
+    index.keys_of(index.bodies(600, 699))  # every key of Saturn's system
+"""
+
+import bisect
+import re
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+__all__ = ["KernelIndex"]
+
+_KEY = re.compile(r"([A-Z]+?)_?(-?\d+)_(.+)")
+
+# Body ID of keys without one
+NO_ID = np.iinfo(np.int64).min
+
+
+class KernelIndex:
+    """Index of the keys of a parsed kernel.
+
+    Parameters
+    ----------
+    constants : Dict[str, Any]
+        Constants as returned by `pck_parser.parse_pck_file()`
+
+    Attributes
+    ----------
+    keys : List[str]
+        All keys in lexicographic order; row numbers refer to this list
+    values : List[Any]
+        Value of each key
+    body_ids : np.ndarray
+        Body ID of each key, NO_ID for keys without one
+    """
+
+    def __init__(self, constants: Dict[str, Any]):
+        self.keys: List[str] = sorted(constants)
+        self.values: List[Any] = [constants[key]["value"] for key in self.keys]
+        n = len(self.keys)
+        self.prefixes: List[Optional[str]] = [None] * n
+        self.quantities: List[Optional[str]] = [None] * n
+        self.body_ids = np.full(n, NO_ID, dtype=np.int64)
+
+        by_quantity: Dict[str, List[int]] = {}
+        by_suffix: Dict[str, List[int]] = {}
+        for row, key in enumerate(self.keys):
+            match = _KEY.fullmatch(key)
+            if match is None:
+                continue
+            prefix, body_id, quantity = match.groups()
+            self.prefixes[row] = prefix
+            self.quantities[row] = quantity
+            self.body_ids[row] = int(body_id)
+            by_quantity.setdefault(f"{prefix}:{quantity}", []).append(row)
+            by_suffix.setdefault(quantity.rsplit("_", 1)[-1], []).append(row)
+
+        with_id = np.flatnonzero(self.body_ids != NO_ID)
+        order = np.argsort(self.body_ids[with_id], kind="stable")
+        self._body_rows = with_id[order]
+        self._sorted_ids = self.body_ids[self._body_rows]
+        self._by_quantity = {key: np.array(rows) for key, rows in by_quantity.items()}
+        self._by_suffix = {key: np.array(rows) for key, rows in by_suffix.items()}
+
+    def __len__(self):
+        return len(self.keys)
+
+    def prefix(self, prefix: str) -> slice:
+        """Get the rows of all keys starting with `prefix`, e.g. "BODY6"."""
+        start = bisect.bisect_left(self.keys, prefix)
+        stop = bisect.bisect_left(self.keys, prefix + "\U0010ffff", start)
+        return slice(start, stop)
+
+    def bodies(self, low: int, high: Optional[int] = None) -> np.ndarray:
+        """Get the rows of all keys of body IDs in [low, high], ordered by body ID.
+
+        Parameters
+        ----------
+        low : int
+            Smallest body ID
+        high : int, optional
+            Largest body ID, by default `low`
+
+        Returns
+        -------
+        np.ndarray
+            Row numbers, a view of the index
+        """
+        high = low if high is None else high
+        start = np.searchsorted(self._sorted_ids, low, side="left")
+        stop = np.searchsorted(self._sorted_ids, high, side="right")
+        return self._body_rows[start:stop]
+
+    def quantity(self, quantity: str, prefix: str = "BODY") -> np.ndarray:
+        """Get the rows of a quantity for all IDs, e.g. "RADII" or "NUT_PREC_RA"."""
+        return self._by_quantity.get(f"{prefix}:{quantity}", np.empty(0, dtype=np.intp))
+
+    def suffix(self, suffix: str) -> np.ndarray:
+        """Get the rows of all keys ending in ``_<suffix>``, e.g. "GM" or "RA"."""
+        return self._by_suffix.get(suffix, np.empty(0, dtype=np.intp))
+
+    def keys_of(self, rows) -> List[str]:
+        """Get the keys of rows returned by a query."""
+        if isinstance(rows, slice):
+            return self.keys[rows]
+        return [self.keys[row] for row in rows]
+
+    def values_by_body(self, quantity: str, prefix: str = "BODY") -> Dict[int, Any]:
+        """Get the values of a quantity by body ID, e.g. all radii or GMs of the kernel."""
+        return {
+            int(self.body_ids[row]): self.values[row] for row in self.quantity(quantity, prefix)
+        }
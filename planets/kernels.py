@@ -0,0 +1,251 @@
+"""Manifest-driven registry of SPICE kernels.
+
+The kernels the package may use are listed in a registry file in pooch's format, one
+line per kernel with its path relative to the base URL, its hash and optionally its
+full URL. The package ships ``kernels.txt`` with the PCK kernel; other sets (GM, mission
+frames kernels, ...) are described by registry files of the same format.
+
+Kernels are downloaded with :class:`ResumableDownloader`, which continues interrupted
+transfers where they stopped, and verified against their sha256 hash by pooch before
+they are used. Instead of NAIF they can be fetched from a mirror, any HTTP(S) or
+``file://`` URL with the same directory layout, given as `mirror` or in the
+``PLANETS_KERNEL_MIRROR`` environment variable::
+
+    registry = KernelRegistry("mission.txt", mirror="file:///data/naif")
+    registry.prefetch()  # all kernels, concurrently
+    constants = registry.load_constants()
+    registry.source_of("BODY399_RADII")  # {"name": "pck/pck00011.tpc", ...}
+"""
+
+import os
+import shutil
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+__all__ = ["KernelRegistry", "ResumableDownloader", "default_registry", "PCK_NAME"]
+
+DEFAULT_REGISTRY = Path(__file__).with_name("kernels.txt")
+DEFAULT_BASE_URL = "https://naif.jpl.nasa.gov/pub/naif/generic_kernels/"
+MIRROR_ENV = "PLANETS_KERNEL_MIRROR"
+CACHE_ENV = "PLANETS_KERNEL_CACHE"
+
+# Name of the PCK kernel in the default registry
+PCK_NAME = "pck/pck00011.tpc"
+
+# File extensions of text kernels, the only ones load_constants() parses
+TEXT_KERNEL_EXTENSIONS = (".tpc", ".tf", ".ti", ".tls", ".tsc", ".tm")
+
+_default_registry: Optional["KernelRegistry"] = None
+
+
+class ResumableDownloader:
+    """pooch downloader that resumes interrupted transfers.
+
+    Data is appended to a ``.part`` file next to the cached kernel, and a new attempt
+    (in this or a later process) requests only the missing bytes with an HTTP Range
+    header. Servers and ``file://`` URLs without range support restart the transfer, as
+    does a part longer than the file; a part that is already complete is kept.
+
+    Parameters
+    ----------
+    retries : int, optional
+        Number of further attempts after a failed transfer, by default 3
+    timeout : float, optional
+        Socket timeout [s], by default 30
+    chunk_size : int, optional
+        Bytes copied at a time, by default 1 MiB
+    """
+
+    def __init__(self, retries: int = 3, timeout: float = 30, chunk_size: int = 2**20):
+        self.retries = retries
+        self.timeout = timeout
+        self.chunk_size = chunk_size
+
+    def _transfer(self, url: str, part: Path):
+        offset = part.stat().st_size if part.exists() else 0
+        request = urllib.request.Request(url)
+        if offset:
+            request.add_header("Range", f"bytes={offset}-")
+        try:
+            response = urllib.request.urlopen(request, timeout=self.timeout)
+        except urllib.error.HTTPError as error:
+            if not offset or error.code != 416:
+                raise
+            # Nothing left after the offset: the part is complete if the server reports
+            # its size as "bytes */<size>", otherwise it is not what the server has
+            if error.headers.get("Content-Range", "") == f"bytes */{offset}":
+                return
+            part.unlink()
+            return self._transfer(url, part)
+        with response:
+            if offset and getattr(response, "status", None) != 206:
+                offset = 0  # range not supported, start over
+            with open(part, "ab" if offset else "wb") as f:
+                shutil.copyfileobj(response, f, self.chunk_size)
+
+    def __call__(self, url: str, output_file: str, pooch, check_only: bool = False):
+        if check_only:
+            with urllib.request.urlopen(url, timeout=self.timeout):
+                return True
+        part = Path(output_file).parent / (url.rsplit("/", 1)[-1] + ".part")
+        for attempt in range(self.retries + 1):
+            try:
+                self._transfer(url, part)
+                break
+            except OSError:
+                if attempt == self.retries:
+                    raise
+                time.sleep(min(attempt + 1, 10))
+        shutil.move(str(part), str(output_file))
+
+
+class KernelRegistry:
+    """A set of kernels described by a registry file, cached locally.
+
+    Parameters
+    ----------
+    registry : str or Path, optional
+        Registry file in pooch's format, by default the package's ``kernels.txt``
+    mirror : str, optional
+        Base URL of a mirror to fetch all kernels from, by default the value of the
+        ``PLANETS_KERNEL_MIRROR`` environment variable. Without a mirror kernels are
+        fetched from their URL in the registry or relative to the NAIF generic kernels.
+    cache : str or Path, optional
+        Local cache directory, by default ``PLANETS_KERNEL_CACHE`` or the user cache
+        directory of planets
+    downloader : callable, optional
+        pooch downloader, by default a ResumableDownloader
+    """
+
+    def __init__(
+        self,
+        registry: Optional[Union[str, Path]] = None,
+        mirror: Optional[str] = None,
+        cache: Optional[Union[str, Path]] = None,
+        downloader=None,
+    ):
+        import pooch
+
+        self.mirror = mirror if mirror is not None else os.environ.get(MIRROR_ENV)
+        if cache is None:
+            cache = os.environ.get(CACHE_ENV) or pooch.os_cache("planets")
+        base_url = (self.mirror or DEFAULT_BASE_URL).rstrip("/") + "/"
+        self._pooch = pooch.create(path=cache, base_url=base_url, registry={})
+        self._pooch.load_registry(str(registry if registry is not None else DEFAULT_REGISTRY))
+        if self.mirror:
+            # A mirror serves all kernels under their registry paths
+            self._pooch.urls.clear()
+        self.downloader = downloader if downloader is not None else ResumableDownloader()
+        self._sources: Dict[str, str] = {}
+
+    @property
+    def names(self) -> List[str]:
+        """Names of the kernels in the registry, in registry order."""
+        return list(self._pooch.registry)
+
+    @property
+    def cache(self) -> Path:
+        """The local cache directory."""
+        return Path(self._pooch.abspath)
+
+    def url(self, name: str) -> str:
+        """Get the URL a kernel is fetched from."""
+        return self._pooch.get_url(name)
+
+    def fetch(self, name: str) -> str:
+        """Get the local path of a kernel, downloading and verifying it if needed."""
+        return self._pooch.fetch(name, downloader=self.downloader)
+
+    def prefetch(
+        self, names: Optional[Iterable[str]] = None, max_workers: int = 4
+    ) -> Dict[str, str]:
+        """Download several kernels concurrently.
+
+        Parameters
+        ----------
+        names : iterable of str, optional
+            Kernels to fetch, by default all kernels in the registry
+        max_workers : int, optional
+            Number of parallel downloads, by default 4
+
+        Returns
+        -------
+        Dict[str, str]
+            Local path of each kernel
+        """
+        names = self.names if names is None else list(names)
+        # pooch creates missing directories itself, but not safely from several threads
+        for name in names:
+            (self.cache / name).parent.mkdir(parents=True, exist_ok=True)
+        with ThreadPoolExecutor(max_workers) as executor:
+            return dict(zip(names, executor.map(self.fetch, names)))
+
+    def provenance(self, name: str) -> Dict[str, Any]:
+        """Describe a kernel: name, hash, URL and local path (None if not fetched yet)."""
+        path = self.cache / name
+        return {
+            "name": name,
+            "hash": self._pooch.registry[name],
+            "url": self.url(name),
+            "path": str(path) if path.exists() else None,
+        }
+
+    def load_constants(self, names: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Fetch and parse text kernels and merge their constants.
+
+        Kernels are merged in the given (by default registry) order, later kernels
+        overriding values of earlier ones as when SPICE loads them in sequence. The
+        kernel each value came from is available from source_of() afterwards.
+
+        Parameters
+        ----------
+        names : iterable of str, optional
+            Kernels to load, by default all text kernels in the registry
+
+        Returns
+        -------
+        Dict[str, Any]
+            The merged constants
+        """
+        from . import pck_parser
+
+        if names is None:
+            names = [name for name in self.names if name.endswith(TEXT_KERNEL_EXTENSIONS)]
+        names = list(names)
+        paths = self.prefetch(names)
+        constants: Dict[str, Any] = {}
+        sources: Dict[str, str] = {}
+        for name in names:
+            kernel_constants = pck_parser.load_pck_constants(paths[name])
+            constants.update(kernel_constants)
+            sources.update(dict.fromkeys(kernel_constants, name))
+        self._sources = sources
+        return constants
+
+    def source_of(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the provenance of the kernel a constant was loaded from.
+
+        Parameters
+        ----------
+        key : str
+            Name of the constant, e.g. "BODY399_RADII"
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            See provenance(), None if no kernel loaded with load_constants() defines it
+        """
+        name = self._sources.get(key)
+        return None if name is None else self.provenance(name)
+
+
+def default_registry() -> KernelRegistry:
+    """Get the registry of the package's kernels, created on first use."""
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = KernelRegistry()
+    return _default_registry
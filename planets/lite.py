@@ -0,0 +1,209 @@
+"""Read-only catalogue of the built-in bodies without numpy, astropy or the network.
+
+The bodies and their radii are read from ``_lite_data.py``, a plain Python module
+generated from the full package and its pinned PCK kernel when the package is built (see
+``hatch_build.py``), so importing planets.lite costs a few milliseconds and never touches
+the kernel::
+
+    from planets import lite
+
+    lite.Earth.g, lite.Earth.R, lite.AU
+    lite.radii_km("Mars")  # (a, b, c) from the kernel the data was generated with
+
+The data module is not kept in the repository. In a source checkout it is generated,
+and regenerated after changes of the catalogue or the kernel, with::
+
+    python -m planets.lite            # or make lite, needs the kernel
+
+Bodies are frozen copies: their fields cannot be set, list fields are tuples and `R`
+is None for bodies whose radius was not in the kernel at generation time. Use the
+full package for anything else.
+"""
+
+import math
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .constants import AU, G, sigma
+
+# KERNEL and the bodies are provided from the data module by the module __getattr__
+__all__ = [
+    "Body",
+    "AU",
+    "G",
+    "sigma",
+    "KERNEL",  # noqa: F822
+    "get_all_bodies",
+    "body",
+    "radii_km",
+]
+
+DATA_PATH = Path(__file__).with_name("_lite_data.py")
+
+
+class Body:
+    """Read-only record of a body's fields, see `Planet` for their meaning."""
+
+    def __init__(self, fields: Dict[str, Any]):
+        self.__dict__.update(fields)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"planets.lite bodies are read-only, cannot set {name!r}")
+
+    def __repr__(self):
+        return f"Body({self.name!r})"
+
+    def Teq(self, latitude: float = 0) -> float:
+        """Get the equilibrium temperature [K] at a latitude [deg], as `Planet.Teq`."""
+        flux = (1 - self.albedo) * self.S * math.cos(latitude * math.pi / 180)
+        return (flux / (4 * self.emissivity * sigma)) ** 0.25
+
+
+_bodies: Dict[str, Body] = {}
+
+
+def _data():
+    """Get the generated data module."""
+    try:
+        from . import _lite_data
+    except ImportError as error:
+        raise ImportError(
+            "planets.lite needs its data module, which is generated when the package is"
+            " built, or in a source checkout with `python -m planets.lite`"
+        ) from error
+    return _lite_data
+
+
+def get_all_bodies() -> List[str]:
+    """Get the names of all bodies."""
+    return list(_data().BODIES)
+
+
+def body(name: str) -> Body:
+    """Get a body by name."""
+    record = _bodies.get(name)
+    if record is None:
+        bodies = _data().BODIES
+        if name not in bodies:
+            raise KeyError(f"Unknown body: {name}")
+        record = _bodies[name] = Body(bodies[name])
+    return record
+
+
+def radii_km(name: str) -> Optional[Tuple[float, float, float]]:
+    """Get the kernel radii (a, b, c) [km] of a body, None if they were not available."""
+    return _data().RADII_KM.get(name)
+
+
+def __getattr__(name):
+    if name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if name == "KERNEL":
+        # Provenance of the radii, None if the data was generated without a kernel
+        return _data().KERNEL
+    if name in _data().BODIES:
+        return body(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | {"KERNEL"} | set(_data().BODIES))
+
+
+def _literal(value, indent: str) -> str:
+    """Format a value of the catalogue as a Python literal, stable under ruff format."""
+    if isinstance(value, (list, tuple)):
+        items = [_literal(item, indent) for item in value]
+        text = "(" + ", ".join(items) + ("," if len(items) == 1 else "") + ")"
+        if len(indent) + len(text) < 80:
+            return text
+        return "(\n" + "".join(f"{indent}    {item},\n" for item in items) + indent + ")"
+    if isinstance(value, str):
+        import json
+
+        return json.dumps(value)  # double quotes, as ruff format writes them
+    return repr(value)
+
+
+def generate(path=DATA_PATH, kernel: bool = True) -> Dict[str, Any]:
+    """Write the data module of planets.lite from the full package.
+
+    Parameters
+    ----------
+    path : str or Path, optional
+        Output file, by default the package's ``_lite_data.py``
+    kernel : bool, optional
+        Whether to resolve radii from the kernel, which is retrieved if needed, by
+        default True. Without it only hand-entered radii are kept.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The provenance of the radii, None without a kernel
+    """
+    from . import __version__, _planets, pck_parser
+
+    provenance = None
+    radii: Dict[str, Tuple[float, ...]] = {}
+    if kernel:
+        from .snapshot import kernel_provenance
+
+        provenance = kernel_provenance()
+        provenance = {"source": provenance["source"], "sha256": provenance["sha256"]}
+        all_radii = pck_parser.load_body_radii()
+
+    bodies = {}
+    for name in _planets._BODY_NAMES:
+        planet = getattr(_planets, name)
+        state = vars(planet)
+        radius = state["_R"] if "R" not in state.get("_derived", {}) else None
+        if kernel:
+            found = pck_parser.get_body_radii_by_name(name, all_radii)
+            if found is not None:
+                radii[name] = tuple(float(r) for r in found[:3])
+            if radius is None and found is not None:
+                radius = planet.R
+        fields = {"name": planet.name, "R": radius}
+        for field, value in state.items():
+            if not field.startswith("_") and field != "name":
+                fields[field] = value
+        bodies[name] = fields
+
+    lines = [
+        '"""Catalogue data of planets.lite, generated by ``python -m planets.lite``.',
+        "",
+        "Do not edit; see planets/_bodies.py for the catalogue.",
+        '"""',
+        "",
+        f"VERSION = {_literal(__version__, '')}",
+        "",
+    ]
+    if provenance is None:
+        lines.append("KERNEL = None")
+    else:
+        lines += (
+            ["KERNEL = {"]
+            + [f"    {_literal(k, '')}: {_literal(v, '')}," for k, v in provenance.items()]
+            + ["}"]
+        )
+    lines += ["", "BODIES = {"]
+    for name, fields in bodies.items():
+        lines.append(f"    {_literal(name, '')}: {{")
+        lines += [f"        {_literal(k, '')}: {_literal(v, ' ' * 8)}," for k, v in fields.items()]
+        lines.append("    },")
+    lines += ["}", "", "RADII_KM = {" if radii else "RADII_KM = {}"]
+    if radii:
+        lines += [f"    {_literal(name, '')}: {_literal(r, ' ' * 4)}," for name, r in radii.items()]
+        lines.append("}")
+    Path(path).write_text("\n".join(lines) + "\n")
+    return provenance
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Regenerate the data of planets.lite")
+    parser.add_argument("--no-kernel", action="store_true", help="Keep only hand-entered radii")
+    parser.add_argument("-o", "--output", default=str(DATA_PATH), help="Output file")
+    args = parser.parse_args()
+    generate(args.output, kernel=not args.no_kernel)
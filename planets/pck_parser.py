@@ -1,20 +1,67 @@
 """Parser for SPICE PCK kernel files.
 
 This module provides functionality to extract constants from SPICE PCK kernel files
-using direct parsing with regular expressions.
+using direct parsing with regular expressions. Kernel files are memory-mapped and
+their data sections are scanned in place, so parsing large kernels needs little more
+memory than the extracted values.
 """
 
+import mmap
+import os
 import re
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Union
 
-import pooch
+from . import instrumentation
 
-# poock automatically caches so this doesn't always download the file
-pck_path = pooch.retrieve(
-    "https://naif.jpl.nasa.gov/pub/naif/generic_kernels/pck/pck00011.tpc",
-    known_hash="sha256:3dff7b1dbeceaa01f25467767d3fa25816051c85d162d1edf04acb310ee28bb1",
-)
+if TYPE_CHECKING:
+    from .kernel_index import KernelIndex
+
+# The PCK kernel, as listed in the kernel registry (kernels.txt)
+PCK_URL = "https://naif.jpl.nasa.gov/pub/naif/generic_kernels/pck/pck00011.tpc"
+PCK_HASH = "sha256:3dff7b1dbeceaa01f25467767d3fa25816051c85d162d1edf04acb310ee28bb1"
+
+_pck_path = None
+_pck_path_lock = threading.Lock()
+
+DATA_MARKER = b"\\begindata"
+TEXT_MARKER = b"\\begintext"
+
+# Anything supporting find() and the buffer protocol: bytes, bytearray or mmap
+Buffer = Union[bytes, bytearray, mmap.mmap]
+
+# Patterns used by the byte scanner of iter_buffer_assignments()
+_ASSIGNMENT = re.compile(rb"([^\s=()',+]+)\s*(\+?=)\s*")
+_SCALAR = re.compile(rb"'(?:[^']|'')*'|[^\s()]+")
+_LIST_ITEM = re.compile(rb"'(?:[^']|'')*'|\)|[^\s,()']+")
+
+
+def get_pck_path() -> str:
+    """Get the local path of the PCK kernel, downloading it on first use.
+
+    Returns
+    -------
+    str
+        Path to the cached copy of the PCK kernel file
+    """
+    global _pck_path
+    if _pck_path is None:
+        with _pck_path_lock:
+            if _pck_path is None:
+                # The registry only imports pooch once the kernel is actually used
+                from .kernels import PCK_NAME, default_registry
+
+                # Cached locally, so this only downloads the file once
+                _pck_path = default_registry().fetch(PCK_NAME)
+    return _pck_path
+
+
+def __getattr__(name):
+    # `pck_path` used to be resolved at import time, keep it available lazily
+    if name == "pck_path":
+        return get_pck_path()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def extract_data_blocks(pck_content: str) -> List[str]:
@@ -39,25 +86,22 @@ def extract_data_blocks(pck_content: str) -> List[str]:
     return matches
 
 
-def parse_data_block(block: str) -> Dict[str, Any]:
-    """Parse a single data block using direct regex parsing.
+def iter_assignments(block: str) -> Iterator[Tuple[str, str, Any]]:
+    """Iterate over the assignments of a single data block.
 
     Parameters
     ----------
     block : str
         A data block extracted from a PCK file
 
-    Returns
-    -------
-    Dict[str, Any]
-        Dictionary of parameters and their values from the data block
+    Yields
+    ------
+    Tuple[str, str, Any]
+        The parameter name, the assignment operator ("=" or "+=") and the parsed value
     """
     # Remove any leading/trailing whitespace
     block = block.strip()
 
-    # Initialize result dictionary
-    result = {}
-
     # Split into lines
     lines = block.split("\n")
 
@@ -72,11 +116,13 @@ def parse_data_block(block: str) -> Dict[str, Any]:
             continue
 
         # Look for parameter = value patterns
-        # SPICE PCK files typically use NAME = VALUE format
-        match = re.match(r"([A-Za-z0-9_]+)\s*=\s*(.*)", line)
+        # SPICE PCK files typically use NAME = VALUE format, and NAME += VALUE
+        # to append values to an earlier assignment
+        match = re.match(r"([A-Za-z0-9_]+)\s*(\+?=)\s*(.*)", line)
         if match:
             key = match.group(1)
-            value_str = match.group(2).strip()
+            operator = match.group(2)
+            value_str = match.group(3).strip()
 
             # Handle multi-line values (values ending with parentheses or with continuation lines)
             if "(" in value_str and ")" not in value_str:
@@ -92,14 +138,165 @@ def parse_data_block(block: str) -> Dict[str, Any]:
                     i = j  # Update the line index
 
             # Parse the value
-            value = parse_value(value_str)
-            result[key] = value
+            yield key, operator, parse_value(value_str)
 
         i += 1
 
+
+def append_values(value: Any, extra: Any) -> List[Any]:
+    """Combine an existing value with the values of a += assignment.
+
+    Parameters
+    ----------
+    value : Any
+        The value assigned so far, a list or a single value
+    extra : Any
+        The value of the += assignment, a list or a single value
+
+    Returns
+    -------
+    List[Any]
+        All values in assignment order
+    """
+    value = value if isinstance(value, list) else [value]
+    extra = extra if isinstance(extra, list) else [extra]
+    return value + extra
+
+
+def parse_data_block(block: str) -> Dict[str, Any]:
+    """Parse a single data block using direct regex parsing.
+
+    Parameters
+    ----------
+    block : str
+        A data block extracted from a PCK file
+
+    Returns
+    -------
+    Dict[str, Any]
+        Dictionary of parameters and their values from the data block
+    """
+    result = {}
+    for key, operator, value in iter_assignments(block):
+        if operator == "+=" and key in result:
+            result[key] = append_values(result[key], value)
+        else:
+            result[key] = value
+
     return result
 
 
+def find_data_sections(buffer: Buffer) -> List[Tuple[int, int]]:
+    """Locate the data sections of a kernel by scanning for the section markers.
+
+    Parameters
+    ----------
+    buffer : bytes-like
+        The content of the kernel file, typically a memory map
+
+    Returns
+    -------
+    List[Tuple[int, int]]
+        Start and end offsets of the text between each \\begindata marker and the
+        following \\begintext marker
+    """
+    sections = []
+    position = buffer.find(DATA_MARKER)
+    while position != -1:
+        start = position + len(DATA_MARKER)
+        end = buffer.find(TEXT_MARKER, start)
+        if end == -1:
+            break
+        sections.append((start, end))
+        position = buffer.find(DATA_MARKER, end + len(TEXT_MARKER))
+    return sections
+
+
+def parse_token(token: bytes) -> Any:
+    """Convert a single value of a kernel to a float or a string.
+
+    Parameters
+    ----------
+    token : bytes
+        A number, a quoted string or an unquoted word
+
+    Returns
+    -------
+    Any
+        A float for numbers (including Fortran style D exponents), otherwise a string
+        with surrounding quotes removed
+    """
+    try:
+        return float(token)
+    except ValueError:
+        pass
+    if token[:1] == b"'" and token[-1:] == b"'" and len(token) > 1:
+        return token[1:-1].replace(b"''", b"'").decode("utf-8")
+    try:
+        return float(token.replace(b"D", b"E").replace(b"d", b"e"))
+    except ValueError:
+        return token.decode("utf-8")
+
+
+def iter_buffer_assignments(buffer: Buffer, start: int, end: int) -> Iterator[Tuple[str, str, Any]]:
+    """Iterate over the assignments of a data section of a kernel buffer.
+
+    The section is scanned in place, only the individual values are copied out of
+    the buffer.
+
+    Parameters
+    ----------
+    buffer : bytes-like
+        The content of the kernel file, typically a memory map
+    start, end : int
+        Offsets of the data section, as returned by find_data_sections()
+
+    Yields
+    ------
+    Tuple[str, str, Any]
+        The parameter name, the assignment operator ("=" or "+=") and the parsed value
+    """
+    position = start
+    while True:
+        match = _ASSIGNMENT.search(buffer, position, end)
+        if match is None:
+            return
+        key = match.group(1).decode("utf-8")
+        operator = match.group(2).decode("ascii")
+        position = match.end()
+
+        if buffer[position : position + 1] != b"(":
+            # Single value
+            token = _SCALAR.match(buffer, position, end)
+            if token is None:
+                continue
+            position = token.end()
+            yield key, operator, parse_token(token.group())
+            continue
+
+        position += 1
+        close = buffer.find(b")", position, end)
+        if close == -1:
+            close = end
+        if buffer.find(b"'", position, close) == -1:
+            # Fast path for lists without strings, by far the most common case
+            items = buffer[position:close].replace(b",", b" ").split()
+            try:
+                values = [float(item) for item in items]
+            except ValueError:
+                values = [parse_token(item) for item in items]
+            position = close + 1
+        else:
+            # Lists holding strings, which may contain parentheses and commas
+            values = []
+            for token in _LIST_ITEM.finditer(buffer, position, end):
+                position = token.end()
+                if token.group() == b")":
+                    break
+                values.append(parse_token(token.group()))
+        yield key, operator, values
+
+
 def parse_value(value_str: str) -> Any:
     """Parse a value from a PCK file.
 
@@ -148,6 +345,7 @@ def parse_value(value_str: str) -> Any:
         return value_str
 
 
+@instrumentation.timed("parse")
 def parse_pck_file(file_path: Union[str, Path]) -> Dict[str, Any]:
     """Parse a PCK file and extract all constants.
 
@@ -167,26 +365,156 @@ def parse_pck_file(file_path: Union[str, Path]) -> Dict[str, Any]:
     if not file_path.exists():
         raise FileNotFoundError(f"PCK file not found: {file_path}")
 
-    # Read the file content
-    with open(file_path, "r", encoding="utf-8") as f:
-        content = f.read()
+    # Map the file instead of reading it, so that only the pages of the data
+    # sections are touched and no copy of the data blocks is made
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return {}
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            sections = find_data_sections(buffer)
+
+            if instrumentation.enabled:
+                instrumentation.count(
+                    "kernel.bytes_read", sum(end - start for start, end in sections)
+                )
+
+            # Parse each block and combine the results
+            all_constants = {}
+            for i, (start, end) in enumerate(sections):
+                for key, operator, value in iter_buffer_assignments(buffer, start, end):
+                    if operator == "+=" and key in all_constants:
+                        # Continuations may appear in later blocks, keep the original block
+                        entry = all_constants[key]
+                        entry["value"] = append_values(entry["value"], value)
+                        continue
+
+                    # Add block number for debugging/reference
+                    all_constants[key] = {
+                        "value": value,
+                        "block": i + 1,  # 1-based indexing for blocks
+                    }
 
-    # Extract data blocks
-    blocks = extract_data_blocks(content)
+    return all_constants
 
-    # Parse each block and combine the results
-    all_constants = {}
-    for i, block in enumerate(blocks):
-        constants = parse_data_block(block)
 
-        # Add block number for debugging/reference
-        for key, value in constants.items():
-            all_constants[key] = {
-                "value": value,
-                "block": i + 1,  # 1-based indexing for blocks
-            }
+# Parsed kernels, keyed by resolved path and validated against mtime and size
+_kernel_cache: Dict[str, Dict[str, Any]] = {}
 
-    return all_constants
+# One lock per kernel path, so that exactly one thread parses a kernel while other
+# threads needing it wait for the result (single flight)
+_kernel_locks: Dict[str, threading.Lock] = {}
+_kernel_locks_lock = threading.Lock()
+
+
+def _kernel_lock(path_key: str) -> threading.Lock:
+    lock = _kernel_locks.get(path_key)
+    if lock is None:
+        with _kernel_locks_lock:
+            lock = _kernel_locks.setdefault(path_key, threading.Lock())
+    return lock
+
+
+def _load_cached(file_path: Optional[Union[str, Path]]) -> Dict[str, Any]:
+    """Get the cache entry for a PCK file, parsing it if it is new or has changed."""
+    file_path = Path(get_pck_path() if file_path is None else file_path)
+    if not file_path.exists():
+        raise FileNotFoundError(f"PCK file not found: {file_path}")
+
+    stat = file_path.stat()
+    path_key = str(file_path.resolve())
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    entry = _kernel_cache.get(path_key)
+    if entry is None or entry["signature"] != signature:
+        with _kernel_lock(path_key):
+            # Another thread may have parsed the kernel while this one waited
+            entry = _kernel_cache.get(path_key)
+            if entry is None or entry["signature"] != signature:
+                if instrumentation.enabled:
+                    instrumentation.count("cache.miss", path=path_key)
+                constants = parse_pck_file(file_path)
+                entry = {
+                    "signature": signature,
+                    "constants": constants,
+                    "radii": None,
+                    "index": None,
+                    "lock": threading.Lock(),
+                }
+                _kernel_cache[path_key] = entry
+                return entry
+
+    if instrumentation.enabled:
+        instrumentation.count("cache.hit", path=path_key)
+    return entry
+
+
+def load_pck_constants(file_path: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
+    """Parse a PCK file, reusing the result of earlier calls while the file is unchanged.
+
+    Parameters
+    ----------
+    file_path : Union[str, Path], optional
+        Path to the PCK file, by default the kernel returned by get_pck_path()
+
+    Returns
+    -------
+    Dict[str, Any]
+        Dictionary containing all constants extracted from the PCK file, as returned
+        by parse_pck_file(). The dictionary is shared between callers and must not be
+        modified.
+    """
+    return _load_cached(file_path)["constants"]
+
+
+def load_body_radii(file_path: Optional[Union[str, Path]] = None) -> Dict[int, List[float]]:
+    """Get the body radii of a PCK file, reusing earlier results while the file is unchanged.
+
+    Parameters
+    ----------
+    file_path : Union[str, Path], optional
+        Path to the PCK file, by default the kernel returned by get_pck_path()
+
+    Returns
+    -------
+    Dict[int, List[float]]
+        Dictionary mapping body IDs to their radii values, as returned by
+        extract_body_radii(). The dictionary is shared and must not be modified.
+    """
+    entry = _load_cached(file_path)
+    if entry["radii"] is None:
+        with entry["lock"]:
+            if entry["radii"] is None:
+                entry["radii"] = extract_body_radii(entry["constants"])
+    return entry["radii"]
+
+
+def load_kernel_index(file_path: Optional[Union[str, Path]] = None) -> "KernelIndex":
+    """Get the key index of a PCK file, reusing earlier results while the file is unchanged.
+
+    Parameters
+    ----------
+    file_path : Union[str, Path], optional
+        Path to the PCK file, by default the kernel returned by get_pck_path()
+
+    Returns
+    -------
+    KernelIndex
+        Index of the constants returned by load_pck_constants(), see
+        planets.kernel_index. The index is shared and must not be modified.
+    """
+    from .kernel_index import KernelIndex
+
+    entry = _load_cached(file_path)
+    if entry["index"] is None:
+        with entry["lock"]:
+            if entry["index"] is None:
+                entry["index"] = KernelIndex(entry["constants"])
+    return entry["index"]
+
+
+def clear_cache():
+    """Forget all parsed kernels."""
+    _kernel_cache.clear()
 
 
 def parse_multiple_files(
@@ -216,6 +544,7 @@ def parse_multiple_files(
     return results
 
 
+@instrumentation.timed("extract_radii")
 def extract_body_radii(constants: Dict[str, Any]) -> Dict[int, List[float]]:
     """Extract the radii values for all bodies in the constants dictionary.
 
@@ -400,6 +729,7 @@ def get_body_name(body_id: int) -> str:
     return naif_mapping.get(body_id, f"Unknown ({body_id})")
 
 
+@instrumentation.timed("lookup")
 def get_body_radii_by_name(
     body_name: str, radii_data: Dict[int, List[float]]
 ) -> Optional[List[float]]:
@@ -429,9 +759,11 @@ def get_body_radii_by_name(
 
     # Try to find the ID for this body name
     body_id = name_to_id.get(body_name_lower)
+    path = "exact"
 
     if body_id is None:
         # If not found directly, try more flexible matching
+        path = "fuzzy"
         for name, id in name_to_id.items():
             if body_name_lower in name or name in body_name_lower:
                 body_id = id
@@ -439,16 +771,24 @@ def get_body_radii_by_name(
 
     # If we found an ID, try to get its radii
     if body_id is not None and body_id in radii_data:
+        if instrumentation.enabled:
+            instrumentation.count("lookup." + path, name=body_name)
         return radii_data[body_id]
 
     # Special case for Earth's moon - try both "Moon" and "Luna"
     if body_name_lower in ["moon", "luna"] and 301 in radii_data:
+        if instrumentation.enabled:
+            instrumentation.count("lookup.alias", name=body_name)
         return radii_data[301]
 
     # Special case for Sun - might be listed under 10
     if body_name_lower == "sun" and 10 in radii_data:
+        if instrumentation.enabled:
+            instrumentation.count("lookup.alias", name=body_name)
         return radii_data[10]
 
+    if instrumentation.enabled:
+        instrumentation.count("lookup.miss", name=body_name)
     return None
 
 
@@ -467,8 +807,7 @@ def get_body_radius_km(body_name: str, radius_type: str = "mean") -> Optional[fl
     Optional[float]
         The requested radius in kilometers, or None if not available
     """
-    constants = parse_pck_file(pck_path)
-    radii_data = extract_body_radii(constants)
+    radii_data = load_body_radii()
     radii = get_body_radii_by_name(body_name, radii_data)
 
     if radii is None or len(radii) < 3:
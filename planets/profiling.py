@@ -0,0 +1,200 @@
+"""Environment profile behind the ``planets profile`` command.
+
+Collects the numbers needed to tell why planets is slow on a given node: the import
+time of the heavy dependencies, each measured in a fresh interpreter; the time to
+retrieve and parse the PCK kernel; the time of radius and name lookups; and the state
+of the kernel and result caches. Instrumentation (see planets.instrumentation) is
+enabled while profiling and its counters are included in the report::
+
+    planets profile             # human-readable report
+    planets profile --json      # machine-readable
+    planets profile --offline --pstats profile.pstats
+"""
+
+import os
+import subprocess
+import sys
+import time
+from typing import Any, Dict, Optional, Sequence
+
+__all__ = ["IMPORTED_MODULES", "collect", "format_report"]
+
+# Modules whose import time is reported, in the order the package needs them
+IMPORTED_MODULES = ("numpy", "pooch", "astropy.units", "planets.pck_parser", "planets")
+
+# Bodies used for the lookup timings
+LOOKUP_BODIES = ("Earth", "Moon", "Mars", "Titan")
+
+
+def import_time(module: str) -> Optional[float]:
+    """Get the time to import a module in a fresh interpreter [s], None if it fails."""
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"import {module}; print(time.perf_counter() - start)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    if result.returncode:
+        return None
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def _timed(func, *args, repeat: int = 1):
+    """Call `func` `repeat` times and return the last result and the mean time [s]."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        value = func(*args)
+    return value, (time.perf_counter() - start) / repeat
+
+
+def _kernel_report(offline: bool) -> Dict[str, Any]:
+    from . import pck_parser
+
+    report: Dict[str, Any] = {"path": pck_parser._pck_path, "cached": None, "error": None}
+    if report["path"] is None:
+        try:
+            from .kernels import PCK_NAME, default_registry
+
+            registry = default_registry()
+            report["cache_dir"] = str(registry.cache)
+            report["cached"] = registry.provenance(PCK_NAME)["path"] is not None
+            report["mirror"] = registry.mirror
+        except Exception as error:  # pooch missing or unusable cache directory
+            report["error"] = f"{type(error).__name__}: {error}"
+            return report
+        if offline and not report["cached"]:
+            report["error"] = "not cached, retrieval skipped (--offline)"
+            return report
+    try:
+        report["path"], report["retrieve"] = _timed(pck_parser.get_pck_path)
+    except Exception as error:  # network errors come in many flavours
+        report["error"] = f"{type(error).__name__}: {error}"
+        return report
+
+    report["size"] = os.path.getsize(report["path"])
+    constants, report["parse"] = _timed(pck_parser.parse_pck_file, report["path"])
+    report["n_constants"] = len(constants)
+    # A cold load parses the kernel and extracts the radii, done here outside the cache
+    # so that the kernels the caller has parsed are kept
+    start = time.perf_counter()
+    pck_parser.extract_body_radii(pck_parser.parse_pck_file(report["path"]))
+    report["load_cold"] = time.perf_counter() - start
+    pck_parser.load_body_radii(report["path"])
+    _, report["load_warm"] = _timed(pck_parser.load_body_radii, report["path"], repeat=100)
+    return report
+
+
+def _lookup_report(repeat: int = 1000) -> Dict[str, float]:
+    from . import pck_parser
+
+    report = {}
+    for name in LOOKUP_BODIES:
+        _, report[f"radius {name}"] = _timed(pck_parser.get_body_radius_km, name, repeat=repeat)
+    _, report["body name 399"] = _timed(pck_parser.get_body_name, 399, repeat=repeat)
+    return report
+
+
+def _cache_report() -> Dict[str, Any]:
+    from . import pck_parser
+
+    report: Dict[str, Any] = {"parsed_kernels": sorted(pck_parser._kernel_cache)}
+    cache_module = sys.modules.get("planets.cache")
+    if cache_module is not None and cache_module._default_cache is not None:
+        results = cache_module._default_cache
+        report["results"] = {
+            "entries": len(results),
+            "bytes": results.nbytes,
+            "hits": results.hits,
+            "misses": results.misses,
+            "directory": None if results.directory is None else str(results.directory),
+        }
+    return report
+
+
+def collect(
+    offline: bool = False, imports: bool = True, modules: Sequence[str] = IMPORTED_MODULES
+) -> Dict[str, Any]:
+    """Profile the current environment.
+
+    Parameters
+    ----------
+    offline : bool, optional
+        Skip retrieving the kernel if it is not cached yet, by default False
+    imports : bool, optional
+        Measure import times, by default True
+    modules : sequence of str, optional
+        Modules whose import time is measured
+
+    Returns
+    -------
+    Dict[str, Any]
+        ``{"python", "planets", "imports", "kernel", "lookups", "caches", "stats"}``.
+        Times are in seconds, `lookups` per call. `lookups` is empty without a kernel.
+        `caches` is the state of the caches before profiling, which leaves the parsed
+        kernels in place.
+    """
+    from . import __version__, instrumentation
+
+    was_enabled = instrumentation.is_enabled()
+    instrumentation.enable()
+    try:
+        # The caches as found, before the measurements below fill them
+        caches = _cache_report()
+        report: Dict[str, Any] = {
+            "python": sys.version.split()[0],
+            "planets": __version__,
+            "imports": {module: import_time(module) for module in modules} if imports else {},
+        }
+        report["kernel"] = _kernel_report(offline)
+        report["lookups"] = _lookup_report() if report["kernel"]["error"] is None else {}
+        report["caches"] = caches
+        report["stats"] = instrumentation.stats()
+    finally:
+        if not was_enabled:
+            instrumentation.disable()
+    return report
+
+
+def _ms(seconds: Optional[float]) -> str:
+    return "failed" if seconds is None else f"{seconds * 1e3:10.3f} ms"
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Format a report from collect() as text."""
+    lines = [f"planets {report['planets']} on Python {report['python']}", ""]
+    if report["imports"]:
+        lines.append("Import time (fresh interpreter):")
+        lines += [f"  {module:20} {_ms(t)}" for module, t in report["imports"].items()]
+        lines.append("")
+
+    kernel = report["kernel"]
+    lines.append("Kernel:")
+    for name in ("path", "cache_dir", "mirror", "cached", "size", "n_constants"):
+        if kernel.get(name) is not None:
+            lines.append(f"  {name:20} {kernel[name]}")
+    for name in ("retrieve", "parse", "load_cold", "load_warm"):
+        if name in kernel:
+            lines.append(f"  {name:20} {_ms(kernel[name])}")
+    if kernel["error"] is not None:
+        lines.append(f"  {'error':20} {kernel['error']}")
+    lines.append("")
+
+    if report["lookups"]:
+        lines.append("Lookups (per call):")
+        lines += [f"  {name:20} {t * 1e6:10.3f} us" for name, t in report["lookups"].items()]
+        lines.append("")
+
+    caches = report["caches"]
+    lines.append("Caches:")
+    lines.append(f"  {'parsed kernels':20} {len(caches['parsed_kernels'])}")
+    for path in caches["parsed_kernels"]:
+        lines.append(f"    {path}")
+    if "results" in caches:
+        for name, value in caches["results"].items():
+            lines.append(f"  {'results ' + name:20} {value}")
+    lines.append("")
+
+    counters = report["stats"]["counters"]
+    if counters:
+        lines.append("Instrumentation counters:")
+        lines += [f"  {event:20} {n}" for event, n in sorted(counters.items())]
+    return "\n".join(lines).rstrip() + "\n"
@@ -0,0 +1,222 @@
+"""Shared-memory body catalogue for worker processes.
+
+The parent process publishes the numeric body table and the parsed kernel radii once
+into `multiprocessing.shared_memory` blocks. Worker processes attach to the blocks by
+name and read them as numpy arrays without copying, and can install the bodies so
+that ``planets.Earth`` and friends neither execute the body definitions nor parse the
+kernel::
+
+    with SharedCatalogue.publish() as catalogue:
+        with ProcessPoolExecutor(
+            initializer=attach_catalogue, initargs=(catalogue.descriptor,)
+        ) as executor:
+            ...
+
+Only the small descriptor (block names, body names and the few list-valued
+attributes such as `albedoCoef`) is pickled to the workers. Requires Python 3.8+.
+"""
+
+import math
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from . import pck_parser
+from ._planets import Planet, _install_bodies
+from .table import BodyTable
+
+__all__ = ["SharedCatalogue", "attach_catalogue", "get_catalogue"]
+
+# Attributes that are lists rather than numbers, passed along in the descriptor
+LIST_FIELDS = ("albedoCoef", "cpCoeff")
+
+_catalogue: Optional["SharedCatalogue"] = None
+
+
+def _create_block(array: np.ndarray):
+    from multiprocessing import shared_memory
+
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, array.dtype, buffer=block.buf)[...] = array
+    return block
+
+
+def _attach_block(name: str):
+    from multiprocessing import shared_memory
+
+    try:
+        # Attaching processes must not unlink the block when they exit (Python 3.13+)
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def _radius(body, kernel: bool) -> float:
+    if body._R is not None and (kernel or "R" not in vars(body).get("_derived", {})):
+        return body._R
+    radius = pck_parser.get_body_radius_km(body.name) if kernel else None
+    return math.nan if radius is None else radius * 1000
+
+
+class SharedCatalogue:
+    """Body table and kernel radii in shared memory.
+
+    Create it with :meth:`publish` in the parent process and with :meth:`attach` in
+    the workers, never directly.
+
+    Attributes
+    ----------
+    descriptor : Dict[str, Any]
+        Picklable description of the shared blocks, passed to the workers
+    table : BodyTable
+        Body table whose columns are views of shared memory
+    body_ids : np.ndarray
+        NAIF IDs of the bodies with radii in the kernel
+    radii : np.ndarray
+        Kernel radii [km] of shape (len(body_ids), 3)
+    """
+
+    def __init__(self, descriptor: Dict[str, Any], blocks: List, owner: bool):
+        self.descriptor = descriptor
+        self._blocks = blocks
+        self._owner = owner
+        names, fields = descriptor["names"], descriptor["fields"]
+        values = np.ndarray((len(fields), len(names)), np.float64, buffer=blocks[0].buf)
+        self.table = BodyTable.from_columns(names, dict(zip(fields, values)))
+        n_ids = descriptor["n_ids"]
+        self.body_ids = np.ndarray((n_ids,), np.int64, buffer=blocks[1].buf)
+        self.radii = np.ndarray((n_ids, 3), np.float64, buffer=blocks[2].buf)
+
+    @classmethod
+    def publish(
+        cls, bodies: Optional[Iterable[Planet]] = None, kernel: bool = True
+    ) -> "SharedCatalogue":
+        """Copy the body table and kernel radii into new shared-memory blocks.
+
+        Parameters
+        ----------
+        bodies : iterable of Planet, optional
+            The bodies, by default the built-in catalogue
+        kernel : bool, optional
+            Whether to read the kernel, by default True. Without it the kernel radii are
+            left out and bodies without a hand-entered radius get a radius of NaN.
+
+        Returns
+        -------
+        SharedCatalogue
+            The catalogue, owning the blocks until close() and unlink()
+        """
+        from . import _planets
+
+        if bodies is None:
+            bodies = [getattr(_planets, name) for name in _planets._BODY_NAMES]
+        bodies = list(bodies)
+        table = BodyTable(bodies, with_radius=False)
+        fields = ["R"] + table.fields
+        values = np.stack(
+            [np.array([_radius(body, kernel) for body in bodies])]
+            + [table[name] for name in table.fields]
+        )
+
+        radii_data = pck_parser.load_body_radii() if kernel else {}
+        radii_data = {key: value for key, value in radii_data.items() if len(value) == 3}
+        body_ids = np.fromiter(radii_data, dtype=np.int64, count=len(radii_data))
+        radii = np.array(list(radii_data.values()), dtype=np.float64).reshape(-1, 3)
+
+        blocks = []
+        try:
+            for array in (values, body_ids, radii):
+                blocks.append(_create_block(array))
+        except BaseException:
+            for block in blocks:
+                block.close()
+                block.unlink()
+            raise
+        descriptor = {
+            "blocks": [block.name for block in blocks],
+            "names": table.names,
+            "fields": fields,
+            "n_ids": len(body_ids),
+            "lists": {
+                body.name: {name: getattr(body, name, None) for name in LIST_FIELDS}
+                for body in bodies
+            },
+        }
+        return cls(descriptor, blocks, owner=True)
+
+    @classmethod
+    def attach(cls, descriptor: Dict[str, Any]) -> "SharedCatalogue":
+        """Attach to the blocks of a catalogue published by another process."""
+        blocks = [_attach_block(name) for name in descriptor["blocks"]]
+        return cls(descriptor, blocks, owner=False)
+
+    def body(self, name: str) -> Planet:
+        """Build a `Planet` from its row of the shared table."""
+        index = self.table.names.index(name)
+        body = Planet()
+        body.name = name
+        for field, column in self.table.columns.items():
+            value = column[index]
+            value = None if math.isnan(value) else float(value)
+            setattr(body, "_R" if field == "R" else field, value)
+        for field, value in self.descriptor["lists"][name].items():
+            setattr(body, field, value)
+        return body
+
+    def bodies(self) -> Dict[str, Planet]:
+        """Build all bodies of the catalogue, see body()."""
+        return {name: self.body(name) for name in self.table.names}
+
+    def radii_of(self, body_id: int) -> Optional[np.ndarray]:
+        """Get the kernel radii [km] of a NAIF ID, None if the kernel has none."""
+        index = np.flatnonzero(self.body_ids == body_id)
+        return self.radii[index[0]] if index.size else None
+
+    def close(self):
+        """Detach from the blocks. The arrays must not be used afterwards."""
+        # Drop the views first, the blocks cannot be closed while they are exported
+        self.table = self.body_ids = self.radii = None
+        for block in self._blocks:
+            block.close()
+
+    def unlink(self):
+        """Free the blocks. Only the publishing process may do this, after close()."""
+        if not self._owner:
+            raise RuntimeError("Only the publishing process can unlink the catalogue")
+        for block in self._blocks:
+            block.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        if self._owner:
+            self.unlink()
+
+
+def attach_catalogue(descriptor: Dict[str, Any], install: bool = True) -> SharedCatalogue:
+    """Attach this process to a published catalogue, e.g. as a pool initializer.
+
+    Parameters
+    ----------
+    descriptor : Dict[str, Any]
+        The `descriptor` of the published catalogue
+    install : bool, optional
+        Whether to make the shared bodies the package's built-in bodies, by default True
+
+    Returns
+    -------
+    SharedCatalogue
+        The attached catalogue, also available from get_catalogue()
+    """
+    global _catalogue
+    _catalogue = SharedCatalogue.attach(descriptor)
+    if install:
+        _install_bodies(_catalogue.bodies())
+    return _catalogue
+
+
+def get_catalogue() -> Optional[SharedCatalogue]:
+    """Get the catalogue attached with attach_catalogue(), None if there is none."""
+    return _catalogue
@@ -0,0 +1,276 @@
+"""Streaming evaluation of equilibrium temperatures over large inputs.
+
+Rows of ``body, latitude[, time]`` are read in chunks of bounded size from CSV text or
+``.npy`` files (also from pipes), evaluated vectorized per body and written out chunk
+by chunk, so inputs larger than memory are processed at NumPy speed. This is the
+engine of the ``planets teq`` command::
+
+    planets teq rows.csv > result.csv
+    generate-rows | planets teq --chunk-size 100000 -o result.csv
+
+Rows without a time give the flux and temperature of `Planet.Teq`, averaged over a
+rotation at the body's annual mean solar constant. Rows with a time (seconds since
+perihelion, see planets.illumination) give the instantaneous values at local noon at
+the body's heliocentric distance at that time, using the variable albedo of
+planets.thermal.
+
+CSV input has the columns ``body,latitude[,time]`` (latitude in degrees) and an
+optional header line. ``.npy`` input is either a structured array with the fields
+``body``, ``latitude`` and optionally ``time``, or a float array with the columns
+latitude and optionally time, for a single body given separately. CSV output repeats
+the input columns followed by ``flux`` [W.m-2] and ``teq`` [K]. ``.npy`` output is a
+float array with the columns flux and teq and needs ``.npy`` input, whose row count it
+takes its header from.
+"""
+
+import itertools
+from typing import IO, Iterator, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+__all__ = ["Chunk", "evaluate", "iter_csv", "iter_npy", "write_csv", "NpyWriter", "run"]
+
+# Default number of rows evaluated at once
+CHUNK_ROWS = 65536
+
+
+class Chunk(NamedTuple):
+    """A chunk of input rows."""
+
+    body: np.ndarray  # Body names
+    latitude: np.ndarray  # Latitude [deg]
+    time: Optional[np.ndarray]  # Time since perihelion [s], None for time-averaged rows
+    text: Optional[list]  # Input columns as read, for CSV input
+
+
+def _body(name: str):
+    from . import _planets
+
+    body = getattr(_planets, name, None) if name in _planets._BODY_NAMES else None
+    if body is None:
+        raise ValueError(f"Unknown body: {name}")
+    # The same message as planets.thermal, with or without a time column
+    for field in ("emissivity", "albedo", "S"):
+        if getattr(body, field) is None:
+            raise ValueError(f"{body.name} has no value for {field!r}")
+    return body
+
+
+def evaluate(body, latitude, time=None) -> Tuple[np.ndarray, np.ndarray]:
+    """Get the solar flux and equilibrium temperature of rows.
+
+    Parameters
+    ----------
+    body : array_like of str
+        Body name of each row
+    latitude : array_like
+        Latitude [deg]
+    time : array_like, optional
+        Time since perihelion [s]. Without it the values are averaged over a rotation.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Flux [W.m-2] and temperature [K] of each row
+    """
+    from .constants import sigma
+    from .illumination import orbital_state
+    from .thermal import equilibrium_temperature
+
+    names = np.asarray(body)
+    latitude = np.asarray(latitude, dtype=float)
+    flux = np.empty(latitude.shape)
+    teq = np.empty(latitude.shape)
+    unique, inverse = np.unique(names, return_inverse=True)
+    for k, name in enumerate(unique):
+        rows = np.flatnonzero(inverse == k) if unique.size > 1 else slice(None)
+        planet = _body(str(name))
+        phi = np.deg2rad(latitude[rows])
+        if time is None:
+            flux[rows] = planet.S * np.cos(phi) / 4
+            teq[rows] = ((1 - planet.albedo) * flux[rows] / (planet.emissivity * sigma)) ** 0.25
+        else:
+            r, declination = orbital_state(planet, np.asarray(time, dtype=float)[rows])
+            incidence = np.abs(phi - declination)
+            noon_flux = planet.S * (planet.rsm / r) ** 2
+            flux[rows] = noon_flux * np.maximum(np.cos(incidence), 0)
+            teq[rows] = equilibrium_temperature(planet, incidence, solar_flux=noon_flux)
+    return flux, teq
+
+
+def _is_number(text: str) -> bool:
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
+
+
+def iter_csv(stream: IO[str], chunk_rows: int = CHUNK_ROWS) -> Iterator[Chunk]:
+    """Read CSV rows ``body,latitude[,time]`` in chunks, skipping a header line."""
+    first = True
+    while True:
+        # Each chunk is split into fields in one pass over its joined text
+        rows = [row for row in "".join(itertools.islice(stream, chunk_rows)).splitlines() if row]
+        if first and rows:
+            names = rows[0].split(",")
+            if len(names) < 2 or not _is_number(names[1]):
+                rows = rows[1:]  # header
+        first = False
+        if not rows:
+            return
+        width = rows[0].count(",") + 1
+        if width not in (2, 3) or any(row.count(",") != width - 1 for row in rows):
+            raise ValueError("CSV rows must have the columns body,latitude[,time]")
+        fields = ",".join(rows).split(",")
+        yield Chunk(
+            body=np.char.strip(np.array(fields[0::width])),
+            latitude=np.array(fields[1::width], dtype=float),
+            time=np.array(fields[2::width], dtype=float) if width == 3 else None,
+            text=rows,
+        )
+
+
+def _read_npy_header(stream: IO[bytes]):
+    version = np.lib.format.read_magic(stream)
+    if version == (1, 0):
+        return np.lib.format.read_array_header_1_0(stream)
+    return np.lib.format.read_array_header_2_0(stream)
+
+
+def iter_npy(
+    stream: IO[bytes], chunk_rows: int = CHUNK_ROWS, body: Optional[str] = None, header=None
+) -> Iterator[Chunk]:
+    """Read rows from a ``.npy`` stream in chunks.
+
+    Parameters
+    ----------
+    stream : binary file
+        The ``.npy`` data, read sequentially
+    chunk_rows : int, optional
+        Number of rows per chunk
+    body : str, optional
+        Body of all rows of a float array, not used for structured arrays
+    header : tuple, optional
+        Shape, order and dtype if the header was already read from `stream`
+
+    Yields
+    ------
+    Chunk
+    """
+    shape, fortran_order, dtype = header if header is not None else _read_npy_header(stream)
+    if fortran_order:
+        raise ValueError("Fortran-ordered .npy input cannot be streamed")
+    structured = dtype.names is not None
+    if structured:
+        if not {"body", "latitude"} <= set(dtype.names):
+            raise ValueError(".npy input needs the fields body and latitude")
+        n_rows = shape[0]
+    else:
+        if body is None:
+            raise ValueError("A float .npy array needs the body given separately")
+        n_rows = shape[0] if len(shape) else 1
+        width = shape[1] if len(shape) == 2 else 1
+        dtype = np.dtype((dtype, (width,)))
+    for start in range(0, n_rows, chunk_rows):
+        n = min(chunk_rows, n_rows - start)
+        data = np.frombuffer(stream.read(n * dtype.itemsize), dtype=dtype, count=n)
+        if structured:
+            has_time = "time" in dtype.names
+            yield Chunk(
+                body=data["body"].astype(str),
+                latitude=data["latitude"].astype(float),
+                time=data["time"].astype(float) if has_time else None,
+                text=None,
+            )
+        else:
+            data = data.reshape(n, -1)
+            yield Chunk(
+                body=np.full(n, body),
+                latitude=data[:, 0].astype(float),
+                time=data[:, 1].astype(float) if data.shape[1] > 1 else None,
+                text=None,
+            )
+
+
+def write_csv(out: IO[str], chunk: Chunk, flux: np.ndarray, teq: np.ndarray, header: bool):
+    """Write a chunk of results as CSV lines."""
+    if chunk.text is None:
+        columns = [chunk.body.tolist(), chunk.latitude.tolist()]
+        if chunk.time is not None:
+            columns.append(chunk.time.tolist())
+        text = [",".join(map(str, row)) for row in zip(*columns)]
+    else:
+        text = chunk.text
+    if header:
+        columns = "body,latitude,time" if chunk.time is not None else "body,latitude"
+        out.write(f"{columns},flux,teq\n")
+    # One formatting operation for the whole chunk
+    values = [None] * (3 * len(text))
+    values[0::3], values[1::3], values[2::3] = text, flux.tolist(), teq.tolist()
+    out.write("%s,%.6f,%.6f\n" * len(text) % tuple(values))
+
+
+class NpyWriter:
+    """Writes (flux, teq) rows to a ``.npy`` stream of known length, chunk by chunk."""
+
+    def __init__(self, out: IO[bytes], n_rows: int):
+        header = {"descr": "<f8", "fortran_order": False, "shape": (n_rows, 2)}
+        np.lib.format.write_array_header_1_0(out, header)
+        self.out = out
+
+    def write(self, flux: np.ndarray, teq: np.ndarray):
+        self.out.write(np.stack([flux, teq], axis=1).astype("<f8").tobytes())
+
+
+def run(
+    source: IO,
+    out: IO,
+    input_format: str = "csv",
+    output_format: str = "csv",
+    chunk_rows: int = CHUNK_ROWS,
+    body: Optional[str] = None,
+) -> int:
+    """Evaluate a stream of rows chunk by chunk.
+
+    Parameters
+    ----------
+    source : file
+        The input, text for "csv" and binary for "npy"
+    out : file
+        The output, text for "csv" and binary for "npy"
+    input_format, output_format : str, optional
+        "csv" or "npy", by default "csv"
+    chunk_rows : int, optional
+        Number of rows evaluated at once, bounding the memory use
+    body : str, optional
+        Body of all rows of a float .npy input
+
+    Returns
+    -------
+    int
+        Number of rows written
+    """
+    if input_format == "csv":
+        chunks = iter_csv(source, chunk_rows)
+    elif input_format == "npy":
+        header = _read_npy_header(source)
+        chunks = iter_npy(source, chunk_rows, body, header)
+    else:
+        raise ValueError(f"Unknown input format: {input_format}. Use 'csv' or 'npy'")
+    if output_format == "npy":
+        if input_format != "npy":
+            raise ValueError("npy output needs npy input, whose length it takes")
+        writer = NpyWriter(out, header[0][0] if header[0] else 1)
+    elif output_format != "csv":
+        raise ValueError(f"Unknown output format: {output_format}. Use 'csv' or 'npy'")
+
+    n_rows = 0
+    for chunk in chunks:
+        flux, teq = evaluate(chunk.body, chunk.latitude, chunk.time)
+        if output_format == "npy":
+            writer.write(flux, teq)
+        else:
+            write_csv(out, chunk, flux, teq, header=n_rows == 0)
+        n_rows += flux.size
+    return n_rows
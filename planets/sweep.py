@@ -0,0 +1,427 @@
+"""Parameter sweeps for thermophysical what-if studies.
+
+A sweep varies some fields of a base `Planet` (for example `Gamma`, `albedo`,
+`emissivity`, `H` and `Qb`) over a Cartesian product or a Latin hypercube sample. The
+samples are kept as one array per field and handed to the model in chunks as a
+:class:`ParameterBatch`, which looks like the base body except that the swept fields
+are arrays; the `Planet` itself is never copied.
+
+Results are written chunk by chunk to Parquet (needs pyarrow), HDF5 (needs h5py) or
+NumPy ``.npz`` files, so an interrupted sweep can be resumed and only the missing
+chunks are computed again::
+
+    import numpy as np
+    from planets import Moon, sweep, thermal
+
+    def model(batch):
+        return {"T": thermal.equilibrium_temperature(batch, 0.0)}
+
+    s = sweep.Sweep(Moon, {"albedo": np.linspace(0.05, 0.2, 16), "emissivity": [0.9, 0.95]})
+    s.run(model, "moon-sweep", processes=4)
+    results = sweep.load_results("moon-sweep")
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+__all__ = ["ParameterBatch", "Sweep", "product_samples", "latin_hypercube", "load_results"]
+
+FORMATS = ("parquet", "hdf5", "npz")
+
+MANIFEST = "sweep.json"
+HDF5_FILE = "sweep.h5"
+
+
+class ParameterBatch:
+    """A base body with some of its fields replaced by arrays of samples.
+
+    Attribute access returns the sample column for swept fields and the base body's
+    value for all others, so a batch can be passed to vectorized model functions that
+    expect a `Planet`.
+    """
+
+    def __init__(self, base, columns: Dict[str, np.ndarray]):
+        self.base = base
+        self.columns = columns
+
+    def __getattr__(self, name):
+        # Only called for names not found normally, i.e. body fields
+        columns = self.__dict__.get("columns")
+        if columns is None:
+            raise AttributeError(name)
+        if name in columns:
+            return columns[name]
+        return getattr(self.__dict__["base"], name)
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def reshape(self, *shape) -> "ParameterBatch":
+        """Get a batch with all sample columns reshaped.
+
+        ``batch.reshape(-1, 1)`` puts the samples along a new axis, so that they
+        broadcast against a grid of, for example, incidence angles.
+        """
+        return ParameterBatch(
+            self.base, {name: values.reshape(*shape) for name, values in self.columns.items()}
+        )
+
+    def __repr__(self):
+        return f"ParameterBatch({self.base.name}, {len(self)} samples of {list(self.columns)})"
+
+
+def product_samples(ranges: Dict[str, Sequence[float]]) -> Dict[str, np.ndarray]:
+    """Get the Cartesian product of parameter values as columns.
+
+    Parameters
+    ----------
+    ranges : Dict[str, Sequence[float]]
+        Values of each parameter
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        One array per parameter, the first parameter varying slowest
+    """
+    grids = np.meshgrid(*[np.asarray(v, dtype=float) for v in ranges.values()], indexing="ij")
+    return {name: grid.reshape(-1) for name, grid in zip(ranges, grids)}
+
+
+def latin_hypercube(
+    bounds: Dict[str, Tuple[float, float]], n: int, seed: Optional[int] = None
+) -> Dict[str, np.ndarray]:
+    """Draw a Latin hypercube sample of parameters within bounds.
+
+    Parameters
+    ----------
+    bounds : Dict[str, Tuple[float, float]]
+        Lower and upper bound of each parameter
+    n : int
+        Number of samples
+    seed : int, optional
+        Seed of the random number generator
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        One array of `n` samples per parameter, each stratum of each parameter holding
+        exactly one sample
+    """
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for name, (low, high) in bounds.items():
+        strata = (rng.permutation(n) + rng.random(n)) / n
+        columns[name] = low + strata * (high - low)
+    return columns
+
+
+def _evaluate_chunk(model, base, columns, index):
+    """Evaluate the model on one chunk, in a worker process or in-process."""
+    outputs = model(ParameterBatch(base, columns))
+    if not isinstance(outputs, dict):
+        outputs = {"result": outputs}
+    return index, {name: np.asarray(value) for name, value in outputs.items()}
+
+
+class Sweep:
+    """A set of parameter samples around a base body.
+
+    Parameters
+    ----------
+    base : Planet
+        The body providing the values of all fields that are not swept
+    ranges : Dict[str, Sequence[float]], optional
+        For method "product", the values of each swept field
+    method : str, optional
+        "product" for the Cartesian product of `ranges` or "lhs" for a Latin hypercube
+        sample within `bounds`, by default "product"
+    bounds : Dict[str, Tuple[float, float]], optional
+        For method "lhs", the lower and upper bound of each swept field
+    n : int, optional
+        For method "lhs", the number of samples
+    seed : int, optional
+        For method "lhs", the seed of the random number generator
+    """
+
+    def __init__(
+        self,
+        base,
+        ranges: Optional[Dict[str, Sequence[float]]] = None,
+        method: str = "product",
+        bounds: Optional[Dict[str, Tuple[float, float]]] = None,
+        n: Optional[int] = None,
+        seed: Optional[int] = None,
+    ):
+        if method == "product":
+            columns = product_samples(ranges or {})
+        elif method == "lhs":
+            if bounds is None or n is None:
+                raise ValueError("method 'lhs' needs bounds and n")
+            columns = latin_hypercube(bounds, n, seed)
+        else:
+            raise ValueError(f"Unknown method: {method}. Use 'product' or 'lhs'")
+        for name in columns:
+            if not hasattr(base, name):
+                raise ValueError(f"{base.name} has no field {name!r}")
+        self.base = base
+        self.columns = columns
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def batch(self, start: int = 0, stop: Optional[int] = None) -> ParameterBatch:
+        """Get the samples from `start` to `stop` as a ParameterBatch."""
+        return ParameterBatch(
+            self.base, {name: values[start:stop] for name, values in self.columns.items()}
+        )
+
+    def fingerprint(self) -> str:
+        """Hash identifying the samples, used to refuse resuming a different sweep."""
+        fields = sorted((k, v) for k, v in vars(self.base).items() if not k.startswith("_"))
+        digest = hashlib.sha256(repr(fields).encode())
+        for name, values in sorted(self.columns.items()):
+            digest.update(name.encode())
+            digest.update(np.ascontiguousarray(values).tobytes())
+        return digest.hexdigest()
+
+    def run(
+        self,
+        model: Callable[[ParameterBatch], Any],
+        output: Union[str, Path],
+        format: str = "npz",
+        chunk_size: int = 1024,
+        processes: Optional[int] = None,
+    ) -> Path:
+        """Evaluate `model` on all samples and write the results chunk by chunk.
+
+        Parameters
+        ----------
+        model : callable
+            Called with a ParameterBatch, returns an array with one entry (or row) per
+            sample, or a dict of such arrays. Must be picklable when `processes` is set.
+        output : Union[str, Path]
+            Output directory. Chunks already present there from an earlier, interrupted
+            run of the same sweep are not computed again.
+        format : str, optional
+            "parquet", "hdf5" or "npz", by default "npz"
+        chunk_size : int, optional
+            Number of samples per chunk, by default 1024
+        processes : int, optional
+            Number of worker processes, by default the model runs in this process
+
+        Returns
+        -------
+        Path
+            The output directory
+        """
+        if format not in FORMATS:
+            raise ValueError(f"Unknown format: {format}. Use one of {', '.join(FORMATS)}")
+        output = Path(output)
+        writer = _open_writer(output, format, self, chunk_size)
+        todo = [i for i in range(writer.n_chunks) if not writer.is_done(i)]
+
+        def chunk_args(index):
+            start = index * chunk_size
+            return model, self.base, self.batch(start, start + chunk_size).columns, index
+
+        try:
+            if not processes:
+                for index in todo:
+                    writer.write(*_evaluate_chunk(*chunk_args(index)))
+                return output
+
+            with ProcessPoolExecutor(processes) as executor:
+                todo = iter(todo)
+                pending = set()
+                for index in todo:
+                    pending.add(executor.submit(_evaluate_chunk, *chunk_args(index)))
+                    if len(pending) < 2 * processes:
+                        continue
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        writer.write(*future.result())
+                for future in pending:
+                    writer.write(*future.result())
+        finally:
+            writer.close()
+        return output
+
+
+def _open_writer(output: Path, format: str, sweep: Sweep, chunk_size: int):
+    output.mkdir(parents=True, exist_ok=True)
+    manifest_path = output / MANIFEST
+    manifest = {
+        "format": format,
+        "fingerprint": sweep.fingerprint(),
+        "n_samples": len(sweep),
+        "chunk_size": chunk_size,
+        "parameters": list(sweep.columns),
+    }
+    if manifest_path.exists():
+        existing = json.loads(manifest_path.read_text())
+        if existing != manifest:
+            raise ValueError(f"{output} holds the results of a different sweep")
+    else:
+        manifest_path.write_text(json.dumps(manifest, indent=2))
+    writer = {"parquet": _ParquetWriter, "hdf5": _HDF5Writer, "npz": _NPZWriter}[format]
+    return writer(output, sweep, chunk_size)
+
+
+class _ChunkFileWriter:
+    """Writes one file per chunk, renamed into place once complete."""
+
+    suffix = ""
+
+    def __init__(self, output: Path, sweep: Sweep, chunk_size: int):
+        self.output = output
+        self.sweep = sweep
+        self.chunk_size = chunk_size
+        self.n_chunks = -(-len(sweep) // chunk_size)
+
+    def path(self, index: int) -> Path:
+        return self.output / f"part-{index:06d}{self.suffix}"
+
+    def is_done(self, index: int) -> bool:
+        return self.path(index).exists()
+
+    def write(self, index: int, outputs: Dict[str, np.ndarray]):
+        start = index * self.chunk_size
+        columns = dict(self.sweep.batch(start, start + self.chunk_size).columns)
+        columns["sample"] = np.arange(start, start + len(next(iter(columns.values()))))
+        columns.update(outputs)
+        temporary = self.path(index).with_name(self.path(index).name + ".tmp")
+        self._dump(temporary, columns)
+        os.replace(temporary, self.path(index))
+
+    def close(self):
+        pass
+
+
+class _NPZWriter(_ChunkFileWriter):
+    suffix = ".npz"
+
+    def _dump(self, path, columns):
+        with open(path, "wb") as f:
+            np.savez(f, **columns)
+
+
+class _ParquetWriter(_ChunkFileWriter):
+    suffix = ".parquet"
+
+    def __init__(self, *args):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as exc:
+            raise ImportError("Writing Parquet files requires pyarrow") from exc
+        super().__init__(*args)
+
+    def _dump(self, path, columns):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        arrays = {}
+        for name, values in columns.items():
+            if values.ndim > 1:
+                # Store each row of multi-dimensional outputs as a fixed size list
+                flat = pa.array(values.reshape(len(values), -1).ravel())
+                values = pa.FixedSizeListArray.from_arrays(flat, int(np.prod(values.shape[1:])))
+            arrays[name] = values
+        pq.write_table(pa.table(arrays), path)
+
+
+class _HDF5Writer:
+    """Writes all chunks into one HDF5 file, with a flag per completed chunk."""
+
+    def __init__(self, output: Path, sweep: Sweep, chunk_size: int):
+        try:
+            import h5py
+        except ImportError as exc:
+            raise ImportError("Writing HDF5 files requires h5py") from exc
+        self.sweep = sweep
+        self.chunk_size = chunk_size
+        self.n_chunks = -(-len(sweep) // chunk_size)
+        self.file = h5py.File(output / HDF5_FILE, "a")
+        if "done" not in self.file:
+            self.file.create_dataset("done", data=np.zeros(self.n_chunks, dtype=bool))
+            for name, values in sweep.columns.items():
+                self.file.create_dataset(f"parameters/{name}", data=values)
+        self.done = self.file["done"][:]
+
+    def is_done(self, index: int) -> bool:
+        return bool(self.done[index])
+
+    def write(self, index: int, outputs: Dict[str, np.ndarray]):
+        start = index * self.chunk_size
+        n = len(self.sweep)
+        for name, values in outputs.items():
+            key = f"results/{name}"
+            if key not in self.file:
+                self.file.create_dataset(key, shape=(n,) + values.shape[1:], dtype=values.dtype)
+            self.file[key][start : start + len(values)] = values
+        self.done[index] = True
+        self.file["done"][index] = True
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def _to_numpy(column) -> np.ndarray:
+    """Convert a Parquet column back to an array, including fixed size list columns."""
+    import pyarrow as pa
+
+    column = column.combine_chunks()
+    if pa.types.is_fixed_size_list(column.type):
+        return column.flatten().to_numpy().reshape(len(column), column.type.list_size)
+    return column.to_numpy()
+
+
+def load_results(output: Union[str, Path]) -> Dict[str, np.ndarray]:
+    """Read the parameters and results of a sweep written by Sweep.run().
+
+    Parameters
+    ----------
+    output : Union[str, Path]
+        The output directory of the sweep
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        The parameter and result columns of all completed chunks, in sample order,
+        with a "sample" column holding the index of each sample
+    """
+    output = Path(output)
+    manifest = json.loads((output / MANIFEST).read_text())
+    if manifest["format"] == "hdf5":
+        import h5py
+
+        with h5py.File(output / HDF5_FILE, "r") as f:
+            done = np.repeat(f["done"][:], manifest["chunk_size"])[: manifest["n_samples"]]
+            columns = {"sample": np.flatnonzero(done)}
+            for group in ("parameters", "results"):
+                for name, dataset in f.get(group, {}).items():
+                    columns[name] = dataset[:][done]
+        return columns
+
+    parts = sorted(output.glob("part-*." + manifest["format"]))
+    if manifest["format"] == "npz":
+        chunks = []
+        for part in parts:
+            with np.load(part) as data:
+                chunks.append({name: data[name] for name in data.files})
+    else:
+        import pyarrow.parquet as pq
+
+        chunks = []
+        for part in parts:
+            table = pq.read_table(part)
+            chunks.append({name: _to_numpy(table[name]) for name in table.column_names})
+    if not chunks:
+        return {}
+    return {name: np.concatenate([chunk[name] for chunk in chunks]) for name in chunks[0]}
@@ -0,0 +1,197 @@
+"""Generator for synthetic SPICE text kernels.
+
+The kernels produced here follow the layout of the generic NAIF PCK files (comment
+sections alternating with ``\\begindata``/``\\begintext`` data sections) but can be
+made arbitrarily large, with long multi-line arrays and ``+=`` continuations. Every
+generator also returns the constants a correct parser must produce, in the format of
+``pck_parser.parse_pck_file``, so the kernels can be used for correctness tests as
+well as for scaling benchmarks. Everything runs offline.
+"""
+
+import random
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Union
+
+__all__ = ["generate_kernel", "write_kernel", "n_keys_for_size"]
+
+# NAIF IDs used first, so that name lookups work on synthetic kernels
+KNOWN_BODY_IDS = [10, 199, 299, 399, 301, 499, 401, 402, 599, 501, 502, 503, 504, 699, 606]
+KNOWN_BODY_IDS += [799, 899, 801, 999, 901]
+
+QUANTITIES = ["RADII", "POLE_RA", "POLE_DEC", "PM", "NUT_PREC_RA", "NUT_PREC_DEC", "LONG_AXIS"]
+
+# Formats used for the numbers, mixing the styles found in NAIF kernels
+NUMBER_FORMATS = ["{:.6f}", "{:.10E}", "{:.1f}", "{:.3f}"]
+
+COMMENT_WORDS = (
+    "the values of the constants below are taken from the report of the IAU working "
+    "group on cartographic coordinates and rotational elements and are given in "
+    "kilometers and degrees"
+).split()
+
+
+def _format_number(rng: random.Random) -> str:
+    return rng.choice(NUMBER_FORMATS).format(rng.uniform(-1000.0, 1000.0))
+
+
+def _comment_block(rng: random.Random, n_lines: int, with_assignments: bool) -> List[str]:
+    lines = []
+    for i in range(n_lines):
+        if with_assignments and i % 4 == 1:
+            # Comments of real kernels quote assignments, a parser must skip these
+            lines.append(f"   BODY{rng.choice(KNOWN_BODY_IDS)}_RADII = ( 1.0 2.0 3.0 )")
+        else:
+            lines.append(" ".join(rng.choice(COMMENT_WORDS) for _ in range(12)))
+    return lines
+
+
+def _assignment(key: str, op: str, values: List[str], per_line: int, array: bool) -> List[str]:
+    head = f"{key:<24}{op} "
+    if not array:
+        return [head + values[0]]
+    if len(values) <= per_line:
+        return [head + "( " + "  ".join(values) + " )"]
+    indent = " " * (len(head) + 2)
+    rows = ["  ".join(values[i : i + per_line]) for i in range(0, len(values), per_line)]
+    lines = [head + "( " + rows[0]]
+    lines += [indent + row for row in rows[1:]]
+    lines[-1] += " )"
+    return lines
+
+
+def generate_kernel(
+    n_keys: int = 200,
+    array_length: int = 3,
+    values_per_line: int = 5,
+    keys_per_block: int = 20,
+    comment_lines: int = 10,
+    comment_assignments: bool = True,
+    continuation_fraction: float = 0.0,
+    scalar_fraction: float = 0.1,
+    seed: int = 0,
+) -> Tuple[str, Dict[str, Any]]:
+    """Generate the text of a synthetic SPICE text kernel.
+
+    Parameters
+    ----------
+    n_keys : int, optional
+        Number of distinct keys, by default 200
+    array_length : int, optional
+        Number of values of array-valued keys other than ``BODY*_RADII`` (which always
+        have three), by default 3
+    values_per_line : int, optional
+        Number of array values per line, longer arrays are wrapped, by default 5
+    keys_per_block : int, optional
+        Number of keys per ``\\begindata`` section, by default 20
+    comment_lines : int, optional
+        Number of lines of each comment section, by default 10
+    comment_assignments : bool, optional
+        Whether comment sections quote assignments that must not be parsed, by default True
+    continuation_fraction : float, optional
+        Fraction of array keys whose values are split between an ``=`` and a later
+        ``+=`` assignment, by default 0.0
+    scalar_fraction : float, optional
+        Fraction of keys holding a single value without parentheses, by default 0.1
+    seed : int, optional
+        Seed of the random number generator, by default 0
+
+    Returns
+    -------
+    Tuple[str, Dict[str, Any]]
+        The kernel text and the constants a parser must extract from it, in the format
+        returned by ``pck_parser.parse_pck_file``
+    """
+    rng = random.Random(seed)
+    lines = ["KPL/PCK", ""]
+    lines += _comment_block(rng, comment_lines, comment_assignments)
+    expected: Dict[str, Any] = {}
+    pending: List[Tuple[str, List[str]]] = []  # continuations for the next data section
+
+    block = 0
+    for start in range(0, n_keys, keys_per_block):
+        block += 1
+        lines += ["", "\\begindata", ""]
+        # Continuations left over from the previous section go first
+        for key, values in pending:
+            lines += _assignment(key, "+=", values, values_per_line, True)
+        pending = []
+
+        for index in range(start, min(start + keys_per_block, n_keys)):
+            quantity = QUANTITIES[index % len(QUANTITIES)]
+            position = index // len(QUANTITIES)
+            if position < len(KNOWN_BODY_IDS):
+                body_id = KNOWN_BODY_IDS[position]
+            else:
+                body_id = 1000 + position
+            key = f"BODY{body_id}_{quantity}"
+
+            if quantity != "RADII" and rng.random() < scalar_fraction:
+                value = _format_number(rng)
+                lines += _assignment(key, "=", [value], values_per_line, False)
+                expected[key] = {"value": float(value), "block": block}
+                continue
+
+            length = 3 if quantity == "RADII" else array_length
+            values = [_format_number(rng) for _ in range(length)]
+            expected[key] = {"value": [float(v) for v in values], "block": block}
+
+            if length > 1 and rng.random() < continuation_fraction:
+                split = rng.randint(1, length - 1)
+                lines += _assignment(key, "=", values[:split], values_per_line, True)
+                if rng.random() < 0.5:
+                    lines += _assignment(key, "+=", values[split:], values_per_line, True)
+                else:
+                    pending.append((key, values[split:]))
+            else:
+                lines += _assignment(key, "=", values, values_per_line, True)
+
+        lines += ["", "\\begintext", ""]
+        lines += _comment_block(rng, comment_lines, comment_assignments)
+
+    if pending:
+        lines += ["", "\\begindata", ""]
+        for key, values in pending:
+            lines += _assignment(key, "+=", values, values_per_line, True)
+        lines += ["", "\\begintext", ""]
+
+    return "\n".join(lines) + "\n", expected
+
+
+def write_kernel(path: Union[str, Path], **options) -> Dict[str, Any]:
+    """Write a synthetic SPICE text kernel to `path`.
+
+    Parameters
+    ----------
+    path : Union[str, Path]
+        Destination file
+    **options
+        Keyword arguments passed on to generate_kernel()
+
+    Returns
+    -------
+    Dict[str, Any]
+        The constants a parser must extract from the written kernel
+    """
+    text, expected = generate_kernel(**options)
+    Path(path).write_text(text, encoding="utf-8")
+    return expected
+
+
+def n_keys_for_size(size: int, **options) -> int:
+    """Estimate the number of keys giving a kernel of about `size` bytes.
+
+    Parameters
+    ----------
+    size : int
+        Target size of the kernel in bytes
+    **options
+        Keyword arguments for generate_kernel(), other than n_keys
+
+    Returns
+    -------
+    int
+        Number of keys to pass to generate_kernel()
+    """
+    sample_keys = 500
+    text, _ = generate_kernel(n_keys=sample_keys, **options)
+    return max(1, round(size * sample_keys / len(text.encode("utf-8"))))
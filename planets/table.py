@@ -0,0 +1,178 @@
+"""Column-oriented table of scalar `Planet` fields.
+
+A `BodyTable` holds one float64 column per field with one row per body, with NaN
+where a body has no value. Columns are plain numpy arrays in the units the fields are
+stored in; :meth:`BodyTable.quantity` converts a whole column to an astropy Quantity
+in one array operation using the schema in planets.units. Range and nearest-neighbour
+queries over the columns use the indexes of planets.index.
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .index import KDTree, SortedIndex
+from .units import FIELD_UNITS, column_quantity, unit_of
+
+__all__ = ["BodyTable", "body_table"]
+
+
+class BodyTable:
+    """Table of scalar body fields, one float64 column per field.
+
+    Parameters
+    ----------
+    bodies : iterable of Planet
+        The bodies, one row each
+    fields : sequence of str, optional
+        Names of the columns, by default all fields of the units schema
+    with_radius : bool, optional
+        Whether to include `R`, which is looked up in the PCK kernel for most bodies,
+        by default True
+    """
+
+    def __init__(
+        self,
+        bodies: Iterable = (),
+        fields: Optional[Sequence[str]] = None,
+        with_radius: bool = True,
+    ):
+        if fields is None:
+            fields = [name for name in FIELD_UNITS if with_radius or name != "R"]
+        self.fields: List[str] = list(fields)
+        self.names: List[str] = []
+        self.columns: Dict[str, np.ndarray] = {
+            name: np.empty(0, dtype=np.float64) for name in self.fields
+        }
+        # Indexes built on first use by select() and nearest(), updated by append()
+        self._sorted: Dict[str, SortedIndex] = {}
+        self._trees: Dict[Tuple, KDTree] = {}
+        self.append(*bodies)
+
+    @classmethod
+    def from_columns(cls, names: Sequence[str], columns: Dict[str, np.ndarray]) -> "BodyTable":
+        """Wrap existing column arrays, without copying them, in a BodyTable."""
+        table = cls(fields=list(columns))
+        table.names = list(names)
+        table.columns = dict(columns)
+        return table
+
+    def append(self, *bodies):
+        """Add rows for the given bodies."""
+        if not bodies:
+            return
+        rows = {name: [] for name in self.fields}
+        for body in bodies:
+            self.names.append(body.name)
+            for name in self.fields:
+                value = getattr(body, name, None)
+                rows[name].append(np.nan if value is None else value)
+        start = len(self.names) - len(bodies)
+        new_rows = np.arange(start, len(self.names))
+        for name in self.fields:
+            self.columns[name] = np.concatenate(
+                [self.columns[name], np.asarray(rows[name], dtype=np.float64)]
+            )
+        for name, index in self._sorted.items():
+            index.extend(self.columns[name][start:], new_rows)
+        for (fields, scale), tree in self._trees.items():
+            tree.extend(self._points(fields, scale, start), new_rows)
+
+    def __len__(self):
+        return len(self.names)
+
+    def _points(self, fields: Tuple[str, ...], scale, start: int = 0) -> np.ndarray:
+        points = np.stack([self.columns[name][start:] for name in fields], axis=1)
+        return points if scale is None else points / np.asarray(scale)
+
+    def select(
+        self, field: str, low: Optional[float] = None, high: Optional[float] = None
+    ) -> np.ndarray:
+        """Get the rows with `field` in [low, high] using a sorted index of the column.
+
+        Parameters
+        ----------
+        field : str
+            Name of the column
+        low, high : float, optional
+            Inclusive bounds, by default unbounded
+
+        Returns
+        -------
+        np.ndarray
+            Row numbers in increasing order of the column value, see `names`
+        """
+        index = self._sorted.get(field)
+        if index is None:
+            index = self._sorted[field] = SortedIndex(self.columns[field])
+        return index.range(low, high)
+
+    def nearest(
+        self,
+        target,
+        fields: Sequence[str],
+        k: int = 1,
+        scale: Optional[Sequence[float]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the k bodies nearest to a target in the space of some columns.
+
+        Parameters
+        ----------
+        target : str, Planet or sequence of float
+            Name of a body in the table (which is left out of the result), a body or
+            coordinates in `fields`
+        fields : sequence of str
+            Names of the columns spanning the space, e.g. ("rAU", "eccentricity")
+        k : int, optional
+            Number of neighbours, by default 1
+        scale : sequence of float, optional
+            Divisor of each column before computing Euclidean distances, by default 1
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Row numbers and distances of the neighbours, nearest first
+        """
+        fields = tuple(fields)
+        key = (fields, None if scale is None else tuple(scale))
+        tree = self._trees.get(key)
+        if tree is None:
+            tree = self._trees[key] = KDTree(self._points(*key))
+
+        exclude = None
+        if isinstance(target, str):
+            exclude = self.names.index(target)
+            point = [self.columns[name][exclude] for name in fields]
+        elif hasattr(target, "name"):
+            point = [getattr(target, name) for name in fields]
+        else:
+            point = list(target)
+        point = np.asarray(point, dtype=float) / (1 if scale is None else np.asarray(scale))
+
+        distances, rows = tree.query(point, k + (exclude is not None))
+        if exclude is not None:
+            keep = rows != exclude
+            distances, rows = distances[keep][:k], rows[keep][:k]
+        return rows, distances
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.columns[field]
+
+    def units(self, field: str) -> List[Optional[str]]:
+        """Get the unit of each row of a column, see planets.units.unit_of()."""
+        return [unit_of(name, field) for name in self.names]
+
+    def quantity(self, field: str, unit: Optional[str] = None):
+        """Get a column as an astropy Quantity, see planets.units.column_quantity()."""
+        return column_quantity(self, field, unit)
+
+    def __repr__(self):
+        return f"BodyTable({len(self)} bodies x {len(self.fields)} fields)"
+
+
+def body_table(fields: Optional[Sequence[str]] = None, with_radius: bool = True) -> BodyTable:
+    """Build a `BodyTable` of all built-in bodies, see BodyTable for the parameters."""
+    from . import _planets
+
+    bodies = [getattr(_planets, name) for name in _planets._BODY_NAMES]
+    return BodyTable(bodies, fields, with_radius)
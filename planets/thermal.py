@@ -0,0 +1,164 @@
+"""Instantaneous radiative-equilibrium surface temperatures.
+
+Unlike `Planet.Teq`, which averages over the whole sphere at the annual-mean solar
+constant, the functions here give the temperature a surface element would reach in
+instantaneous radiative equilibrium with the incident sunlight,
+
+    T = ((1 - A(i)) * F * cos(i) / (emissivity * sigma)) ** 0.25
+
+using the incidence-angle dependent albedo model of Keihm (1984) and Hayne et al.
+(2017), ``A(i) = albedo + a * (i / 45 deg)**3 + b * (i / 90 deg)**8`` with
+``[a, b] = Planet.albedoCoef``.
+
+The evaluation works in place on the output array with a single scratch buffer, so
+besides the result no array of the size of the input is allocated. Large inputs are
+processed in chunks, and ``dtype=np.float32`` halves the memory of very large maps.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from .constants import sigma
+
+__all__ = ["variable_albedo", "equilibrium_temperature", "equilibrium_temperatures"]
+
+# Number of elements evaluated at once, bounds the size of the scratch buffer
+CHUNK_SIZE = 2**20
+
+
+def _albedo_parameters(body):
+    if body.albedo is None:
+        raise ValueError(f"{body.name} has no value for 'albedo'")
+    a, b = body.albedoCoef
+    return body.albedo, a, b
+
+
+def variable_albedo(body, incidence) -> np.ndarray:
+    """Get the albedo of a body at the given solar incidence angles.
+
+    Parameters
+    ----------
+    body : Planet
+        The body, providing `albedo` and `albedoCoef`
+    incidence : array_like
+        Solar incidence angle [radian]
+
+    Returns
+    -------
+    np.ndarray
+        Albedo [fraction]
+    """
+    A0, a, b = _albedo_parameters(body)
+    x = np.asarray(incidence) / (np.pi / 2)
+    return A0 + a * (2 * x) ** 3 + b * x**8
+
+
+def _evaluate(incidence, out, scratch, A0, a, b, F, emissivity):
+    """Evaluate the equilibrium temperature of `incidence` into `out` in place."""
+    w = scratch
+    np.multiply(incidence, 2 / np.pi, out=w)  # i / 90 deg
+    np.power(w, 8, out=out)
+    out *= b
+    np.power(w, 3, out=w)
+    w *= 8 * a  # a * (i / 45 deg)**3
+    out += w
+    out += A0
+    np.subtract(1, out, out=out)  # 1 - A(i)
+    np.cos(incidence, out=w)
+    np.maximum(w, 0, out=w)  # no sunlight beyond the terminator
+    out *= w
+    out *= F / (emissivity * sigma)
+    np.sqrt(out, out=out)
+    np.sqrt(out, out=out)
+    return out
+
+
+def equilibrium_temperature(
+    body,
+    incidence,
+    solar_flux=None,
+    out: Optional[np.ndarray] = None,
+    dtype=None,
+) -> np.ndarray:
+    """Get the instantaneous radiative-equilibrium temperature at given incidence angles.
+
+    Parameters
+    ----------
+    body : Planet
+        The body, providing `albedo`, `albedoCoef`, `emissivity` and `S`. The
+        parameters may also be arrays broadcasting against `incidence`.
+    incidence : array_like
+        Solar incidence angle [radian]. Angles of 90 degrees and more give 0 K.
+    solar_flux : array_like, optional
+        Solar flux at normal incidence [W.m-2], by default the body's `S`
+    out : np.ndarray, optional
+        C-contiguous array receiving the result, of the shape of `incidence` broadcast
+        against the parameters
+    dtype : numpy dtype, optional
+        Data type of the result when `out` is not given, by default float64. Use
+        np.float32 for very large maps.
+
+    Returns
+    -------
+    np.ndarray
+        Surface temperature [K]
+    """
+    if body.emissivity is None:
+        raise ValueError(f"{body.name} has no value for 'emissivity'")
+    A0, a, b = _albedo_parameters(body)
+    F = body.S if solar_flux is None else solar_flux
+    emissivity = body.emissivity
+
+    incidence = np.asarray(incidence)
+    parameters = (A0, a, b, F, emissivity)
+    shape = np.broadcast(incidence, *parameters).shape
+    if out is None:
+        out = np.empty(shape, dtype=dtype or np.float64)
+    elif out.shape != shape:
+        raise ValueError(f"out has shape {out.shape}, expected {shape}")
+
+    if any(np.ndim(value) for value in parameters) or incidence.size <= CHUNK_SIZE:
+        # Array-valued parameters broadcast over the whole input in one pass
+        scratch = np.empty(shape, dtype=out.dtype)
+        return _evaluate(incidence, out, scratch, *parameters)
+
+    if not out.flags.c_contiguous:
+        raise ValueError("out must be C-contiguous")
+    flat_incidence = np.ascontiguousarray(incidence).reshape(-1)
+    flat_out = out.reshape(-1)
+    scratch = np.empty(CHUNK_SIZE, dtype=out.dtype)
+    for start in range(0, flat_incidence.size, CHUNK_SIZE):
+        chunk = slice(start, start + CHUNK_SIZE)
+        n = flat_out[chunk].size
+        _evaluate(flat_incidence[chunk], flat_out[chunk], scratch[:n], *parameters)
+    return out
+
+
+def equilibrium_temperatures(bodies, incidence, solar_flux=None, dtype=None) -> np.ndarray:
+    """Get equilibrium temperatures for several bodies at once.
+
+    Parameters
+    ----------
+    bodies : sequence of Planet
+        The bodies
+    incidence : array_like
+        Solar incidence angles [radian], with a leading axis of one entry per body
+    solar_flux : array_like, optional
+        Solar flux at normal incidence [W.m-2] per body, by default each body's `S`
+    dtype : numpy dtype, optional
+        Data type of the result, by default float64
+
+    Returns
+    -------
+    np.ndarray
+        Surface temperature [K], of the shape of `incidence`
+    """
+    incidence = np.asarray(incidence)
+    if len(bodies) != incidence.shape[0]:
+        raise ValueError(f"Got {len(bodies)} bodies for {incidence.shape[0]} incidence rows")
+    out = np.empty(incidence.shape, dtype=dtype or np.float64)
+    for k, body in enumerate(bodies):
+        flux = None if solar_flux is None else solar_flux[k]
+        equilibrium_temperature(body, incidence[k], flux, out=out[k])
+    return out
@@ -0,0 +1,191 @@
+"""Units of the `Planet` fields.
+
+`FIELD_UNITS` is the single description of the unit every field is stored in, and
+`BODY_UNITS` lists the bodies that store a field in a different unit (the obliquity
+of Jupiter and its moons, the Moon and Bennu is given in radians, that of all other
+bodies in degrees). The command line interface, the illumination engine and the
+`astropy.units.Quantity` views below all use this schema.
+
+Plain attribute access on a `Planet` is not affected. :func:`quantity_view` (also
+available as `Planet.quantities`) returns a view converting fields to Quantities on
+first access and caching the result until the field changes, and
+:func:`column_quantity` converts a whole `BodyTable` column in one array operation.
+astropy is only imported when a Quantity is actually created.
+"""
+
+import math
+import weakref
+from typing import Any, Dict, NamedTuple, Optional
+
+from .constants import AU
+
+__all__ = [
+    "FieldUnit",
+    "FIELD_UNITS",
+    "BODY_UNITS",
+    "unit_of",
+    "label_of",
+    "si_value",
+    "quantity_view",
+    "column_quantity",
+]
+
+
+class FieldUnit(NamedTuple):
+    """Unit of a field as an astropy unit string and as a label for display."""
+
+    unit: str
+    label: str
+
+
+FIELD_UNITS: Dict[str, FieldUnit] = {
+    "R": FieldUnit("m", "meters"),
+    "g": FieldUnit("m / s2", "m/s²"),
+    "S": FieldUnit("W / m2", "W/m²"),
+    "psurf": FieldUnit("Pa", "Pa"),
+    "albedo": FieldUnit("", "fraction"),
+    "emissivity": FieldUnit("", "fraction"),
+    "Qb": FieldUnit("W / m2", "W/m²"),
+    "Gamma": FieldUnit("J / (m2 K s(1/2))", "J·m⁻²·K⁻¹·s⁻¹/²"),
+    "ks": FieldUnit("W / (m K)", "W·m⁻¹·K⁻¹"),
+    "kd": FieldUnit("W / (m K)", "W·m⁻¹·K⁻¹"),
+    "rhos": FieldUnit("kg / m3", "kg/m³"),
+    "rhod": FieldUnit("kg / m3", "kg/m³"),
+    "H": FieldUnit("m", "meters"),
+    "cp0": FieldUnit("J / (kg K)", "J·kg⁻¹·K⁻¹"),
+    "rsm": FieldUnit("m", "meters"),
+    "rAU": FieldUnit("AU", "AU"),
+    "year": FieldUnit("s", "seconds"),
+    "eccentricity": FieldUnit("", ""),
+    "day": FieldUnit("s", "seconds"),
+    "obliquity": FieldUnit("deg", "degrees"),
+    "Lequinox": FieldUnit("rad", "radians"),
+    "Lp": FieldUnit("rad", "radians"),
+    "Tsavg": FieldUnit("K", "K"),
+    "Tsmax": FieldUnit("K", "K"),
+    "Tsmin": FieldUnit("K", "K"),
+}
+
+RADIANS = FieldUnit("rad", "radians")
+
+# Bodies storing a field in a unit other than the one in FIELD_UNITS
+BODY_UNITS: Dict[str, Dict[str, FieldUnit]] = {
+    "Jupiter": {"obliquity": RADIANS},
+    "Europa": {"obliquity": RADIANS},
+    "Ganymede": {"obliquity": RADIANS},
+    "Moon": {"obliquity": RADIANS},
+    "Bennu": {"obliquity": RADIANS},
+}
+
+# Factors converting the units used above to SI (radians for angles)
+SI_FACTORS = {"deg": math.pi / 180, "AU": AU}
+
+
+def _field_unit(body_name: Optional[str], field: str) -> Optional[FieldUnit]:
+    override = BODY_UNITS.get(body_name, {}).get(field)
+    return override if override is not None else FIELD_UNITS.get(field)
+
+
+def unit_of(body_name: Optional[str], field: str) -> Optional[str]:
+    """Get the astropy unit string a body's field is stored in, None for unknown fields."""
+    field_unit = _field_unit(body_name, field)
+    return None if field_unit is None else field_unit.unit
+
+
+def label_of(body_name: Optional[str], field: str) -> Optional[str]:
+    """Get the display label of the unit of a body's field, None for unknown fields."""
+    field_unit = _field_unit(body_name, field)
+    return None if field_unit is None else field_unit.label
+
+
+def si_value(body, field: str) -> Optional[float]:
+    """Get a field of a body in SI units (radians for angles) without astropy.
+
+    Parameters
+    ----------
+    body : Planet
+        The body
+    field : str
+        Name of the field
+
+    Returns
+    -------
+    Optional[float]
+        The converted value, or None if the field is not set
+    """
+    value = getattr(body, field)
+    if value is None:
+        return None
+    return value * SI_FACTORS.get(unit_of(body.name, field), 1.0)
+
+
+class QuantityView:
+    """Read-only view of a `Planet` returning fields as astropy Quantities.
+
+    Each Quantity is created on first access and reused until any field of the body,
+    e.g. its name, on which some units depend, is assigned. Fields without a unit in
+    the schema are returned unchanged.
+    """
+
+    def __init__(self, body):
+        self._body = weakref.proxy(body)
+        self._cache: Dict[str, Any] = {}
+
+    def __getattr__(self, field):
+        if field.startswith("_"):
+            raise AttributeError(field)
+        value = getattr(self._body, field)
+        version = self._body.version
+        cached = self._cache.get(field)
+        if cached is not None and cached[0] == version and cached[1] is value:
+            return cached[2]
+        unit = unit_of(self._body.name, field)
+        if unit is None or value is None:
+            return value
+        import astropy.units as u
+
+        quantity = u.Quantity(value, u.Unit(unit))
+        self._cache[field] = (version, value, quantity)
+        return quantity
+
+    def __repr__(self):
+        return f"QuantityView({self._body.name})"
+
+
+_views: "weakref.WeakKeyDictionary[Any, QuantityView]" = weakref.WeakKeyDictionary()
+
+
+def quantity_view(body) -> QuantityView:
+    """Get the (cached) Quantity view of a body, see QuantityView."""
+    view = _views.get(body)
+    if view is None:
+        view = _views[body] = QuantityView(body)
+    return view
+
+
+def column_quantity(table, field: str, unit: Optional[str] = None):
+    """Convert a column of a `BodyTable` to a Quantity in one array operation.
+
+    Parameters
+    ----------
+    table : BodyTable
+        The body table
+    field : str
+        Name of the column
+    unit : str, optional
+        Unit of the result, by default the unit of the field in FIELD_UNITS. Rows
+        stored in other units (see BODY_UNITS) are converted to it.
+
+    Returns
+    -------
+    astropy.units.Quantity
+        The column, with NaN for bodies without a value
+    """
+    import astropy.units as u
+    import numpy as np
+
+    target = u.Unit(unit if unit is not None else FIELD_UNITS[field].unit)
+    row_units = [unit_of(name, field) for name in table.names]
+    factors = {name: u.Unit(name).to(target) for name in set(row_units)}
+    scale = np.array([factors[name] for name in row_units])
+    return u.Quantity(table[field] * scale, target, copy=False)
@@ -0,0 +1,213 @@
+"""Consistency checks of the body catalogue against the kernel and derived relations.
+
+Each check compares one field of every body with the value expected from the PCK
+kernel or from other fields, as one array operation over a `BodyTable`:
+
+========== ================================================================
+check      expected value
+========== ================================================================
+rAU        ``rsm / AU``
+S          ``SOLAR_CONSTANT / rAU**2``
+year       Kepler's third law, ``2 pi sqrt(rsm**3 / GM_sun)``
+obliquity  in [0, pi] once converted with the unit schema of planets.units
+R          mean kernel radius, for hand-entered radii
+g          ``GM / R_eq**2`` from the kernel's ``BODYnnn_GM`` and radii
+========== ================================================================
+
+A row fails when its relative error exceeds the check's tolerance in `TOLERANCES`
+and is missing when either side is unknown, e.g. a body absent from the kernel or a
+kernel without GM values (the generic PCK has none; pass the constants of a GM kernel
+parsed together with it). The report is a plain dict ready for JSON::
+
+    report = validation.validate()
+    report["valid"], report["summary"]["year"], report["findings"][0]
+"""
+
+import math
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .constants import AU
+
+__all__ = ["CHECKS", "TOLERANCES", "validate", "format_report"]
+
+# Nominal solar values (IAU 2015 Resolution B3)
+SOLAR_CONSTANT = 1361.0  # Total solar irradiance at 1 AU [W.m-2]
+GM_SUN = 1.3271244e20  # Solar mass parameter [m3.s-2]
+
+CHECKS = ("rAU", "S", "year", "obliquity", "R", "g")
+
+# Relative tolerance of each check
+TOLERANCES: Dict[str, float] = {
+    "rAU": 1e-9,
+    "S": 0.03,
+    "year": 0.01,
+    "obliquity": 0.0,
+    "R": 0.01,
+    "g": 0.02,
+}
+
+# Fields of the catalogue the checks read
+FIELDS = ("g", "S", "rsm", "rAU", "year", "obliquity")
+
+
+def _kernel_columns(names: Sequence[str], constants: Optional[Dict[str, Any]]):
+    """Get kernel mean and equatorial radii [m] and GM [m3.s-2] per body, NaN if absent."""
+    from . import pck_parser
+    from .kernel_index import KernelIndex
+
+    index = pck_parser.load_kernel_index() if constants is None else KernelIndex(constants)
+    radii = index.values_by_body("RADII")
+    gm = index.values_by_body("GM")
+    ids = {
+        name.lower(): body_id for body_id, name in pck_parser.get_naif_body_name_mapping().items()
+    }
+
+    mean, equatorial, mu = (np.full(len(names), np.nan) for _ in range(3))
+    for row, name in enumerate(names):
+        body_id = ids.get(name.lower())
+        if body_id in radii and len(radii[body_id]) >= 3:
+            a, _, c = radii[body_id][:3]
+            mean[row] = (2 * a + c) / 3 * 1000
+            equatorial[row] = a * 1000
+        if body_id in gm:
+            mu[row] = float(np.ravel(gm[body_id])[0]) * 1e9
+    sun_gm = gm.get(10)
+    return mean, equatorial, mu, None if sun_gm is None else float(np.ravel(sun_gm)[0]) * 1e9
+
+
+def _explicit_radii(bodies) -> np.ndarray:
+    """Radii [m] set by hand, NaN for bodies whose radius comes from the kernel."""
+    radii = np.full(len(bodies), np.nan)
+    for row, body in enumerate(bodies):
+        state = vars(body)
+        if state.get("_R") is not None and "R" not in state.get("_derived", {}):
+            radii[row] = state["_R"]
+    return radii
+
+
+def _check(name, names, value, expected, tolerance, findings, summary):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        error = np.abs(value - expected) / np.abs(expected)
+    error = np.where(value == expected, 0.0, error)
+    missing = np.isnan(value) | np.isnan(expected)
+    failed = ~missing & (error > tolerance)
+    summary[name] = {
+        "ok": int((~missing & ~failed).sum()),
+        "failed": int(failed.sum()),
+        "missing": int(missing.sum()),
+    }
+    for row in np.flatnonzero(failed | missing):
+        findings.append(
+            {
+                "body": names[row],
+                "check": name,
+                "status": "missing" if missing[row] else "failed",
+                "value": None if np.isnan(value[row]) else float(value[row]),
+                "expected": None if np.isnan(expected[row]) else float(expected[row]),
+                "error": None if missing[row] else float(error[row]),
+            }
+        )
+
+
+def validate(
+    bodies: Optional[Sequence] = None,
+    constants: Optional[Dict[str, Any]] = None,
+    kernel: bool = True,
+    tolerances: Optional[Dict[str, float]] = None,
+) -> Dict[str, Any]:
+    """Check the catalogue against the kernel and the relations between fields.
+
+    Parameters
+    ----------
+    bodies : sequence of Planet, optional
+        Bodies to check, by default all built-in bodies
+    constants : Dict[str, Any], optional
+        Kernel constants, e.g. from `pck_parser.parse_multiple_files()` of a PCK and a
+        GM kernel, by default the package's kernel
+    kernel : bool, optional
+        Whether to run the kernel checks R and g, by default True
+    tolerances : Dict[str, float], optional
+        Relative tolerances overriding those of `TOLERANCES`
+
+    Returns
+    -------
+    Dict[str, Any]
+        ``{"valid", "kernel", "tolerances", "summary", "findings"}``. `summary` counts
+        the ok, failed and missing rows of each check and `findings` lists the failed
+        and missing rows with the value, the expected value and the relative error.
+        `valid` is False if any row failed. `kernel` holds the error if the kernel
+        could not be loaded, in which case its checks are left out.
+    """
+    from . import _planets
+    from .table import BodyTable
+
+    if bodies is None:
+        bodies = [getattr(_planets, name) for name in _planets._BODY_NAMES]
+    tolerances = dict(TOLERANCES, **(tolerances or {}))
+    table = BodyTable(bodies, FIELDS, with_radius=False)
+    names = table.names
+    findings: List[Dict[str, Any]] = []
+    summary: Dict[str, Dict[str, int]] = {}
+    report: Dict[str, Any] = {"kernel": {"checked": False, "error": None}}
+
+    kernel_values = None
+    if kernel:
+        try:
+            kernel_values = _kernel_columns(names, constants)
+        except Exception as error:  # network errors come in many flavours
+            report["kernel"]["error"] = f"{type(error).__name__}: {error}"
+        else:
+            report["kernel"]["checked"] = True
+    gm_sun = GM_SUN if kernel_values is None or kernel_values[3] is None else kernel_values[3]
+
+    rsm, rAU = table["rsm"], table["rAU"]
+    obliquity = table["obliquity"] * np.array(
+        [math.pi / 180 if unit == "deg" else 1.0 for unit in table.units("obliquity")]
+    )
+
+    def run(name, value, expected):
+        _check(name, names, value, expected, tolerances[name], findings, summary)
+
+    run("rAU", rAU, rsm / AU)
+    run("S", table["S"], SOLAR_CONSTANT / rAU**2)
+    run("year", table["year"], 2 * np.pi * np.sqrt(rsm**3 / gm_sun))
+    run("obliquity", obliquity, np.clip(obliquity, 0, np.pi))
+    if kernel_values is not None:
+        mean, equatorial, mu, _ = kernel_values
+        explicit = _explicit_radii(bodies)
+        run("R", np.where(np.isnan(explicit), mean, explicit), mean)
+        radius = np.where(np.isnan(equatorial), explicit, equatorial)
+        run("g", table["g"], mu / radius**2)
+
+    report.update(
+        valid=not any(counts["failed"] for counts in summary.values()),
+        tolerances={name: tolerances[name] for name in summary},
+        summary=summary,
+        findings=findings,
+    )
+    return report
+
+
+def format_report(report: Dict[str, Any], missing: bool = False) -> str:
+    """Format a report from validate() as text, by default without the missing rows."""
+    lines = [f"{'check':10} {'ok':>5} {'failed':>7} {'missing':>8}"]
+    for name, counts in report["summary"].items():
+        lines.append(f"{name:10} {counts['ok']:5} {counts['failed']:7} {counts['missing']:8}")
+    if report["kernel"]["error"] is not None:
+        lines.append(f"kernel checks skipped: {report['kernel']['error']}")
+    shown = [f for f in report["findings"] if missing or f["status"] == "failed"]
+    if shown:
+        lines.append("")
+    for finding in shown:
+        line = f"{finding['body']:10} {finding['check']:10} {finding['status']:8}"
+        if finding["status"] == "failed":
+            line += (
+                f" {finding['value']:.6g} != {finding['expected']:.6g}"
+                f" ({finding['error']:.2%} > {report['tolerances'][finding['check']]:.2%})"
+            )
+        lines.append(line.rstrip())
+    lines.append("")
+    lines.append("valid" if report["valid"] else "invalid")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,71 @@
+"""Shared fixtures for the planets test suite."""
+
+import textwrap
+
+import pytest
+
+SMALL_KERNEL = textwrap.dedent(
+    r"""
+    KPL/PCK
+
+    Small text kernel used by the tests.
+
+    \begindata
+
+    BODY399_RADII     = ( 6378.1366   6378.1366   6356.7519 )
+    BODY301_RADII     = ( 1737.4   1737.4   1737.4 )
+    BODY499_RADII     = ( 3396.19   3396.19   3376.20 )
+    BODY10_RADII      = ( 696000.   696000.   696000. )
+    BODY399_POLE_RA   = (    0.      -0.641         0. )
+    BODY399_NUT_PREC_RA = ( 0. 0. 0. 0. 0.
+                            0. 0. 0. 0. 0. )
+
+    \begintext
+
+    More comments.
+
+    \begindata
+
+    BODY606_RADII     = ( 2575.0   2575.0   2575.0 )
+    BODY599_LONG_AXIS = 0.
+
+    \begintext
+    """
+)
+
+
+@pytest.fixture
+def small_kernel(tmp_path):
+    """Path to a small PCK text kernel with a handful of bodies."""
+    path = tmp_path / "small.tpc"
+    path.write_text(SMALL_KERNEL)
+    return path
+
+
+@pytest.fixture
+def use_kernel(monkeypatch):
+    """Install a kernel as the package's kernel for one test, as ``use_kernel(path)``.
+
+    The parsed kernels are cleared before and after the test, and radii that the
+    built-in bodies look up from the kernel are forgotten afterwards. A path of None
+    makes the package retrieve its own kernel again.
+    """
+    from planets import _planets, pck_parser
+
+    def use(path):
+        monkeypatch.setattr(pck_parser, "_pck_path", None if path is None else str(path))
+        pck_parser.clear_cache()
+        for name in _planets._BODY_NAMES:
+            state = vars(getattr(_planets, name))
+            monkeypatch.setitem(state, "_R", state["_R"])
+            monkeypatch.setitem(state, "_derived", dict(state["_derived"]))
+        return path
+
+    yield use
+    pck_parser.clear_cache()
+
+
+@pytest.fixture
+def kernel(small_kernel, use_kernel):
+    """The small kernel, installed as the package's kernel."""
+    return use_kernel(small_kernel)
@@ -0,0 +1,89 @@
+"""Tests for `planets.aio`."""
+
+import asyncio
+import functools
+import hashlib
+import threading
+from http.server import HTTPServer, SimpleHTTPRequestHandler
+
+import pytest
+
+import planets
+from planets import aio, kernels, pck_parser
+from planets._planets import Planet
+
+
+@pytest.fixture
+def mirror(tmp_path, monkeypatch, small_kernel, use_kernel):
+    """Local HTTP server standing in for a kernel mirror."""
+    root = tmp_path / "mirror"
+    root.mkdir()
+    (root / "small.tpc").write_bytes(small_kernel.read_bytes())
+    (root / "pck").mkdir()
+    (root / "pck" / "pck00011.tpc").write_bytes(small_kernel.read_bytes())
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("NO_PROXY", "127.0.0.1")
+    use_kernel(None)
+
+    handler = functools.partial(SimpleHTTPRequestHandler, directory=str(root))
+    handler.log_message = lambda *args: None
+    server = HTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+@pytest.fixture
+def count_loads(monkeypatch):
+    calls = []
+    load = aio._load
+
+    def counting_load(*args):
+        calls.append(args)
+        return load(*args)
+
+    monkeypatch.setattr(aio, "_load", counting_load)
+    return calls
+
+
+def test_concurrent_loads_are_shared(mirror, count_loads):
+    url = f"{mirror}/small.tpc"
+
+    async def main():
+        return await asyncio.gather(*(aio.load_kernel(url) for _ in range(10)))
+
+    paths = asyncio.run(main())
+    assert len(count_loads) == 1
+    assert len(set(paths)) == 1
+    assert 399 in pck_parser.load_body_radii(paths[0])
+
+
+def test_default_kernel_from_mirror(mirror, small_kernel, tmp_path, monkeypatch, count_loads):
+    digest = hashlib.sha256(small_kernel.read_bytes()).hexdigest()
+    registry = tmp_path / "kernels.txt"
+    registry.write_text(f"pck/pck00011.tpc sha256:{digest}\n")
+    monkeypatch.setattr(kernels, "DEFAULT_REGISTRY", registry)
+    body = Planet()
+    body.name = "Mars"
+
+    async def main():
+        return await asyncio.gather(body.aradius(mirror=mirror), body.aradius(mirror=mirror))
+
+    radii = asyncio.run(main())
+    assert radii == [pytest.approx((2 * 3396.19 + 3376.20) / 3 * 1000)] * 2
+    assert len(count_loads) == 1
+    # The synchronous API now uses the downloaded kernel
+    assert pck_parser.get_pck_path().endswith("pck00011.tpc")
+
+
+def test_mirror_must_serve_the_known_kernel(mirror):
+    with pytest.raises(ValueError, match="SHA256 hash"):
+        asyncio.run(planets.load_kernels(mirror=mirror))
+
+
+def test_local_paths(small_kernel, count_loads):
+    paths = asyncio.run(planets.load_kernels(small_kernel, str(small_kernel)))
+    assert paths == [str(small_kernel)] * 2
+    assert len(count_loads) == 1
+    pck_parser.clear_cache()
@@ -0,0 +1,118 @@
+"""Tests for `planets.cache`."""
+
+import numpy as np
+import pytest
+
+from planets import cache, thermal
+from planets._planets import Planet
+
+calls = []
+
+
+def make_body(**fields):
+    body = Planet(R=1000.0)
+    body.name = "Testbody"
+    body.S, body.albedo, body.emissivity = 1361.0, 0.1, 0.95
+    for name, value in fields.items():
+        setattr(body, name, value)
+    return body
+
+
+def temperature(body, incidence, dtype=None):
+    calls.append(body.name)
+    return thermal.equilibrium_temperature(body, incidence, dtype=dtype)
+
+
+@pytest.fixture
+def results(kernel):
+    calls.clear()
+    return cache.ResultCache()
+
+
+def test_equal_calls_hit(results):
+    incidence = np.linspace(0, 1.5, 100)
+    first = results.call(temperature, make_body(), incidence)
+    second = results.call(temperature, make_body(), incidence.copy())
+    assert second is first and len(calls) == 1
+    assert not second.flags.writeable
+    results.call(temperature, make_body(), incidence, dtype=np.float32)
+    results.call(temperature, make_body(albedo=0.2), incidence)
+    assert len(calls) == 3 and (results.hits, results.misses) == (1, 3)
+
+
+def test_setting_a_field_invalidates(results):
+    body, incidence = make_body(), np.zeros(10)
+    teq = results.cached(temperature)
+    first = teq(body, incidence)
+    assert results.nbytes == first.nbytes
+    body.albedo = 0.5
+    assert len(results) == 0 and results.nbytes == 0
+    assert teq(body, incidence)[0] < first[0]
+    body.albedo = 0.1
+    assert teq(body, incidence)[0] == first[0] and len(calls) == 3
+
+
+def test_lru_eviction(kernel):
+    results = cache.ResultCache(max_bytes=2 * 800)
+    body = make_body()
+    keys = []
+    for i in range(3):
+        results.call(temperature, body, np.full(100, i / 10))
+        keys.append(results.key(temperature, (body, np.full(100, i / 10)), {}))
+    assert keys[0] not in results and keys[1] in results and keys[2] in results
+
+
+def test_disk_layer_is_shared(results, tmp_path):
+    incidence = np.linspace(0, 1, 50)
+    first = cache.ResultCache(directory=tmp_path).call(temperature, make_body(), incidence)
+    second = cache.ResultCache(directory=tmp_path).call(temperature, make_body(), incidence)
+    assert isinstance(second, np.memmap) and len(calls) == 1
+    np.testing.assert_array_equal(first, second)
+
+
+def test_kernel_change_gives_new_key(results, tmp_path, use_kernel):
+    args = (make_body(), np.zeros(3))
+    key = results.key(temperature, args, {})
+    other = tmp_path / "other.tpc"
+    other.write_text("\\begindata\nBODY399_RADII = ( 1 2 3 )\n")
+    use_kernel(other)
+    assert results.key(temperature, args, {}) != key
+
+
+def test_missing_kernel_path(results, tmp_path, use_kernel):
+    use_kernel(tmp_path / "deleted.tpc")
+    body = make_body()
+    first = results.call(temperature, body, np.zeros(3))
+    assert results.call(temperature, body, np.zeros(3)) is first
+    assert calls == ["Testbody"]
+
+
+def test_unhashable_arguments_are_not_cached(results):
+    func = lambda body, x: calls.append(x) or 1.0  # noqa: E731
+    results.call(func, make_body(), object())
+    results.call(func, make_body(), object())
+    assert len(calls) == 2 and len(results) == 0
+
+
+def test_arguments_comparing_elementwise_are_not_cached(results):
+    class Series:
+        """Compares element-wise, like a pandas Series."""
+
+        def __eq__(self, other):
+            return np.array([True, False])
+
+    func = results.cached(lambda x: calls.append(x) or 1.0)
+    assert func(Series()) == 1.0 and func(Series()) == 1.0
+    assert len(calls) == 2 and len(results) == 0
+
+
+def test_fields_limit_key_and_invalidation(results):
+    body, incidence = make_body(), np.zeros(10)
+    teq = results.cached(temperature, fields=["S", "albedo", "albedoCoef", "emissivity"])
+    first = teq(body, incidence)
+    body.Tsavg = 200.0
+    assert teq(body, incidence) is first and len(calls) == 1
+    body.albedo = 0.2
+    assert len(results) == 0
+    teq(body, incidence)
+    assert len(calls) == 2
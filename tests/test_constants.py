@@ -0,0 +1,48 @@
+"""Tests for the frozen constants and the import-time budget of `planets`."""
+
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+from planets import constants
+
+# Cumulative import time budget for ``import planets`` in microseconds. numpy
+# accounts for most of it; astropy and pooch must not be imported at all.
+IMPORT_BUDGET_US = int(os.environ.get("PLANETS_IMPORT_BUDGET_US", 300000))
+
+
+def test_constants_match_astropy():
+    """The frozen values must agree with astropy.constants."""
+    astropy_constants = pytest.importorskip("astropy.constants")
+
+    assert constants.AU == astropy_constants.au.value
+    assert constants.sigma == pytest.approx(astropy_constants.sigma_sb.value, rel=1e-12)
+    assert constants.G == pytest.approx(astropy_constants.G.value, rel=1e-12)
+
+
+def test_import_time_budget():
+    """`import planets` stays within the budget and avoids heavy dependencies."""
+    code = "import sys, planets; print(','.join(sorted(sys.modules)))"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = proc.stdout.strip().split(",")
+    assert "astropy" not in modules
+    assert "pooch" not in modules
+
+    match = re.search(r"^import time:\s+\d+ \|\s+(\d+) \| planets$", proc.stderr, re.M)
+    assert match is not None, proc.stderr
+    assert int(match.group(1)) < IMPORT_BUDGET_US
+
+
+def test_bodies_are_built_lazily():
+    """Importing the package does not execute the body definitions."""
+    code = "import sys, planets; print('planets._bodies' in sys.modules); planets.Earth"
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert proc.stdout.strip() == "False"
@@ -0,0 +1,89 @@
+"""Tests for `planets.eclipse`."""
+
+import numpy as np
+import pytest
+
+import planets
+from planets import eclipse
+from planets.illumination import orbit_parameters, orbital_state
+
+KERNEL = r"""KPL/PCK
+
+\begindata
+
+BODY10_RADII      = ( 696000.   696000.   696000. )
+BODY399_RADII     = ( 6378.1366   6378.1366   6356.7519 )
+BODY599_RADII     = ( 71492.   71492.   66854. )
+BODY699_RADII     = ( 60268.   60268.   54364. )
+
+\begintext
+"""
+
+YEAR = 365.25 * 86400
+
+
+@pytest.fixture(autouse=True)
+def kernel(tmp_path, use_kernel):
+    path = tmp_path / "eclipse.tpc"
+    path.write_text(KERNEL)
+    return use_kernel(path)
+
+
+def test_positions_are_on_the_orbit():
+    t = np.linspace(0, 10 * planets.Europa.day, 1001)
+    position = eclipse.satellite_position("Europa", t)
+    assert position.shape == (1001, 3)
+    np.testing.assert_allclose(np.linalg.norm(position, axis=-1), eclipse.SATELLITES["Europa"].a)
+
+
+def test_moon_in_the_shadow_at_midnight(monkeypatch):
+    coplanar = eclipse.SATELLITES["Moon"]._replace(inclination=0.0)
+    monkeypatch.setitem(eclipse.SATELLITES, "Moon", coplanar)
+    shadow = eclipse.eclipses(planets.Moon, [0.0, planets.Moon.day / 2])
+    np.testing.assert_array_equal(shadow.blocked, [1.0, 0.0])
+    np.testing.assert_array_equal(shadow.umbra, [True, False])
+    assert not shadow.penumbra.any()
+
+
+def test_time_in_shadow_of_equatorial_orbits():
+    # Near-equatorial moons cross the shadow every orbit, for the time the parent
+    # covers of their orbit plus or minus the solar radius
+    t = np.linspace(0, 20 * planets.Europa.day, 200_001)
+    shadow = eclipse.eclipses(["Europa", "Ganymede"], t)
+    assert shadow.blocked.shape == (2, t.size)
+    assert ((shadow.blocked >= 0) & (shadow.blocked <= 1)).all()
+    a = np.array([eclipse.SATELLITES[name].a for name in ("Europa", "Ganymede")])
+    parent_size = np.arcsin(71492e3 / a)
+    np.testing.assert_allclose(shadow.umbra.mean(axis=-1), parent_size / np.pi, rtol=0.1)
+    assert (shadow.penumbra.mean(axis=-1) < 0.05 * shadow.umbra.mean(axis=-1)).all()
+
+
+def test_vectorized_over_moons():
+    t = np.linspace(0, 30 * 86400, 1000)
+    shadow = eclipse.eclipses(["Europa", "Titan"], t)
+    for k, name in enumerate(["Europa", "Titan"]):
+        single = eclipse.eclipses(name, t)
+        np.testing.assert_allclose(shadow.blocked[k], single.blocked)
+        np.testing.assert_array_equal(shadow.umbra[k], single.umbra)
+    from_array = eclipse.eclipses(np.array(["Europa", "Titan"]), t)
+    np.testing.assert_array_equal(from_array.blocked, shadow.blocked)
+
+
+def test_titan_eclipses_only_near_equinox():
+    t = np.linspace(0, orbit_parameters(planets.Titan).year, 1_000_001)
+    shadow = eclipse.eclipses("Titan", t)
+    _, declination = orbital_state(planets.Titan, t)
+    assert shadow.umbra.any()
+    limit = np.arcsin(60268 / 1221870) + 0.01
+    assert np.abs(declination[shadow.blocked > 0]).max() < limit
+
+
+def test_lunar_eclipses_are_rare():
+    t = np.linspace(0, 18.6 * YEAR, 500_001)
+    shadow = eclipse.eclipses("Moon", t)
+    assert 0 < shadow.umbra.mean() < 0.001
+
+
+def test_unknown_moon():
+    with pytest.raises(ValueError, match="No satellite orbit"):
+        eclipse.eclipses("Mars", 0.0)
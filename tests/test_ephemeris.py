@@ -0,0 +1,73 @@
+"""Tests for `planets.ephemeris` against stored reference positions."""
+
+import numpy as np
+import pytest
+
+import planets
+from planets import ephemeris
+
+# Julian dates of 1800, 1900, 1950, J2000, 2025 and 2050
+EPOCHS = [2378496.5, 2415020.5, 2433282.5, 2451545.0, 2460676.5, 2469807.5]
+
+# Heliocentric equatorial J2000 positions [au] from the planetary theory of Simon et al.
+# (1994) and geocentric positions of the Moon from Meeus (1998), as implemented in
+# ERFA (eraPlan94, eraMoon98). "EM Bary" is the Earth-Moon barycenter.
+REFERENCE = {
+    "Mercury": [[-0.21101977, 0.21395861, 0.13622232], [-0.38737926, -0.1581368, -0.04415703], [0.32088042, 0.09951991, 0.01982579], [-0.13009177, -0.40059302, -0.20048865], [-0.3873032, -0.15725387, -0.0438642], [-0.17951539, 0.23045753, 0.14171322]],  # noqa: E501
+    "Venus": [[-0.61467631, 0.32342278, 0.18428562], [0.69985389, -0.1605745, -0.11653484], [0.09428227, 0.65330111, 0.28783086], [-0.71830179, -0.04627643, 0.02464093], [0.453416, 0.52315906, 0.20671818], [0.14178371, -0.64734233, -0.30030453]],  # noqa: E501
+    "EM Bary": [[-0.22498262, 0.87797656, 0.38111486], [-0.19688308, 0.88374756, 0.38338582], [-0.18271433, 0.88637851, 0.38440969], [-0.17716063, 0.88740148, 0.38473563], [-0.17866539, 0.88718975, 0.38458505], [-0.17158967, 0.88841493, 0.38505728]],  # noqa: E501
+    "Mars": [[-1.09616565, -1.01957979, -0.43740711], [0.43535089, -1.22533861, -0.57384439], [-1.39553902, 0.80848948, 0.4087048], [1.3907052, 0.00143786, -0.03693783], [-0.52161559, 1.38157385, 0.64776863], [-1.54323924, -0.47286846, -0.17536159]],  # noqa: E501
+    "Jupiter": [[-0.02987066, 4.71640179, 2.02312338], [-3.01600272, -4.12602125, -1.69536887], [3.40640119, -3.42580167, -1.55160885], [4.00156008, 2.73610345, 1.07544], [1.05593528, 4.57876528, 1.93692887], [-2.39082269, 4.26547782, 1.88638377]],  # noqa: E501
+    "Saturn": [[-5.68349667, 6.48524084, 2.91912029], [-0.36649567, -9.30498705, -3.82531821], [-9.0068382, 2.17001986, 1.28326811], [6.40460227, 6.17526545, 2.27445214], [9.46087373, -1.48235733, -1.02000892], [4.76710907, -8.03469097, -3.52455053]],  # noqa: E501
+    "Uranus": [[-18.26838409, 0.80210052, 0.61103035], [-6.47659284, -16.38605622, -7.08531829], [-1.2349117, 17.31053973, 7.59939326], [14.43205969, -12.50692883, -5.68215571], [11.10340103, 14.79875724, 6.32423157], [-17.82365735, 3.64344038, 1.84789628]],  # noqa: E501
+    "Neptune": [[-20.31135488, -21.00820305, -8.09348367], [1.51400485, 27.62348765, 11.26886381], [-29.09372931, -8.04979029, -2.57072788], [16.81202507, -22.98001593, -9.82441007], [29.88056182, -0.31284574, -0.87188204], [17.39758497, 22.55940989, 8.80065287]],  # noqa: E501
+    "Moon": [[0.0025894069, -0.0002988136, -0.0003113119], [0.0001635585, -0.002272666, -0.0009340072], [0.0012467871, 0.0020911738, 0.0010989436], [-0.0019492621, -0.0017828812, -0.0005086906], [0.0010164149, -0.0020576743, -0.0011155144], [0.0024036188, 0.0006554304, 0.0004472671]],  # noqa: E501
+}
+
+
+def separation_arcsec(a, b):
+    cos_angle = np.sum(a * b, axis=-1) / np.linalg.norm(a, axis=-1) / np.linalg.norm(b, axis=-1)
+    return np.rad2deg(np.arccos(np.clip(cos_angle, -1, 1))) * 3600
+
+
+@pytest.mark.parametrize("name", [name for name in REFERENCE if name != "Moon"])
+def test_planets_within_tolerance(name):
+    position = ephemeris.heliocentric_position(name, EPOCHS, "equatorial", "au")
+    reference = np.array(REFERENCE[name])
+    tolerance = ephemeris.TOLERANCE["Earth" if name == "EM Bary" else name]
+    assert separation_arcsec(position, reference).max() < tolerance
+    distance_ratio = np.linalg.norm(position, axis=-1) / np.linalg.norm(reference, axis=-1)
+    assert distance_ratio == pytest.approx(1, abs=2e-3)
+
+
+def test_moon_within_tolerance():
+    earth, moon = ephemeris.heliocentric_position(["Earth", "Moon"], EPOCHS, "equatorial", "au")
+    reference = np.array(REFERENCE["Moon"])
+    assert separation_arcsec(moon - earth, reference).max() < ephemeris.TOLERANCE["Moon"]
+    distance_ratio = np.linalg.norm(moon - earth, axis=-1) / np.linalg.norm(reference, axis=-1)
+    assert distance_ratio == pytest.approx(1, abs=0.03)
+
+
+def test_shapes_and_bodies():
+    jd = np.linspace(2451545.0, 2451545.0 + 3650, 50)
+    bodies = [planets.Mars, "Titan", planets.Earth]
+    positions = ephemeris.heliocentric_position(bodies, jd)
+    assert positions.shape == (3, 50, 3)
+    assert np.array_equal(positions[1], ephemeris.heliocentric_position("Saturn", jd))
+    assert ephemeris.heliocentric_position("Mars", jd).shape == (50, 3)
+    assert ephemeris.heliocentric_position(bodies, 2451545.0).shape == (3, 3)
+    mars = ephemeris.heliocentric_position("Mars", 2451545.0, unit="au")
+    assert np.linalg.norm(mars) == pytest.approx(1.391, abs=1e-3)
+    # Semi-major axes agree with the body catalogue
+    assert np.linalg.norm(positions[0], axis=-1).mean() == pytest.approx(planets.Mars.rsm, rel=0.05)
+    names = np.array(["Mars", "Titan", "Earth"])
+    assert np.array_equal(ephemeris.heliocentric_position(names, jd), positions)
+    assert ephemeris.heliocentric_position(np.array("Mars"), jd).shape == (50, 3)
+    with pytest.raises(ValueError, match="Bennu"):
+        ephemeris.heliocentric_position(planets.Bennu, jd)
+
+
+def test_mean_elements():
+    elements = ephemeris.mean_elements("EM Bary", [2451545.0, 2488070.0])
+    assert elements.a.tolist() == pytest.approx([1.00000261, 1.00000823])
+    assert elements.L[1] - elements.L[0] == pytest.approx(35999.37244981)
@@ -0,0 +1,68 @@
+"""Tests for `planets.illumination`."""
+
+import numpy as np
+import pytest
+
+import planets
+from planets import illumination
+
+
+def test_orbit_parameters_units():
+    assert illumination.orbit_parameters(planets.Mars).obliquity == pytest.approx(0.4396, abs=1e-4)
+    assert illumination.orbit_parameters(planets.Moon).obliquity == planets.Moon.obliquity
+
+
+def test_subsolar_latitude_at_solstice():
+    p = illumination.orbit_parameters(planets.Earth)._replace(eccentricity=0.0, Lp=0.0)
+    latitude, longitude = illumination.subsolar_point(p, [0.0, p.year / 4, p.year / 2])
+    assert latitude == pytest.approx([0.0, 23.45, 0.0], abs=1e-9)
+    assert longitude[0] == 0.0
+
+
+def test_noon_flux_at_equinox():
+    p = illumination.orbit_parameters(planets.Earth)._replace(eccentricity=0.0)
+    flux = illumination.illumination_cube(p, [0.0, 60.0], [0.0, 90.0, 180.0], [0.0])
+    assert flux[0, :, 0] == pytest.approx([p.S, p.S / 2])
+    assert flux[0, 0, 1] == pytest.approx(0.0, abs=1e-9)
+    assert flux[0, 0, 2] == 0.0
+
+
+def test_eccentric_anomaly_solves_keplers_equation():
+    M = np.linspace(0, 2 * np.pi, 13)
+    e = np.array([[0.0], [0.2], [0.9]])
+    E = illumination.eccentric_anomaly(M, e)
+    assert E.shape == (3, 13)
+    assert E - e * np.sin(E) == pytest.approx(np.broadcast_to(M, E.shape), abs=1e-12)
+
+
+def test_flux_follows_distance():
+    p = illumination.orbit_parameters(planets.Mars)
+    r, _ = illumination.orbital_state(p, [0.0, p.year / 2])
+    assert r == pytest.approx([p.rsm * (1 - p.eccentricity), p.rsm * (1 + p.eccentricity)])
+
+
+def test_chunks_and_out_agree():
+    latitude = np.arange(-90, 91, 10.0)
+    longitude = np.arange(0, 360, 15.0)
+    t = np.linspace(0, planets.Mars.year, 50)
+    full = illumination.illumination_cube(planets.Mars, latitude, longitude, t)
+    chunks = list(
+        illumination.iter_illumination(planets.Mars, latitude, longitude, t, chunk_size=7)
+    )
+    assert len(chunks) == 8
+    assert np.array_equal(np.concatenate([values for _, values in chunks]), full)
+
+    out = np.zeros(full.shape, dtype=np.float32)
+    illumination.illumination_cube(planets.Mars, latitude, longitude, t, out=out, chunk_size=3)
+    assert out == pytest.approx(full, rel=1e-5, abs=1e-3)
+
+
+def test_process_pool_matches_serial():
+    latitude = np.arange(-90, 91, 30.0)
+    longitude = np.arange(0, 360, 60.0)
+    t = np.linspace(0, planets.Moon.day, 20)
+    serial = illumination.illumination_cube(planets.Moon, latitude, longitude, t, "cos_incidence")
+    pooled = illumination.illumination_cube(
+        planets.Moon, latitude, longitude, t, "cos_incidence", chunk_size=4, processes=2
+    )
+    assert np.array_equal(serial, pooled)
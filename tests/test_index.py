@@ -0,0 +1,79 @@
+"""Tests for `planets.index` and the queries of `planets.table.BodyTable`."""
+
+import numpy as np
+import pytest
+
+import planets
+from planets._planets import Planet
+from planets.index import KDTree, SortedIndex
+from planets.table import BodyTable
+
+
+def make_bodies(n, seed=0):
+    rng = np.random.default_rng(seed)
+    bodies = []
+    for i, (a, e) in enumerate(zip(rng.uniform(0.5, 6, n), rng.uniform(0, 0.4, n))):
+        body = Planet(R=1.0)
+        body.name = f"body{i}"
+        body.rAU, body.eccentricity = float(a), float(e)
+        bodies.append(body)
+    return bodies
+
+
+def brute_nearest(points, x, k):
+    distances = np.sqrt(((points - x) ** 2).sum(axis=1))
+    order = np.argsort(distances, kind="stable")[:k]
+    return order, distances[order]
+
+
+def test_sorted_index_extends_without_resorting():
+    index = SortedIndex([3.0, np.nan, 1.0, 2.0])
+    assert index.range(1.5, 3.0).tolist() == [3, 0]
+    index.extend([2.5, 0.5], [4, 5])
+    assert index.values.tolist() == [0.5, 1.0, 2.0, 2.5, 3.0]
+    assert index.range(high=2.0).tolist() == [5, 2, 3]
+    assert index.range().size == 5
+
+
+@pytest.mark.parametrize("k", [1, 10])
+def test_kd_tree_matches_brute_force(k):
+    points = np.random.default_rng(1).normal(size=(3000, 3))
+    tree = KDTree(points[:2000], leaf_size=16)
+    tree.extend(points[2000:2100], np.arange(2000, 2100))  # stays in the buffer
+    tree.extend(points[2100:], np.arange(2100, 3000))  # triggers a rebuild
+    for x in np.random.default_rng(2).normal(size=(20, 3)):
+        distances, rows = tree.query(x, k)
+        expected_rows, expected_distances = brute_nearest(points, x, k)
+        assert rows.tolist() == expected_rows.tolist()
+        assert distances == pytest.approx(expected_distances)
+
+
+def test_table_queries_follow_appends():
+    bodies = make_bodies(4000)
+    table = BodyTable(bodies[:3000], fields=["rAU", "eccentricity"])
+    rows = table.select("rAU", 2, 3.3)
+    assert sorted(rows) == [i for i, b in enumerate(bodies[:3000]) if 2 <= b.rAU <= 3.3]
+    neighbours, _ = table.nearest("body7", ["rAU", "eccentricity"], k=10, scale=[1, 0.1])
+    assert 7 not in neighbours and len(neighbours) == 10
+
+    table.append(*bodies[3000:])
+    rows = table.select("rAU", 2, 3.3)
+    assert sorted(rows) == [i for i, b in enumerate(bodies) if 2 <= b.rAU <= 3.3]
+    assert np.all(np.diff(table["rAU"][rows]) >= 0)
+
+    points = np.stack([table["rAU"], table["eccentricity"] / 0.1], axis=1)
+    neighbours, distances = table.nearest("body7", ["rAU", "eccentricity"], 10, [1, 0.1])
+    expected_rows, expected_distances = brute_nearest(points, points[7], 11)
+    assert neighbours.tolist() == expected_rows[1:].tolist()
+    assert distances == pytest.approx(expected_distances[1:])
+
+
+def test_nearest_to_a_body_or_coordinates():
+    table = BodyTable(
+        [planets.Mercury, planets.Venus, planets.Earth, planets.Mars],
+        fields=["rAU", "eccentricity"],
+    )
+    rows, _ = table.nearest(planets.Earth, ["rAU"], k=2)
+    assert [table.names[row] for row in rows] == ["Earth", "Venus"]
+    rows, distances = table.nearest([1.5, 0.0], ["rAU", "eccentricity"])
+    assert table.names[rows[0]] == "Mars"
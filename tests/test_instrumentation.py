@@ -0,0 +1,52 @@
+"""Tests for the opt-in instrumentation of `planets`."""
+
+import pytest
+
+import planets
+from planets import instrumentation, pck_parser
+
+
+@pytest.fixture
+def instrumented(kernel):
+    """Enable instrumentation against the small kernel with empty statistics."""
+    instrumentation.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    instrumentation.set_trace_hook(None)
+    instrumentation.reset()
+
+
+def test_disabled_records_nothing(kernel):
+    instrumentation.reset()
+    pck_parser.get_body_radius_km("Earth")
+    assert planets.stats() == {"enabled": False, "counters": {}, "timings": {}}
+
+
+def test_parse_cache_and_lookup_paths(instrumented, small_kernel):
+    assert pck_parser.get_body_radius_km("Earth") == pytest.approx(6371.0084, abs=1e-4)
+    pck_parser.get_body_radius_km("Titan")
+    pck_parser.get_body_radius_km("luna")
+    pck_parser.get_body_radius_km("Mars Barycenter")
+
+    stats = planets.stats()
+    counters = stats["counters"]
+    assert counters["cache.miss"] == 1
+    assert counters["cache.hit"] == 3
+    assert counters["lookup.exact"] == 2
+    assert counters["lookup.alias"] == 1
+    assert counters["lookup.fuzzy"] == 1
+    sections = pck_parser.find_data_sections(small_kernel.read_bytes())
+    assert counters["kernel.bytes_read"] == sum(end - start for start, end in sections)
+    assert stats["timings"]["parse"]["count"] == 1
+    assert stats["timings"]["lookup"]["count"] == 4
+    assert sum(stats["timings"]["lookup"]["buckets"].values()) == 4
+
+
+def test_trace_hook(instrumented):
+    events = []
+    instrumentation.set_trace_hook(lambda event, duration, info: events.append(event))
+    pck_parser.get_body_radius_km("Moon")
+    assert events[:2] == ["cache.miss", "kernel.bytes_read"]
+    assert "parse" in events
+    assert events[-1] == "lookup"
@@ -0,0 +1,92 @@
+"""Tests for `planets.kernel_diff` and the ``planets diff`` command."""
+
+import json
+
+import pytest
+
+from planets import cli, kernel_diff
+from planets.kernel_index import KernelIndex
+from tests.conftest import SMALL_KERNEL
+
+NEW_KERNEL = (
+    SMALL_KERNEL.replace("6378.1366   6378.1366   6356.7519", "6378.137   6378.137   6356.752")
+    .replace("3376.20 )", "3376.20   3000. )")
+    .replace("BODY599_LONG_AXIS = 0.", "BODY699_RADII     = ( 60268.   60268.   54364. )")
+    .replace("BODY399_POLE_RA   = (    0.      -0.641", "BODY399_POLE_RA   = ( 0.  -0.642")
+)
+
+
+@pytest.fixture
+def kernels(tmp_path, kernel):
+    new = tmp_path / "new.tpc"
+    new.write_text(NEW_KERNEL)
+    return kernel, new
+
+
+def test_diff(kernels):
+    diff = kernel_diff.diff_kernels(*kernels)
+    assert list(diff.changed) == ["BODY399_POLE_RA", "BODY399_RADII", "BODY499_RADII"]
+    radii = diff.changed["BODY399_RADII"]
+    assert radii.delta == pytest.approx([0.0004, 0.0004, 0.0001])
+    assert radii.max_delta == pytest.approx(0.0004)
+    assert radii.max_relative == pytest.approx(0.0004 / 6378.1366)
+    assert diff.changed["BODY399_POLE_RA"].max_relative == pytest.approx(0.001 / 0.641)
+    # Arrays of another length have no delta
+    assert diff.changed["BODY499_RADII"].delta is None
+    assert diff.added == {"BODY699_RADII": [60268.0, 60268.0, 54364.0]}
+    assert diff.removed == {"BODY599_LONG_AXIS": 0.0}
+    assert diff.bodies() == [399, 499, 599, 699]
+    json.dumps(diff.to_dict())
+
+
+def test_identical_and_tolerance(kernels):
+    old, new = kernels
+    assert not kernel_diff.diff_kernels(old, old)
+    diff = kernel_diff.diff_kernels(old, new, atol=0.01)
+    assert list(diff.changed) == ["BODY499_RADII"]
+    assert diff.bodies() == [499, 599, 699]
+
+
+def test_selection(kernels):
+    diff = kernel_diff.diff_kernels(*kernels, quantity="RADII")
+    assert list(diff.changed) == ["BODY399_RADII", "BODY499_RADII"]
+    assert list(diff.added) == ["BODY699_RADII"] and not diff.removed
+    diff = kernel_diff.diff_kernels(*kernels, body=(500, 699))
+    assert not diff.changed and diff.bodies() == [599, 699]
+    diff = kernel_diff.diff_kernels(*kernels, prefix="BODY399_", body=399, quantity="RADII")
+    assert list(diff.changed) == ["BODY399_RADII"]
+
+
+def test_diff_indexes_matches_constants():
+    old = {"A": {"value": 1.0}, "B": {"value": "x"}, "C": {"value": [1, 2]}}
+    new = {"B": {"value": "y"}, "C": {"value": [1, 3]}, "D": {"value": 4}}
+    diff = kernel_diff.diff_indexes(KernelIndex(old), KernelIndex(new))
+    assert diff.removed == {"A": 1.0} and diff.added == {"D": 4}
+    assert diff.changed["B"] == ("x", "y", None, None, None)
+    assert diff.changed["C"].delta == [0.0, 1.0] and diff.changed["C"].max_relative == 0.5
+    assert diff.body_ids == {}
+
+
+def test_repeated_diff_is_cached(kernels):
+    old, new = kernels
+    first = kernel_diff.diff_kernels(old, new)
+    assert kernel_diff.diff_kernels(old, new) is first
+    new.write_text(SMALL_KERNEL + "\\begindata\nBODY799_RADII = ( 1. 1. 1. )\n\\begintext\n")
+    assert kernel_diff.diff_kernels(old, new).added == {"BODY799_RADII": [1.0, 1.0, 1.0]}
+
+
+def test_cli(kernels, capsys):
+    old, new = (str(path) for path in kernels)
+    assert cli.main(["diff", old, old]) == 0
+    assert capsys.readouterr().out == "0 changed, 0 added, 0 removed keys of 0 bodies\n"
+    assert cli.main(["diff", old, new, "--bodies", "300:499"]) == 1
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith("~ BODY399_POLE_RA: max |delta| 0.001")
+    assert lines[-1] == "3 changed, 0 added, 0 removed keys of 2 bodies"
+    assert cli.main(["diff", old, new, "--quantity", "RADII", "--json"]) == 1
+    assert set(json.loads(capsys.readouterr().out)["changed"]) == {
+        "BODY399_RADII",
+        "BODY499_RADII",
+    }
+    assert cli.main(["diff", old, old + ".missing"]) == 2
+    assert "not found" in capsys.readouterr().err
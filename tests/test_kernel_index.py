@@ -0,0 +1,48 @@
+"""Tests for `planets.kernel_index`."""
+
+import re
+
+from planets import pck_parser, synthetic
+from planets.kernel_index import KernelIndex
+
+
+def test_queries_match_regex_scan(tmp_path):
+    path = tmp_path / "synthetic.tpc"
+    constants = synthetic.write_kernel(path, n_keys=500)
+    index = pck_parser.load_kernel_index(path)
+    assert len(index) == len(constants)
+
+    radii = {}
+    for key, data in constants.items():
+        match = re.fullmatch(r"BODY(\d+)_RADII", key)
+        if match:
+            radii[int(match.group(1))] = data["value"]
+    assert radii and index.values_by_body("RADII") == radii
+
+    saturn = sorted(key for key in constants if re.fullmatch(r"BODY6\d\d_.+", key))
+    assert sorted(index.keys_of(index.bodies(600, 699))) == saturn
+    assert index.keys_of(index.prefix("BODY6")) == sorted(
+        k for k in constants if k.startswith("BODY6")
+    )
+    ra = sorted(key for key in constants if key.endswith("_RA"))
+    assert sorted(index.keys_of(index.suffix("RA"))) == ra
+    pck_parser.clear_cache()
+
+
+def test_key_decomposition():
+    keys = ["BODY399_NUT_PREC_RA", "FRAME_-82000_NAME", "INS-82360_FOV_SHAPE", "NAIF_BODY_NAME"]
+    index = KernelIndex({key: {"value": i, "block": 0} for i, key in enumerate(keys)})
+    assert index.keys_of(index.quantity("NUT_PREC_RA")) == ["BODY399_NUT_PREC_RA"]
+    assert index.values_by_body("NAME", prefix="FRAME") == {-82000: 1}
+    assert index.keys_of(index.bodies(-90000, -80000)) == [
+        "INS-82360_FOV_SHAPE",
+        "FRAME_-82000_NAME",
+    ]
+    assert index.quantity("GM").size == 0
+    assert index.keys_of(index.bodies(1)) == []
+
+
+def test_index_is_cached_with_the_kernel(kernel):
+    index = pck_parser.load_kernel_index(kernel)
+    assert pck_parser.load_kernel_index(kernel) is index
+    assert sorted(index.values_by_body("RADII")) == [10, 301, 399, 499, 606]
@@ -0,0 +1,129 @@
+"""Tests for `planets.kernels`."""
+
+import functools
+import hashlib
+import threading
+from http.server import HTTPServer, SimpleHTTPRequestHandler
+
+import pytest
+
+from planets import kernels, pck_parser
+
+OVERRIDE_KERNEL = r"""
+\begindata
+BODY399_RADII = ( 6371.0 6371.0 6371.0 )
+BODY399_GM = 398600.4
+\begintext
+"""
+
+
+def sha256(data: bytes) -> str:
+    return "sha256:" + hashlib.sha256(data).hexdigest()
+
+
+@pytest.fixture
+def mirror_dir(tmp_path, small_kernel):
+    """Mirror directory with two kernels and a registry describing them."""
+    root = tmp_path / "mirror"
+    (root / "pck").mkdir(parents=True)
+    (root / "misc").mkdir()
+    small = small_kernel.read_bytes()
+    (root / "pck" / "small.tpc").write_bytes(small)
+    (root / "misc" / "override.tpc").write_text(OVERRIDE_KERNEL)
+    registry = tmp_path / "registry.txt"
+    registry.write_text(
+        f"pck/small.tpc {sha256(small)}\n"
+        f"misc/override.tpc {sha256(OVERRIDE_KERNEL.encode())}\n"
+    )
+    yield root, registry
+    pck_parser.clear_cache()
+
+
+class RangeHandler(SimpleHTTPRequestHandler):
+    """Static file handler honouring simple ``Range: bytes=N-`` requests."""
+
+    ranges = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        header = self.headers.get("Range")
+        if header is None:
+            return super().do_GET()
+        self.ranges.append(header)
+        data = open(self.translate_path(self.path), "rb").read()
+        start = int(header.split("=")[1].rstrip("-"))
+        if start >= len(data):
+            self.send_response(416)
+            self.send_header("Content-Range", f"bytes */{len(data)}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(206)
+        self.send_header("Content-Length", str(len(data) - start))
+        self.end_headers()
+        self.wfile.write(data[start:])
+
+
+def test_default_registry_lists_the_pck_kernel(tmp_path):
+    registry = kernels.KernelRegistry(cache=tmp_path)
+    assert kernels.PCK_NAME in registry.names
+    assert registry.url(kernels.PCK_NAME) == pck_parser.PCK_URL
+    assert registry.provenance(kernels.PCK_NAME)["hash"] == pck_parser.PCK_HASH
+
+
+def test_file_mirror_and_provenance(tmp_path, mirror_dir):
+    root, registry_file = mirror_dir
+    registry = kernels.KernelRegistry(
+        registry_file, mirror=root.as_uri(), cache=tmp_path / "cache"
+    )
+    assert registry.url("pck/small.tpc") == root.as_uri() + "/pck/small.tpc"
+    paths = registry.prefetch()
+    assert set(paths) == {"pck/small.tpc", "misc/override.tpc"}
+
+    constants = registry.load_constants()
+    assert constants["BODY399_RADII"]["value"] == [6371.0, 6371.0, 6371.0]
+    assert constants["BODY499_RADII"]["value"] == [3396.19, 3396.19, 3376.20]
+    assert registry.source_of("BODY399_RADII")["name"] == "misc/override.tpc"
+    source = registry.source_of("BODY499_RADII")
+    assert source["name"] == "pck/small.tpc"
+    assert source["path"] == paths["pck/small.tpc"]
+    assert source["hash"].startswith("sha256:")
+    assert registry.source_of("UNKNOWN") is None
+
+
+def test_hash_mismatch_is_rejected(tmp_path, mirror_dir):
+    root, registry_file = mirror_dir
+    (root / "pck" / "small.tpc").write_text("tampered")
+    registry = kernels.KernelRegistry(registry_file, mirror=root.as_uri(), cache=tmp_path / "c")
+    with pytest.raises(ValueError, match="hash"):
+        registry.fetch("pck/small.tpc")
+    assert not (tmp_path / "c" / "pck" / "small.tpc").exists()
+
+
+@pytest.mark.parametrize("extra", [None, 0, 10], ids=["interrupted", "complete", "too-long"])
+def test_leftover_part_is_resumed(tmp_path, mirror_dir, monkeypatch, extra):
+    root, registry_file = mirror_dir
+    monkeypatch.setenv("NO_PROXY", "127.0.0.1")
+    RangeHandler.ranges = []
+    server = HTTPServer(
+        ("127.0.0.1", 0), functools.partial(RangeHandler, directory=str(root))
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        cache = tmp_path / "cache"
+        (cache / "pck").mkdir(parents=True)
+        data = (root / "pck" / "small.tpc").read_bytes()
+        # A part of an interrupted transfer, of a finished one or of another file
+        part = data[:100] if extra is None else data + b"x" * extra
+        (cache / "pck" / "small.tpc.part").write_bytes(part)
+        registry = kernels.KernelRegistry(
+            registry_file, mirror=f"http://127.0.0.1:{server.server_port}", cache=cache
+        )
+        path = registry.fetch("pck/small.tpc")
+    finally:
+        server.shutdown()
+    assert RangeHandler.ranges == [f"bytes={len(part)}-"]
+    assert open(path, "rb").read() == data
+    assert not (cache / "pck" / "small.tpc.part").exists()
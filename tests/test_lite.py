@@ -0,0 +1,128 @@
+"""Tests for `planets.lite`."""
+
+import importlib.util
+import subprocess
+import sys
+
+import pytest
+
+import planets
+from planets import _planets, lite, pck_parser
+
+
+def _load(path):
+    spec = importlib.util.spec_from_file_location("lite_data", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _expected(value):
+    return tuple(value) if isinstance(value, list) else value
+
+
+@pytest.fixture
+def data(tmp_path, kernel, monkeypatch):
+    """Data module generated from the small kernel, installed in place of the shipped one."""
+    lite.generate(tmp_path / "data.py")
+    module = _load(tmp_path / "data.py")
+    monkeypatch.setitem(sys.modules, "planets._lite_data", module)
+    monkeypatch.setattr(planets, "_lite_data", module, raising=False)
+    monkeypatch.setattr(lite, "_bodies", {})
+    return module
+
+
+@pytest.fixture
+def shipped():
+    """The data module of the package, skipping if it was not generated."""
+    if not lite.DATA_PATH.exists():
+        pytest.skip("planets/_lite_data.py is generated by `make lite` or the package build")
+    return _load(lite.DATA_PATH)
+
+
+def test_import_is_light(data, tmp_path):
+    code = (
+        "import importlib.util, sys\n"
+        "spec = importlib.util.spec_from_file_location('planets._lite_data', sys.argv[1])\n"
+        "sys.modules[spec.name] = module = importlib.util.module_from_spec(spec)\n"
+        "spec.loader.exec_module(module)\n"
+        "import planets.lite\n"
+        "assert planets.lite.Mars.R > 0\n"
+        "print(','.join(sorted(sys.modules)))\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code, str(tmp_path / "data.py")],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = proc.stdout.strip().split(",")
+    for heavy in ("numpy", "astropy", "pooch", "planets._bodies"):
+        assert heavy not in modules
+
+
+def test_catalogue_matches_full_package(data):
+    assert lite.get_all_bodies() == planets.get_all_bodies()
+    assert lite.KERNEL == data.KERNEL
+    for name in lite.get_all_bodies():
+        full = getattr(planets, name)
+        for field, value in vars(full).items():
+            if not field.startswith("_"):
+                assert getattr(lite.body(name), field) == _expected(value), (name, field)
+        if None not in (full.S, full.albedo, full.emissivity):
+            assert lite.body(name).Teq(30) == pytest.approx(full.Teq(30), rel=1e-12)
+        if lite.body(name).R is None:
+            # Not in the small kernel
+            assert pck_parser.get_body_radius_km(name) is None, name
+        else:
+            assert lite.body(name).R == full.R, name
+    assert lite.radii_km("Mars") == (3396.19, 3396.19, 3376.2)
+    assert (lite.AU, lite.G, lite.sigma) == (planets.AU, planets.G, planets.sigma)
+
+
+def test_generated_radii_match_kernel(data):
+    assert len(data.KERNEL["sha256"]) == 64
+    assert data.RADII_KM["Mars"] == (3396.19, 3396.19, 3376.2)
+    for name in ("Earth", "Moon", "Mars", "Titan", "Bennu"):
+        assert data.BODIES[name]["R"] == getattr(_planets, name).R
+    assert data.BODIES["Jupiter"]["R"] is None and "Jupiter" not in data.RADII_KM
+
+
+def test_shipped_data_matches_kernel(shipped):
+    try:
+        pck_parser.get_pck_path()
+    except Exception as error:  # network errors come in many flavours
+        pytest.skip(f"kernel not available: {error}")
+    assert shipped.KERNEL is not None, "generated without a kernel, run `make lite`"
+    assert f"sha256:{shipped.KERNEL['sha256']}" == pck_parser.PCK_HASH
+    for name in _planets._BODY_NAMES:
+        assert shipped.BODIES[name]["R"] == getattr(planets, name).R, name
+
+
+def test_shipped_data_is_current(shipped, data):
+    # Everything but the kernel and the radii taken from it must match a regeneration
+    assert shipped.VERSION == data.VERSION
+    assert list(shipped.BODIES) == list(data.BODIES)
+    for name, fields in data.BODIES.items():
+        shipped_fields = dict(shipped.BODIES[name])
+        if name in data.RADII_KM or name in shipped.RADII_KM:
+            fields = dict(fields, R=shipped_fields["R"])
+        assert shipped_fields == fields, name
+
+
+def test_missing_data_module(monkeypatch):
+    monkeypatch.setitem(sys.modules, "planets._lite_data", None)
+    monkeypatch.delattr(planets, "_lite_data", raising=False)
+    monkeypatch.setattr(lite, "_bodies", {})
+    with pytest.raises(ImportError, match="python -m planets.lite"):
+        lite.Earth
+
+
+def test_bodies_are_read_only(data):
+    with pytest.raises(AttributeError, match="read-only"):
+        lite.Earth.albedo = 0.5
+    with pytest.raises(KeyError):
+        lite.body("Vulcan")
+    with pytest.raises(AttributeError):
+        lite.Vulcan
+    assert "Earth" in dir(lite)
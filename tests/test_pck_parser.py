@@ -0,0 +1,137 @@
+"""Tests for `planets.pck_parser` against synthetic kernels."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from planets import _planets, pck_parser, synthetic
+from planets._planets import Planet
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"array_length": 40, "values_per_line": 4},
+        {"array_length": 12, "continuation_fraction": 0.5},
+        {"keys_per_block": 1, "comment_lines": 0, "scalar_fraction": 0.5},
+    ],
+    ids=["default", "long-arrays", "continuations", "one-key-per-block"],
+)
+def test_parse_synthetic_kernel(tmp_path, options):
+    path = tmp_path / "synthetic.tpc"
+    expected = synthetic.write_kernel(path, n_keys=300, **options)
+    assert pck_parser.parse_pck_file(path) == expected
+
+
+def test_continuation_within_block():
+    block = "BODY1_PM = ( 1.0 2.0 )\nBODY1_PM += 3.0\nBODY2_PM += ( 4.0 )"
+    assert pck_parser.parse_data_block(block) == {"BODY1_PM": [1.0, 2.0, 3.0], "BODY2_PM": [4.0]}
+
+
+def test_n_keys_for_size():
+    n_keys = synthetic.n_keys_for_size(100_000)
+    text, _ = synthetic.generate_kernel(n_keys=n_keys)
+    assert len(text) == pytest.approx(100_000, rel=0.05)
+
+
+def test_radius_from_synthetic_kernel(use_kernel, tmp_path):
+    path = tmp_path / "synthetic.tpc"
+    expected = synthetic.write_kernel(path)
+    use_kernel(path)
+    radii = expected["BODY399_RADII"]["value"]
+    assert pck_parser.get_body_radius_km("Earth", "polar") == radii[2]
+
+
+def test_parse_spice_value_syntax(tmp_path):
+    path = tmp_path / "syntax.tpc"
+    path.write_text(
+        "\\begindata\n"
+        "BODY1_GM = 1.5D+02\n"
+        "BODY1_LIST = ( 1, 2, 3 )\n"
+        "BODY1_NAMES = ( 'IAU_(1)'  'O''Neil' )\n"
+        "BODY1_NAME = 'A B'\n"
+        "\\begintext\n"
+    )
+    values = {key: entry["value"] for key, entry in pck_parser.parse_pck_file(path).items()}
+    assert values == {
+        "BODY1_GM": 150.0,
+        "BODY1_LIST": [1.0, 2.0, 3.0],
+        "BODY1_NAMES": ["IAU_(1)", "O'Neil"],
+        "BODY1_NAME": "A B",
+    }
+
+
+def test_parse_empty_file(tmp_path):
+    path = tmp_path / "empty.tpc"
+    path.write_text("")
+    assert pck_parser.parse_pck_file(path) == {}
+
+
+def test_data_sections_match_text_extraction(small_kernel):
+    content = small_kernel.read_bytes()
+    sections = pck_parser.find_data_sections(content)
+    blocks = pck_parser.extract_data_blocks(content.decode())
+    assert [content[start:end].decode().strip() for start, end in sections] == [
+        block.strip() for block in blocks
+    ]
+
+
+def test_kernel_is_parsed_once_under_concurrency(monkeypatch, kernel):
+    n_threads = 32
+    calls = []
+    parse = pck_parser.parse_pck_file
+
+    def slow_parse(file_path):
+        calls.append(file_path)
+        time.sleep(0.05)  # keep the other threads waiting on the parse
+        return parse(file_path)
+
+    monkeypatch.setattr(pck_parser, "parse_pck_file", slow_parse)
+    start = threading.Barrier(n_threads)
+    loaders = [pck_parser.load_body_radii, pck_parser.load_pck_constants] * (n_threads // 2)
+
+    def load(loader):
+        start.wait()
+        return loader(kernel)
+
+    with ThreadPoolExecutor(n_threads) as executor:
+        results = list(executor.map(load, loaders))
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results[0::2])
+    assert all(result is results[1] for result in results[1::2])
+    assert 399 in results[0] and "BODY399_RADII" in results[1]
+
+
+def test_radius_is_resolved_once_per_body(kernel):
+    shared = Planet()
+    shared.name = "Mars"
+    with ThreadPoolExecutor(8) as executor:
+        radii = set(executor.map(lambda _: shared.R, range(64)))
+    assert len(radii) == 1 and radii.pop() == pytest.approx(3389523.3, rel=1e-6)
+
+
+def test_slow_radius_does_not_block_other_bodies(monkeypatch, kernel):
+    lookup = _planets.get_body_radius_km
+    started, release = threading.Event(), threading.Event()
+
+    def slow_lookup(name):
+        if name == "Earth":
+            started.set()
+            release.wait(5)
+        return lookup(name)
+
+    monkeypatch.setattr(_planets, "get_body_radius_km", slow_lookup)
+    earth, mars = Planet(), Planet()
+    earth.name, mars.name = "Earth", "Mars"
+    with ThreadPoolExecutor(2) as executor:
+        pending = executor.submit(lambda: earth.R)
+        assert started.wait(5)
+        # Mars is resolved while Earth's lookup is still in progress
+        assert executor.submit(lambda: mars.R).result(timeout=1) > 0
+        assert not pending.done()
+        release.set()
+        assert pending.result(timeout=5) > 0
@@ -0,0 +1,45 @@
+"""Tests for `planets.profiling` and the ``planets profile`` command."""
+
+import json
+import pstats
+
+from planets import cli, instrumentation, pck_parser, profiling
+
+
+def test_profile_with_kernel(kernel, tmp_path, capsys):
+    constants = pck_parser.load_pck_constants()
+    output = tmp_path / "profile.pstats"
+    assert cli.main(["profile", "--json", "--no-imports", "--pstats", str(output)]) == 0
+    report = json.loads(capsys.readouterr().out)
+    timings = report["kernel"]
+    assert timings["error"] is None and timings["path"] == str(kernel)
+    assert timings["n_constants"] == 8 and timings["size"] == kernel.stat().st_size
+    assert 0 < timings["load_warm"] < timings["load_cold"]
+    assert set(report["lookups"]) == {f"radius {b}" for b in profiling.LOOKUP_BODIES} | {
+        "body name 399"
+    }
+    assert report["caches"]["parsed_kernels"] == [str(kernel.resolve())]
+    # The kernel parsed before profiling is still cached
+    assert pck_parser.load_pck_constants() is constants
+    assert report["stats"]["counters"]["cache.hit"] >= 1
+    assert not instrumentation.is_enabled()
+    assert pstats.Stats(str(output)).total_calls > 0
+
+
+def test_caches_are_reported_as_found(kernel):
+    report = profiling.collect(imports=False)
+    assert report["kernel"]["error"] is None
+    assert report["caches"]["parsed_kernels"] == []
+
+
+def test_offline_without_kernel(monkeypatch, use_kernel, tmp_path, capsys):
+    use_kernel(None)
+    monkeypatch.setenv("PLANETS_KERNEL_CACHE", str(tmp_path))
+    monkeypatch.setattr("planets.kernels._default_registry", None)
+    report = profiling.collect(offline=True, modules=["json"])
+    assert report["imports"]["json"] > 0
+    assert report["kernel"]["cached"] is False
+    assert "--offline" in report["kernel"]["error"]
+    assert report["lookups"] == {}
+    text = profiling.format_report(report)
+    assert "json" in text and "retrieval skipped" in text
@@ -0,0 +1,80 @@
+"""Tests for `planets.shared`."""
+
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+import planets
+from planets import pck_parser, shared
+
+
+@pytest.fixture
+def catalogue(kernel):
+    with shared.SharedCatalogue.publish() as catalogue:
+        yield catalogue
+
+
+def worker_state():
+    earth = planets.Earth
+    catalogue = shared.get_catalogue()
+    return (
+        "planets._bodies" in sys.modules,
+        earth.R,
+        earth.albedoCoef,
+        earth.Teq(),
+        catalogue.radii_of(301).tolist(),
+    )
+
+
+def test_publish(catalogue):
+    table = catalogue.table
+    assert table.names == planets.get_all_bodies()
+    earth = table.names.index("Earth")
+    assert table["obliquity"][earth] == planets.Earth.obliquity
+    assert table["R"][earth] == pytest.approx((2 * 6378.1366 + 6356.7519) / 3 * 1000)
+    assert np.isnan(table["R"][table.names.index("Triton")])
+    assert catalogue.radii_of(499).tolist() == [3396.19, 3396.19, 3376.20]
+    assert catalogue.radii_of(12345) is None
+
+
+def test_publish_without_kernel(monkeypatch):
+    def unreachable():
+        raise OSError("kernel unreachable")
+
+    monkeypatch.setattr(pck_parser, "get_pck_path", unreachable)
+    pck_parser.clear_cache()
+    with shared.SharedCatalogue.publish(kernel=False) as catalogue:
+        table = catalogue.table
+        assert table["R"][table.names.index("Bennu")] == planets.Bennu.R
+        assert np.isnan(table["R"][table.names.index("Triton")])
+        assert len(catalogue.body_ids) == 0
+
+
+def test_attach_shares_memory(catalogue):
+    attached = shared.SharedCatalogue.attach(catalogue.descriptor)
+    try:
+        catalogue.table["g"][0] = 1.5
+        assert attached.table["g"][0] == 1.5
+        moon = attached.body("Moon")
+        assert moon.cpCoeff == planets.Moon.cpCoeff
+        assert moon.Teq() == planets.Moon.Teq()
+        with pytest.raises(RuntimeError):
+            attached.unlink()
+    finally:
+        attached.close()
+
+
+def test_workers_use_the_shared_catalogue(catalogue):
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        1, context, initializer=shared.attach_catalogue, initargs=(catalogue.descriptor,)
+    ) as executor:
+        loaded_bodies, R, albedoCoef, Teq, moon_radii = executor.submit(worker_state).result()
+    assert not loaded_bodies
+    assert R == catalogue.table["R"][catalogue.table.names.index("Earth")]
+    assert albedoCoef == planets.Earth.albedoCoef
+    assert Teq == pytest.approx(planets.Earth.Teq())
+    assert moon_radii == [1737.4, 1737.4, 1737.4]
@@ -0,0 +1,61 @@
+"""Tests for `planets.snapshot`."""
+
+import pickle
+
+import pytest
+
+import planets
+from planets import _planets, pck_parser, snapshot
+
+
+def test_round_trip(tmp_path, kernel):
+    path = tmp_path / "bodies.snap"
+    provenance = snapshot.export_snapshot(path)
+    assert provenance["planets_version"] == planets.__version__
+    assert provenance["kernel"]["path"] == str(kernel)
+    assert provenance["kernel"]["source"] == str(kernel)
+    assert len(provenance["kernel"]["sha256"]) == 64
+
+    loaded = snapshot.read_snapshot(path)
+    assert loaded.version == snapshot.SNAPSHOT_VERSION
+    assert loaded.provenance == provenance
+    assert list(loaded.bodies) == planets.get_all_bodies()
+    earth = loaded.bodies["Earth"]
+    assert earth.R == pytest.approx((2 * 6378.1366 + 6356.7519) / 3 * 1000)
+    assert earth.obliquity == planets.Earth.obliquity
+    assert earth.albedoCoef == planets.Earth.albedoCoef
+    assert earth.Teq() == planets.Earth.Teq()
+    assert loaded.bodies["Bennu"].R == 262.5
+    assert loaded.bodies["Triton"]._R is None  # not in the small kernel
+
+
+def test_install_replaces_the_catalogue(tmp_path, kernel, monkeypatch):
+    path = tmp_path / "bodies.snap"
+    snapshot.export_snapshot(path, [planets.Mars])
+    for name in _planets._BODY_NAMES:
+        monkeypatch.setitem(vars(_planets), name, getattr(_planets, name))
+        monkeypatch.delitem(vars(planets), name, raising=False)
+
+    installed = snapshot.install_snapshot(path)
+    monkeypatch.setattr(pck_parser, "_pck_path", str(tmp_path / "missing.tpc"))
+    assert planets.Mars is installed.bodies["Mars"]
+    assert planets.Mars.R == pytest.approx((2 * 3396.19 + 3376.20) / 3 * 1000)
+    assert planets.Earth is _planets.Earth
+
+
+def test_rejects_foreign_files(tmp_path):
+    path = tmp_path / "bodies.snap"
+    path.write_bytes(b"not a snapshot")
+    with pytest.raises(ValueError, match="not a planets snapshot"):
+        snapshot.read_snapshot(path)
+    path.write_bytes(snapshot._HEADER.pack(snapshot.SNAPSHOT_MAGIC, 99))
+    with pytest.raises(ValueError, match="version 99"):
+        snapshot.read_snapshot(path)
+
+
+def test_refuses_objects(tmp_path):
+    path = tmp_path / "bodies.snap"
+    header = snapshot._HEADER.pack(snapshot.SNAPSHOT_MAGIC, snapshot.SNAPSHOT_VERSION)
+    path.write_bytes(header + pickle.dumps({"bodies": {"Earth": planets.Earth}}))
+    with pytest.raises(pickle.UnpicklingError):
+        snapshot.read_snapshot(path)
@@ -0,0 +1,78 @@
+"""Tests for `planets.stream` and the ``planets teq`` command."""
+
+import io
+
+import numpy as np
+import pytest
+
+import planets
+from planets import cli, stream, thermal
+from planets.illumination import orbital_state
+
+
+def test_csv_matches_planet_teq():
+    source = io.StringIO("body,latitude\nEarth,0\nMars,45\n\nEarth,60\n")
+    out = io.StringIO()
+    assert stream.run(source, out, chunk_rows=2) == 3
+    lines = out.getvalue().splitlines()
+    assert lines[0] == "body,latitude,flux,teq"
+    rows = [line.split(",") for line in lines[1:]]
+    assert [row[:2] for row in rows] == [["Earth", "0"], ["Mars", "45"], ["Earth", "60"]]
+    for name, latitude, flux, teq in rows:
+        body = getattr(planets, name)
+        assert float(teq) == pytest.approx(body.Teq(float(latitude)), abs=1e-6)
+        assert float(flux) == pytest.approx(body.S * np.cos(np.deg2rad(float(latitude))) / 4)
+
+
+def test_rows_with_time_are_local_noon():
+    flux, teq = stream.evaluate(["Mars", "Mars"], [10.0, -30.0], [0.0, 3e7])
+    r, declination = orbital_state(planets.Mars, np.array([0.0, 3e7]))
+    incidence = np.abs(np.deg2rad([10.0, -30.0]) - declination)
+    noon_flux = planets.Mars.S * (planets.Mars.rsm / r) ** 2
+    np.testing.assert_allclose(flux, noon_flux * np.cos(incidence))
+    np.testing.assert_allclose(
+        teq, thermal.equilibrium_temperature(planets.Mars, incidence, solar_flux=noon_flux)
+    )
+
+
+def test_npy_stream_in_chunks(tmp_path):
+    rows = np.zeros(1000, dtype=[("body", "U8"), ("latitude", "f8"), ("time", "f8")])
+    rows["body"] = np.where(np.arange(1000) % 3, "Earth", "Moon")
+    rows["latitude"] = np.linspace(-90, 90, 1000)
+    rows["time"] = np.linspace(0, 1e7, 1000)
+    np.save(tmp_path / "rows.npy", rows)
+
+    output = tmp_path / "out.npy"
+    exit_code = cli.main(
+        ["teq", str(tmp_path / "rows.npy"), "-o", str(output), "--chunk-size", "64"]
+    )
+    assert exit_code == 0
+    result = np.load(output)
+    flux, teq = stream.evaluate(rows["body"], rows["latitude"], rows["time"])
+    np.testing.assert_array_equal(result, np.stack([flux, teq], axis=1))
+
+
+def test_float_npy_needs_body(tmp_path, capsys):
+    np.save(tmp_path / "rows.npy", np.array([[0.0], [30.0]]))
+    assert cli.main(["teq", str(tmp_path / "rows.npy")]) == 1
+    assert "body" in capsys.readouterr().err
+    assert cli.main(["teq", str(tmp_path / "rows.npy"), "--body", "Earth"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "body,latitude,flux,teq" and lines[1].startswith("Earth,0.0,")
+
+
+def test_unknown_body(capsys):
+    with pytest.raises(ValueError, match="Unknown body"):
+        stream.evaluate(["Vulcan"], [0.0])
+
+
+@pytest.mark.parametrize("rows", ["Jupiter,0\n", "Jupiter,0,0\n"])
+def test_body_without_emissivity(monkeypatch, capsys, rows):
+    monkeypatch.setattr("sys.stdin", io.StringIO(rows))
+    assert cli.main(["teq"]) == 1
+    assert capsys.readouterr().err == "Error: Jupiter has no value for 'emissivity'\n"
+
+
+def test_csv_rows_of_different_widths():
+    with pytest.raises(ValueError, match="columns"):
+        list(stream.iter_csv(io.StringIO("Earth,1,2\nMars\n")))
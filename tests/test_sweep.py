@@ -0,0 +1,67 @@
+"""Tests for `planets.sweep`."""
+
+import numpy as np
+import pytest
+
+import planets
+from planets import sweep, thermal
+
+
+def noon_temperature(batch):
+    """Model used by the tests, at module level so that workers can unpickle it."""
+    incidence = np.deg2rad([0.0, 30.0, 60.0])
+    return {"T": thermal.equilibrium_temperature(batch.reshape(-1, 1), incidence[None, :])}
+
+
+def test_batch_falls_back_to_base():
+    batch = sweep.Sweep(planets.Moon, {"albedo": [0.1, 0.2], "Gamma": [50, 60, 70]}).batch()
+    assert len(batch) == 6
+    assert list(batch.albedo) == [0.1, 0.1, 0.1, 0.2, 0.2, 0.2]
+    assert batch.emissivity == planets.Moon.emissivity
+    assert planets.Moon.albedo == 0.12
+
+
+def test_latin_hypercube_strata():
+    columns = sweep.latin_hypercube({"H": (0.0, 1.0), "Qb": (0.01, 0.03)}, 10, seed=3)
+    assert sorted(np.floor(columns["H"] * 10)) == list(range(10))
+    assert np.all((columns["Qb"] >= 0.01) & (columns["Qb"] < 0.03))
+
+
+def test_unknown_field():
+    with pytest.raises(ValueError, match="no field"):
+        sweep.Sweep(planets.Moon, {"albedoo": [0.1]})
+
+
+@pytest.mark.parametrize("format", ["npz", "parquet", "hdf5"])
+def test_run_formats(tmp_path, format):
+    if format == "parquet":
+        pytest.importorskip("pyarrow")
+    if format == "hdf5":
+        pytest.importorskip("h5py")
+    s = sweep.Sweep(planets.Moon, {"albedo": np.linspace(0.05, 0.2, 7), "emissivity": [0.9, 0.95]})
+    expected = noon_temperature(s.batch())["T"]
+
+    s.run(noon_temperature, tmp_path, format=format, chunk_size=4, processes=2)
+    results = sweep.load_results(tmp_path)
+    assert results["T"] == pytest.approx(expected)
+    assert list(results["sample"]) == list(range(14))
+    assert results["albedo"] == pytest.approx(s.columns["albedo"])
+
+
+def test_resume_skips_done_chunks(tmp_path):
+    s = sweep.Sweep(planets.Moon, {"albedo": np.linspace(0.05, 0.2, 10)})
+    s.run(noon_temperature, tmp_path, chunk_size=4)
+    (tmp_path / "part-000001.npz").unlink()
+    calls = []
+
+    def counting_model(batch):
+        calls.append(len(batch))
+        return noon_temperature(batch)
+
+    s.run(counting_model, tmp_path, chunk_size=4)
+    assert calls == [4]
+    assert len(sweep.load_results(tmp_path)["T"]) == 10
+
+    other = sweep.Sweep(planets.Moon, {"albedo": np.linspace(0.05, 0.3, 10)})
+    with pytest.raises(ValueError, match="different sweep"):
+        other.run(noon_temperature, tmp_path, chunk_size=4)
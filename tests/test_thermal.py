@@ -0,0 +1,48 @@
+"""Tests for `planets.thermal`."""
+
+import numpy as np
+import pytest
+
+import planets
+from planets import thermal
+from planets.constants import sigma
+
+
+def reference_temperature(body, incidence):
+    A0, (a, b) = body.albedo, body.albedoCoef
+    albedo = A0 + a * (incidence / (np.pi / 4)) ** 3 + b * (incidence / (np.pi / 2)) ** 8
+    flux = np.clip(np.cos(incidence), 0, None) * body.S
+    return ((1 - albedo) * flux / (body.emissivity * sigma)) ** 0.25
+
+
+def test_variable_albedo_of_the_moon():
+    albedo = thermal.variable_albedo(planets.Moon, np.deg2rad([0.0, 45.0, 90.0]))
+    assert albedo == pytest.approx([0.12, 0.18 + 0.25 / 2**8, 0.12 + 0.06 * 8 + 0.25])
+
+
+def test_matches_reference_expression():
+    incidence = np.linspace(0, np.pi, 1001)
+    temperature = thermal.equilibrium_temperature(planets.Moon, incidence)
+    assert temperature == pytest.approx(reference_temperature(planets.Moon, incidence))
+    assert temperature[0] == pytest.approx(386.1, abs=0.1)
+    assert np.all(temperature[incidence > np.pi / 2] == 0)
+
+
+def test_chunked_float32(monkeypatch):
+    monkeypatch.setattr(thermal, "CHUNK_SIZE", 1000)
+    incidence = np.random.default_rng(1).uniform(0, np.pi / 2, (70, 101))
+    out = np.empty(incidence.shape, dtype=np.float32)
+    thermal.equilibrium_temperature(planets.Bennu, incidence, out=out)
+    assert out == pytest.approx(reference_temperature(planets.Bennu, incidence), rel=1e-5)
+
+
+def test_several_bodies():
+    incidence = np.zeros((2, 3))
+    temperature = thermal.equilibrium_temperatures([planets.Moon, planets.Mars], incidence)
+    assert temperature[0] == pytest.approx(reference_temperature(planets.Moon, incidence[0]))
+    assert temperature[1] == pytest.approx(reference_temperature(planets.Mars, incidence[1]))
+
+
+def test_requires_emissivity():
+    with pytest.raises(ValueError, match="emissivity"):
+        thermal.equilibrium_temperature(planets.Jupiter, 0.0)
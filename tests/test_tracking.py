@@ -0,0 +1,74 @@
+"""Tests for the change tracking of `Planet` fields."""
+
+import numpy as np
+import pytest
+
+from planets import _planets
+from planets._planets import AU, Planet
+
+
+def test_versions_and_changed_since():
+    body = Planet()
+    version = body.version
+    body.albedo = 0.2
+    assert body.version == version + 1
+    assert body.changed_since(version, "albedo")
+    assert not body.changed_since(version, "S", "emissivity")
+    assert not body.changed_since(body.version)
+
+
+def test_rau_follows_rsm():
+    body = Planet()
+    body.rsm = 2 * AU
+    assert body.rAU == 2.0
+    assert body.changed_since(0, "rAU")
+
+
+def test_derived_recomputes_only_on_input_change():
+    body = Planet()
+    body.S, body.albedo, body.emissivity = 1361.0, 0.3, 0.95
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return body.albedo * 2
+
+    assert body.derived("x", ["albedo"], compute) == 0.6
+    body.Tsavg = 250.0
+    assert body.derived("x", ["albedo"], compute) == 0.6 and len(calls) == 1
+    body.albedo = 0.1
+    assert body.derived("x", ["albedo"], compute) == 0.2 and len(calls) == 2
+
+
+def test_teq_follows_fields():
+    body = Planet()
+    body.S, body.albedo, body.emissivity = 1361.0, 0.3, 0.95
+    teq = body.Teq()
+    body.S = 2 * 1361.0
+    assert body.Teq() == pytest.approx(teq * 2**0.25)
+    assert "_derived" not in vars(body) or not vars(body)["_derived"]
+
+
+def test_teq_of_0d_array():
+    body = Planet()
+    body.S, body.albedo, body.emissivity = 1361.0, 0.3, 0.95
+    assert body.Teq(np.array(30.0)) == pytest.approx(body.Teq(30.0))
+
+
+def test_radius_follows_name(kernel):
+    body = Planet()
+    body.name = "Earth"
+    assert body.R == pytest.approx(6371000.0, rel=1e-3)
+    body.name = "Mars"
+    assert body.R == pytest.approx(3389500.0, rel=1e-3)
+    explicit = Planet(R=5.0)
+    explicit.name = "Mars"
+    assert explicit.R == 5.0
+
+
+def test_tracking_state_is_not_body_data():
+    from planets.cli import get_body_attributes
+
+    attributes = get_body_attributes("Bennu")
+    assert not set(_planets.TRACKING_FIELDS) & set(attributes)
+    assert "version" not in attributes
@@ -0,0 +1,88 @@
+"""Tests for `planets.units` and `planets.table`."""
+
+import weakref
+
+import astropy.units as u
+import numpy as np
+import pytest
+
+import planets
+from planets import cli, units
+from planets._planets import Planet
+from planets.table import BodyTable, body_table
+
+
+def test_obliquity_units_follow_the_body():
+    assert units.unit_of("Earth", "obliquity") == "deg"
+    assert units.unit_of("Jupiter", "obliquity") == "rad"
+    assert units.unit_of("Earth", "name") is None
+    assert units.si_value(planets.Earth, "obliquity") == pytest.approx(np.deg2rad(23.45))
+    assert units.si_value(planets.Moon, "obliquity") == planets.Moon.obliquity
+    assert units.si_value(planets.Mars, "rAU") == pytest.approx(planets.Mars.rsm, rel=1e-3)
+
+
+def test_schema_units_parse():
+    for field_unit in units.FIELD_UNITS.values():
+        u.Unit(field_unit.unit)
+
+
+def test_quantity_view_is_cached_until_the_field_changes():
+    body = Planet(R=1000.0)
+    body.name = "Test"
+    body.obliquity = 10.0
+    view = body.quantities
+    assert view is body.quantities
+    first = view.obliquity
+    assert first.to_value(u.rad) == pytest.approx(np.deg2rad(10.0))
+    assert view.obliquity is first
+    body.obliquity = 20.0
+    assert view.obliquity.value == 20.0
+    assert view.R == 1000.0 * u.m
+    assert view.g is None
+    assert view.albedoCoef == [0.0, 0.0]
+
+
+def test_quantity_view_follows_a_rename():
+    body = Planet(R=1000.0)
+    body.name = "Earth"
+    body.obliquity = 0.5
+    assert body.quantities.obliquity.unit == u.deg
+    body.name = "Jupiter"
+    assert body.quantities.obliquity.unit == u.rad
+
+
+def test_cli_body_attributes_do_not_build_quantities(monkeypatch):
+    monkeypatch.setattr(units, "_views", weakref.WeakKeyDictionary())
+    attributes = cli.get_body_attributes("Bennu")
+    assert "quantities" not in attributes and attributes["R"] == planets.Bennu.R
+    assert planets.Bennu not in units._views
+
+
+def test_plain_access_is_unchanged():
+    assert planets.Earth.obliquity == 23.45
+    assert planets.Earth.quantities.day == planets.Earth.day * u.s
+
+
+def test_table_column_quantity_converts_mixed_units():
+    table = BodyTable([planets.Earth, planets.Jupiter, planets.Moon], with_radius=False)
+    assert len(table) == 3
+    assert table.units("obliquity") == ["deg", "rad", "rad"]
+    obliquity = table.quantity("obliquity", "rad")
+    expected = [np.deg2rad(23.45), planets.Jupiter.obliquity, planets.Moon.obliquity]
+    assert obliquity.unit == u.rad
+    assert obliquity.value == pytest.approx(expected)
+    assert table.quantity("obliquity")[1].to_value(u.rad) == pytest.approx(expected[1])
+    assert np.isnan(table["Qb"][1])
+
+
+def test_body_table_of_all_bodies():
+    table = body_table(fields=["rsm", "year"])
+    assert table.names == planets.get_all_bodies()
+    assert table.quantity("year").unit == u.s
+
+
+def test_cli_labels_come_from_the_schema():
+    assert cli.format_attribute_value("obliquity", 23.45, "Earth") == "23.45 degrees"
+    assert cli.format_attribute_value("obliquity", 0.05, "Jupiter") == "0.05 radians"
+    assert cli.format_attribute_value("Gamma", 55.0) == "55.0 J·m⁻²·K⁻¹·s⁻¹/²"
+    assert cli.format_attribute_value("name", "Earth") == "Earth"
@@ -0,0 +1,92 @@
+"""Tests for `planets.validation` and the ``planets validate`` command."""
+
+import json
+
+import numpy as np
+import pytest
+
+import planets
+from planets import cli, pck_parser, validation
+from planets.constants import AU
+
+
+def _body(name, **fields):
+    body = planets.Planet(R=fields.pop("R", None))
+    body.name = name
+    for field, value in fields.items():
+        setattr(body, field, value)
+    return body
+
+
+def _findings(report, check):
+    return {f["body"]: f for f in report["findings"] if f["check"] == check}
+
+
+def test_catalogue(kernel):
+    report = validation.validate()
+    assert list(report["summary"]) == list(validation.CHECKS)
+    assert not report["valid"]
+    # Bennu's year is Earth's, not the one of its orbit
+    failed = [(f["body"], f["check"]) for f in report["findings"] if f["status"] == "failed"]
+    assert failed == [("Bennu", "year")]
+    n_bodies = len(planets.get_all_bodies())
+    assert report["summary"]["rAU"] == {"ok": n_bodies, "failed": 0, "missing": 0}
+    # The small kernel has radii of Earth, Moon, Mars and Titan and no GM
+    assert report["summary"]["R"]["ok"] == 4
+    assert report["summary"]["g"]["missing"] == n_bodies
+    assert _findings(report, "R")["Bennu"]["value"] == 262.5
+    json.dumps(report)
+
+
+def test_relations():
+    a = 2.0 * AU
+    year = 2 * np.pi * np.sqrt(a**3 / validation.GM_SUN)
+    good = _body("A", rsm=a, S=1361.0 / 4, year=year, obliquity=10.0)
+    bad = _body("B", rsm=a, S=1361.0, year=year, obliquity=200.0)
+    bad.rAU = 2.1
+    report = validation.validate([good, bad], kernel=False)
+    assert set(report["summary"]) == {"rAU", "S", "year", "obliquity"}
+    failed = {(f["body"], f["check"]) for f in report["findings"]}
+    assert failed == {("B", "rAU"), ("B", "S"), ("B", "obliquity")}
+    assert _findings(report, "S")["B"]["expected"] == pytest.approx(1361.0 / 2.1**2)
+    assert _findings(report, "obliquity")["B"]["expected"] == pytest.approx(np.pi)
+
+
+def test_kernel_radius_and_gravity(small_kernel):
+    constants = pck_parser.parse_pck_file(small_kernel)
+    constants["BODY399_GM"] = {"value": 398600.435}
+    earth = _body("Earth", g=9.798)
+    mars = _body("Mars", R=3.0e6, g=3.71)
+    report = validation.validate([earth, mars], constants=constants)
+    assert report["summary"]["R"] == {"ok": 1, "failed": 1, "missing": 0}
+    assert _findings(report, "R")["Mars"]["expected"] == pytest.approx(
+        (2 * 3396.19 + 3376.20) / 3 * 1000
+    )
+    assert report["summary"]["g"] == {"ok": 1, "failed": 0, "missing": 1}
+
+
+def test_tolerances(small_kernel):
+    constants = pck_parser.parse_pck_file(small_kernel)
+    mars = _body("Mars", R=3.35e6)
+    assert not validation.validate([mars], constants=constants)["valid"]
+    assert validation.validate([mars], constants=constants, tolerances={"R": 0.02})["valid"]
+
+
+def test_kernel_error(monkeypatch):
+    def unavailable():
+        raise OSError("no network")
+
+    monkeypatch.setattr(pck_parser, "load_kernel_index", unavailable)
+    report = validation.validate([_body("Earth", rsm=AU, rAU=1.0)])
+    assert report["kernel"] == {"checked": False, "error": "OSError: no network"}
+    assert "R" not in report["summary"] and report["valid"]
+    assert "kernel checks skipped" in validation.format_report(report)
+
+
+def test_cli(kernel, capsys):
+    assert cli.main(["validate"]) == 1
+    text = capsys.readouterr().out
+    assert "Bennu      year       failed" in text and text.endswith("invalid\n")
+    assert cli.main(["validate", "--json", "--no-kernel"]) == 1
+    report = json.loads(capsys.readouterr().out)
+    assert report["kernel"]["checked"] is False